@@ -12,79 +12,400 @@ ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR
 
 import sys
 import os
-import pandas as pd
-import numpy as np
-from dotenv import load_dotenv
-
-load_dotenv()  # take environment variables from .env.
+import json
+import logging
+import argparse
+import queue
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
+# pandas, NumPy, pyarrow and cryptography are imported by the functions that use them, so importing this module,
+# an auth-only run or the --raw mode do not pay their import time. The .env file is loaded by the entry point below.
 from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_token_manager
 
 def convert_pandas(json_data):
     if not json_data:
         raise TypeError('Received invalid (None or Empty) JSON data')
 
+    from rdp_controller import rdp_dataframe
     try:
-        headers=json_data['headers'] 
-        #Get column headers/titles using lambda
-        titles=map(lambda header:header['title'], headers)
-            
-        dataArray=np.array(json_data['data'])
-        df = pd.DataFrame(data=dataArray,columns=titles)
+        # Build typed columns (float64, datetime64, categorical) directly from the row lists using the headers metadata
+        df = rdp_dataframe.build_dataframe(json_data['headers'], json_data['data'])
 
         return df
     except Exception as exp:
         print(f'Error converting JSON to Dataframe exception: {str(exp)}') 
         raise TypeError('Error converting JSON to Dataframe')
 
+# Latest period of every instrument with the YoY changes and universe-wide percentile ranks of the ESG scores
+# and the numeric change of the score grades
+def esg_analytics(esg_df):
+    from rdp_controller import rdp_esg_analytics
+    value_columns = [title for title in ('ESG Score', 'ESG Combined Score', 'ESG Controversies Score') if title in esg_df.columns]
+    grade_columns = [title for title in esg_df.columns if title.endswith('Grade')]
+    return rdp_esg_analytics.latest_summary(esg_df, value_columns, grade_columns)
+
+# Convert a batch of ESG responses (same headers) into one DataFrame, runs in the conversion worker processes
+def convert_esg_batch(esg_batch):
+    rows = [row for esg_data in esg_batch for row in esg_data['data']]
+    return convert_pandas({'headers': esg_batch[0]['headers'], 'data': rows})
+
+# Read one RIC per line (comma separated RICs are split too) from a file, '-' reads stdin
+def read_universe_list(source):
+    input_file = sys.stdin if source == '-' else open(source, 'r')
+    try:
+        rics = [ric.strip() for line in input_file for ric in line.split(',')]
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+    return list(dict.fromkeys(ric for ric in rics if ric))
+
+# Put an item into a bounded queue, blocks while the queue is full. Gives up and returns False once the stop event
+# is set, so producers do not block forever after the consumer has failed.
+def _put(item_queue, item, stop, timeout = 0.1):
+    while not stop.is_set():
+        try:
+            item_queue.put(item, timeout = timeout)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+# Fetch ESG data for every RIC, queue the responses for conversion (blocks while the queue is full)
+def _fetch_esg(token_manager, esg_url, ric_queue, esg_queue, failed, stop):
+    while not stop.is_set():
+        try:
+            ric = ric_queue.get_nowait()
+        except queue.Empty:
+            return
+        try:
+            esg_data = token_manager.request_esg(esg_url, ric)
+        except Exception as exp:
+            print(f'ESG data request failure for {ric}: {str(exp)}')
+            failed.append(ric)
+            continue
+        if 'error' in esg_data or not esg_data.get('data') or not esg_data.get('headers'):
+            print(f'No ESG data for {ric}')
+            failed.append(ric)
+            continue
+        if not _put(esg_queue, (ric, esg_data), stop):
+            return
+
+# Put the end of data sentinel once every ESG fetch thread is done
+def _close_queue(fetchers, esg_queue, stop):
+    for fetcher in fetchers:
+        fetcher.join()
+    _put(esg_queue, None, stop)
+
+# Fetch-only mode: write every ESG response to output_file as one JSON line {"RIC": ..., "esg": ...} as it arrives,
+# without converting it (pandas is never imported). Returns the number of written responses and the RICs without data.
+def run_raw(token_manager, esg_url, universe_list, output_file, fetch_workers = 8, queue_size = 64):
+    if not token_manager or not esg_url or not universe_list:
+        raise TypeError('Received invalid (None or Empty) arguments')
+
+    rics = list(dict.fromkeys(ric for ric in universe_list if ric))
+    ric_queue = queue.Queue()
+    for ric in rics:
+        ric_queue.put(ric)
+    esg_queue = queue.Queue(maxsize = queue_size)
+    failed = []
+    stop = threading.Event()
+    fetchers = [threading.Thread(target = _fetch_esg, args = (token_manager, esg_url, ric_queue, esg_queue, failed, stop), daemon = True)
+                for _ in range(min(fetch_workers, len(rics)))]
+    for fetcher in fetchers:
+        fetcher.start()
+    threading.Thread(target = _close_queue, args = (fetchers, esg_queue, stop), daemon = True).start()
+
+    written = 0
+    try:
+        while True:
+            item = esg_queue.get()
+            if item is None:
+                break
+            ric, esg_data = item
+            output_file.write(json.dumps({'RIC': ric, 'esg': esg_data}) + '\n')
+            written += 1
+    except BaseException:
+        stop.set()  # Release the fetch threads blocked on the full queue
+        raise
+    failed = set(failed)
+    return written, [ric for ric in rics if ric in failed]
+
+# Fetch the Search Explore metadata with one query per search_batch_size RICs
+def _fetch_metadata(token_manager, search_url, rics, select, search_batch_size, metadata_hits, stop):
+    for index in range(0, len(rics), search_batch_size):
+        if stop.is_set():
+            return
+        batch = rics[index:index + search_batch_size]
+        search_payload = {
+            'View': 'Entities',
+            'Filter': ' or '.join(f'RIC eq \'{ric}\'' for ric in batch),
+            'Select': select,
+            'Top': len(batch)
+        }
+        try:
+            metadata_hits.extend(token_manager.request_search_explore(search_url, search_payload).get('Hits', []))
+        except Exception as exp:
+            print(f'Search Explore request failure for {len(batch)} RICs: {str(exp)}')
+
+# Batch pipeline: fetch ESG data and Search Explore metadata for many RICs and merge them into one DataFrame.
+# The stages overlap: fetch_workers threads fetch ESG data into a bounded queue (queue_size responses),
+# convert_batch_size responses at a time are converted on convert_workers processes (0 converts in this process),
+# and the Search Explore metadata (search_batch_size RICs per query) is fetched at the same time.
+# Returns the ESG rows joined with the metadata columns (in the universe_list order) and the RICs without data.
+# With a store (rdp_columnar_store.ColumnarStore) every converted batch and the metadata are appended to the store
+# as they arrive instead of being kept in memory, the returned DataFrame is then None.
+def run_pipeline(token_manager, esg_url, search_url, universe_list, fetch_workers = 8, convert_workers = None, queue_size = 64,
+                 convert_batch_size = 32, search_batch_size = 50, select = 'RIC,IssuerCommonName,RCSExchangeCountryLeaf,IssueISIN,ExchangeName,RCSTRBC2012Leaf',
+                 store = None):
+    if not token_manager or not esg_url or not search_url or not universe_list:
+        raise TypeError('Received invalid (None or Empty) arguments')
+
+    rics = list(dict.fromkeys(ric for ric in universe_list if ric))
+    if not rics:
+        raise TypeError('Received invalid (None or Empty) arguments')
+    ric_queue = queue.Queue()
+    for ric in rics:
+        ric_queue.put(ric)
+    esg_queue = queue.Queue(maxsize = queue_size)
+    failed = []
+    # Set when the conversion stage fails, so the fetch threads stop instead of blocking on the full queue
+    stop = threading.Event()
+
+    # Stage 1: ESG fetch threads, a sentinel marks the end once they are all done
+    fetchers = [threading.Thread(target = _fetch_esg, args = (token_manager, esg_url, ric_queue, esg_queue, failed, stop), daemon = True)
+                for _ in range(min(fetch_workers, len(rics)))]
+    for fetcher in fetchers:
+        fetcher.start()
+    threading.Thread(target = _close_queue, args = (fetchers, esg_queue, stop), daemon = True).start()
+
+    # Stage 2: Search Explore metadata, fetched in the background while the ESG data flows
+    metadata_hits = []
+    metadata_thread = threading.Thread(target = _fetch_metadata, args = (token_manager, search_url, rics, select, search_batch_size, metadata_hits, stop), daemon = True)
+    metadata_thread.start()
+
+    # Stage 3: conversion, at most two batches per worker are in flight so the fetched responses stay bounded
+    if convert_workers is None:
+        convert_workers = os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers = convert_workers, mp_context = multiprocessing.get_context('spawn')) if convert_workers else None
+    in_flight = threading.BoundedSemaphore(max(convert_workers, 1) * 2)
+    conversions = []
+    frames = []
+
+    # Keep or store one converted batch, a failed conversion marks its RICs as failed
+    def collect(batch_rics, conversion):
+        try:
+            df = conversion() if executor is None else conversion.result()
+        except Exception as exp:
+            print(f'Error converting ESG data of {len(batch_rics)} RICs: {str(exp)}')
+            failed.extend(batch_rics)
+            return
+        if store is not None:
+            store.append_esg(df)
+        else:
+            frames.append(df)
+
+    def submit(batch):
+        batch_rics = [ric for ric, esg_data in batch]
+        esg_batch = [esg_data for ric, esg_data in batch]
+        if executor is None:
+            collect(batch_rics, lambda: convert_esg_batch(esg_batch))
+            return
+        in_flight.acquire()
+        future = executor.submit(convert_esg_batch, esg_batch)
+        future.add_done_callback(lambda future: in_flight.release())
+        conversions.append((batch_rics, future))
+        # Collect the finished batches in submission order, so they are written while the next ones are fetched
+        while conversions and conversions[0][1].done():
+            collect(*conversions.pop(0))
+
+    try:
+        batch = []
+        while True:
+            item = esg_queue.get()
+            if item is None:
+                break
+            batch.append(item)
+            if len(batch) >= convert_batch_size:
+                submit(batch)
+                batch = []
+        if batch:
+            submit(batch)
+        while conversions:
+            collect(*conversions.pop(0))
+    except BaseException:
+        stop.set()
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    metadata_thread.join()
+
+    failed = set(failed)
+    failed_rics = [ric for ric in rics if ric in failed]
+    if store is not None:
+        store.append_search(metadata_hits)
+        return None, failed_rics
+    return _merge_results(frames, metadata_hits, rics), failed_rics
+
+# Concatenate the converted batches in the universe order and join the metadata hits on 'Instrument' = 'RIC'
+def _merge_results(frames, metadata_hits, rics):
+    import pandas as pd
+    if not frames:
+        return pd.DataFrame()
+    category_columns = [column for column in frames[0].columns if isinstance(frames[0][column].dtype, pd.CategoricalDtype)]
+    esg_df = pd.concat(frames, ignore_index = True)
+    # Different categories per batch turn the categorical columns into object columns, restore them
+    for column in category_columns:
+        esg_df[column] = esg_df[column].astype('category')
+    order = {ric: index for index, ric in enumerate(rics)}
+    positions = esg_df['Instrument'].astype(object).map(order).to_numpy()
+    esg_df = esg_df.iloc[positions.argsort(kind = 'stable')].reset_index(drop = True)
+
+    metadata_hits = [hit for hit in metadata_hits if 'RIC' in hit]
+    if not metadata_hits:
+        return esg_df
+    metadata_df = pd.DataFrame(metadata_hits).drop_duplicates('RIC').rename(columns = {'RIC': 'Instrument'})
+    metadata_df['Instrument'] = metadata_df['Instrument'].astype(esg_df['Instrument'].dtype)
+    return esg_df.merge(metadata_df, on = 'Instrument', how = 'left')
+
 
 if __name__ == '__main__':
+    from dotenv import load_dotenv
+    load_dotenv()  # take environment variables from .env.
+
+    # Show the controller progress messages on the console
+    logging.basicConfig(level = logging.INFO, format = '%(message)s')
+
+    parser = argparse.ArgumentParser(description = 'RDP ESG and Search Explore console application')
+    parser.add_argument('--universe-file', help = 'run the batch pipeline for the RICs in this file (one per line, - reads stdin)')
+    parser.add_argument('--output', help = 'write the merged batch pipeline result to this CSV file')
+    parser.add_argument('--fetch-workers', type = int, default = 8)
+    parser.add_argument('--convert-workers', type = int, default = None, help = 'conversion processes (default: CPU count, 0: no processes)')
+    parser.add_argument('--sync-state', help = 'incremental ESG sync: keep the fetched ESG rows in this state file and request only the latest periods')
+    parser.add_argument('--output-dir', help = 'append the ESG and Search Explore results to columnar datasets in this directory (requires pyarrow)')
+    parser.add_argument('--output-format', choices = ['parquet', 'feather'], default = 'parquet', help = 'columnar file format, feather files can be memory-mapped')
+    parser.add_argument('--token-store', help = 'reuse the RDP tokens of previous runs from this encrypted file (key in RDP_TOKEN_STORE_KEY, requires cryptography)')
+    parser.add_argument('--analytics', action = 'store_true', help = 'print the latest period, YoY changes and universe percentile ranks of every instrument')
+    parser.add_argument('--raw', action = 'store_true', help = 'fetch only: write the JSON responses (JSON lines with --universe-file) without pandas')
+    args = parser.parse_args()
+    if args.raw and (args.output_dir or args.analytics):
+        parser.error('--raw cannot be combined with --output-dir or --analytics')
+
     username = os.getenv('RDP_USERNAME')
     password = os.getenv('RDP_PASSWORD')
     client_id = os.getenv('RDP_CLIENTID')
 
-    rdp_controller = rdp_http_controller.RDPHTTPController()
+    # Keep a pooled connection for every fetch thread and the Search Explore thread
+    rdp_controller = rdp_http_controller.RDPHTTPController(pool_maxsize = max(args.fetch_workers + 1, 10))
 
     base_URL = os.getenv('RDP_BASE_URL')
     auth_endpoint = base_URL + os.getenv('RDP_AUTH_URL')
     esg_endpoint = base_URL + os.getenv('RDP_ESG_URL')
     search_endpoint = base_URL + os.getenv('RDP_SEARCH_EXPLORE_URL')
 
-    access_token = None
-    refresh_token = None
-    expires_in = 0
     universe = 'LSEG.L'
+    token_manager = None
 
     try:
-        access_token, refresh_token, expires_in = rdp_controller.rdp_authentication(auth_endpoint, username, password, client_id)
-        if not access_token:
+        # The token manager keeps the Access Token fresh in the background using the Refresh Grant
+        # The token store lets the next runs skip the Password Grant login while the stored tokens are valid
+        token_store = None
+        if args.token_store:
+            from rdp_controller import rdp_token_store
+            token_store = rdp_token_store.TokenStore(args.token_store, os.getenv('RDP_TOKEN_STORE_KEY'))
+        token_manager = rdp_token_manager.RDPTokenManager(rdp_controller, auth_endpoint, username, password, client_id, token_store = token_store).start()
+        if not token_manager.access_token:
             print('Cannot login to RDP, exiting application')
             sys.exit(1)
         
-        esg_data = None
-        esg_data = rdp_controller.rdp_request_esg(esg_endpoint, access_token, universe)
-        if not esg_data:
-            print(f'No ESG data for {universe}, exiting application')
+        # Columnar output: results are appended to Parquet/Feather datasets as they arrive, one file per batch
+        store = None
+        if args.output_dir:
+            from rdp_controller import rdp_columnar_store
+            store = rdp_columnar_store.ColumnarStore(args.output_dir, args.output_format)
+
+        if args.raw:
+            # Fetch-only mode: the JSON responses are written as received, pandas is never imported
+            output_file = open(args.output, 'w') if args.output else sys.stdout
+            try:
+                if args.sync_state:
+                    universe_list = read_universe_list(args.universe_file) if args.universe_file else [universe]
+                    esg_sync = token_manager.esg_sync(esg_endpoint, args.sync_state)
+                    esg_sync.sync(universe_list)
+                    output_file.write(json.dumps(esg_sync.to_json(universe_list)) + '\n')
+                elif args.universe_file:
+                    written, failed = run_raw(token_manager, esg_endpoint, read_universe_list(args.universe_file), output_file, fetch_workers = args.fetch_workers)
+                    print(f'Raw result: {written} ESG responses written, no ESG data for {len(failed)} RICs', file = sys.stderr)
+                else:
+                    output_file.write(json.dumps(token_manager.request_esg(esg_endpoint, universe)) + '\n')
+            finally:
+                if output_file is not sys.stdout:
+                    output_file.close()
+        elif args.sync_state:
+            # Incremental sync mode: only the latest periods of the already fetched RICs are requested
+            universe_list = read_universe_list(args.universe_file) if args.universe_file else [universe]
+            esg_sync = token_manager.esg_sync(esg_endpoint, args.sync_state)
+            stats = esg_sync.sync(universe_list)
+            print(f'ESG sync: {stats["received"]} rows received, {stats["inserted"]} inserted, {stats["updated"]} updated, '
+                  f'{stats["full"]} full and {stats["delta"]} delta requests, no ESG data for {len(stats["failed"])} RICs')
+            esg_df = convert_pandas(esg_sync.to_json(universe_list))
+            if args.output:
+                esg_df.to_csv(args.output, index = False)
+            else:
+                print(esg_df.head())
+            if args.analytics:
+                print(esg_analytics(esg_df))
+        elif args.universe_file:
+            # Batch pipeline mode: ESG fetch, Search Explore fetch and conversion overlap for all RICs
+            universe_list = read_universe_list(args.universe_file)
+            result_df, failed = run_pipeline(token_manager, esg_endpoint, search_endpoint, universe_list, fetch_workers = args.fetch_workers,
+                                             convert_workers = args.convert_workers, store = store)
+            if store is not None:
+                print(f'Pipeline result: {len(universe_list) - len(failed)} RICs written to {args.output_dir}, no ESG data for {len(failed)} RICs')
+            else:
+                print(f'Pipeline result: {len(result_df)} rows for {len(universe_list) - len(failed)} RICs, no ESG data for {len(failed)} RICs')
+                if args.output:
+                    result_df.to_csv(args.output, index = False)
+                else:
+                    print(result_df.head())
+        else:
+            esg_data = None
+            esg_data = token_manager.request_esg(esg_endpoint, universe)
+            if not esg_data:
+                print(f'No ESG data for {universe}, exiting application')
         
-        esg_df = convert_pandas(esg_data)
-        esg_df = pd.DataFrame(esg_df,columns=['Instrument','Period End Date','ESG Score','ESG Combined Score','ESG Controversies Score'])
-        print(esg_df.head())
+            esg_df = convert_pandas(esg_data)
+            if store is not None:
+                store.append_esg(esg_df)
+            if args.analytics:
+                print(esg_analytics(esg_df))
+            esg_df = esg_df.reindex(columns = ['Instrument','Period End Date','ESG Score','ESG Combined Score','ESG Controversies Score'])
+            print(esg_df.head())
 
-        company_data = None
-        search_payload = {
-            'View': 'Entities',
-            'Filter': f'RIC eq \'{universe}\'',
-            'Select': 'IssuerCommonName,DocumentTitle,RCSExchangeCountryLeaf,IssueISIN,ExchangeName,ExchangeCode,SearchAllCategoryv3,RCSTRBC2012Leaf'
-        }
-        company_data = rdp_controller.rdp_request_search_explore(search_endpoint, access_token, search_payload)
-        if not company_data:
-            print(f'No Meta data for {universe}, exiting application')
-        print(f'RIC: {universe} Metadata:')
-        print('\tIssuerCommonName: {}'.format(company_data['Hits'][0]['IssuerCommonName']))
-        print('\tRCSExchangeCountryLeaf: {}'.format(company_data['Hits'][0]['RCSExchangeCountryLeaf']))
-        print('\tISIN: {}'.format(company_data['Hits'][0]['IssueISIN']))
-        print('\tExchange Name: {}'.format(company_data['Hits'][0]['ExchangeName']))
-        print('\tRCSTRBC2012Leaf: {}'.format(company_data['Hits'][0]['RCSTRBC2012Leaf']))
+            company_data = None
+            search_payload = {
+                'View': 'Entities',
+                'Filter': f'RIC eq \'{universe}\'',
+                'Select': 'IssuerCommonName,DocumentTitle,RCSExchangeCountryLeaf,IssueISIN,ExchangeName,ExchangeCode,SearchAllCategoryv3,RCSTRBC2012Leaf'
+            }
+            company_data = token_manager.request_search_explore(search_endpoint, search_payload)
+            if not company_data:
+                print(f'No Meta data for {universe}, exiting application')
+            if store is not None:
+                store.append_search(company_data['Hits'])
+            print(f'RIC: {universe} Metadata:')
+            print('\tIssuerCommonName: {}'.format(company_data['Hits'][0]['IssuerCommonName']))
+            print('\tRCSExchangeCountryLeaf: {}'.format(company_data['Hits'][0]['RCSExchangeCountryLeaf']))
+            print('\tISIN: {}'.format(company_data['Hits'][0]['IssueISIN']))
+            print('\tExchange Name: {}'.format(company_data['Hits'][0]['ExchangeName']))
+            print('\tRCSTRBC2012Leaf: {}'.format(company_data['Hits'][0]['RCSTRBC2012Leaf']))
     except Exception as exp:
         print(f'Caught exception: {str(exp)}')
+    finally:
+        if token_manager is not None:
+            token_manager.stop()
+        rdp_controller.close()
 
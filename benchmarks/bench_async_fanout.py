@@ -0,0 +1,62 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+# Compare concurrent ESG fan-out with thread-per-request (RDPHTTPController) against asyncio (RDPAsyncHTTPController).
+# The stand-in server adds a fixed latency per response to model the network round trip.
+# Usage (from the project root): python benchmarks/bench_async_fanout.py [number_of_rics] [concurrency] [latency_seconds]
+
+import sys
+import os
+import time
+import asyncio
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_async_http_controller
+from tests.mock_rdp_server import MockRDPServerProcess
+
+ACCESS_TOKEN = 'access_token_mock1mock2mock3mock4mock5'
+
+def bench_threads(esg_url, rics, concurrency):
+    with rdp_http_controller.RDPHTTPController(pool_maxsize = concurrency) as controller:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers = concurrency) as executor:
+            list(executor.map(lambda ric: controller.rdp_request_esg(esg_url, ACCESS_TOKEN, ric), rics))
+        return len(rics) / (time.perf_counter() - start)
+
+async def bench_asyncio(esg_url, rics, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    async with rdp_async_http_controller.RDPAsyncHTTPController(limit = concurrency) as controller:
+        async def request(ric):
+            async with semaphore:
+                return await controller.rdp_request_esg(esg_url, ACCESS_TOKEN, ric)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(request(ric) for ric in rics))
+        return len(rics) / (time.perf_counter() - start)
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    latency = float(sys.argv[3]) if len(sys.argv) > 3 else 0.1
+    rics = [f'RIC{index}.L' for index in range(count)]
+
+    with MockRDPServerProcess(latency = latency) as server, open(os.devnull, 'w') as devnull:
+        with contextlib.redirect_stdout(devnull):
+            threads_rps = bench_threads(server.esg_url, rics, concurrency)
+            asyncio_rps = asyncio.run(bench_asyncio(server.esg_url, rics, concurrency))
+
+    print(f'ESG requests: {count}, concurrency: {concurrency}, server latency: {latency}s')
+    print(f'Thread-per-request: {threads_rps:10.1f} req/s')
+    print(f'asyncio:            {asyncio_rps:10.1f} req/s')
@@ -0,0 +1,58 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+# Compare time and peak memory of the previous np.array() based convert_pandas with the columnar builder.
+# Usage (from the project root): python benchmarks/bench_convert_pandas.py [row_count ...]
+
+import sys
+import os
+import json
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import convert_pandas
+
+FIXTURE_FILE = os.path.join(os.path.dirname(__file__), '..', 'tests', 'fixtures', 'rdp_test_esg_fixture.json')
+
+# The convert_pandas implementation before the columnar builder
+def convert_pandas_numpy(json_data):
+    titles = map(lambda header: header['title'], json_data['headers'])
+    return pd.DataFrame(data = np.array(json_data['data']), columns = titles)
+
+# Repeat the fixture rows with distinct instruments up to row_count rows
+def make_esg_data(row_count):
+    with open(FIXTURE_FILE, 'r') as esg_fixture_input:
+        esg_data = json.loads(esg_fixture_input.read())
+    fixture_rows = esg_data['data']
+    esg_data['data'] = [[f'RIC{index // len(fixture_rows)}.L'] + fixture_rows[index % len(fixture_rows)][1:] for index in range(row_count)]
+    return esg_data
+
+def measure(convert_function, esg_data):
+    tracemalloc.start()
+    start = time.perf_counter()
+    df = convert_function(esg_data)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, df.memory_usage(deep = True).sum()
+
+if __name__ == '__main__':
+    row_counts = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    print(f'{"rows":>10} {"implementation":>15} {"seconds":>10} {"peak MB":>10} {"frame MB":>10}')
+    for row_count in row_counts:
+        esg_data = make_esg_data(row_count)
+        for name, convert_function in (('np.array', convert_pandas_numpy), ('columnar', convert_pandas)):
+            elapsed, peak, frame_size = measure(convert_function, esg_data)
+            print(f'{row_count:>10} {name:>15} {elapsed:>10.3f} {peak / 2**20:>10.1f} {frame_size / 2**20:>10.1f}')
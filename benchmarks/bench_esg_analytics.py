@@ -0,0 +1,99 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+# Compare the vectorized rdp_esg_analytics functions with the per-instrument Python loop they replace on a synthetic
+# ESG frame (default 40,000 instruments x 20 annual periods, rows in the API order: latest period first).
+# The loop is timed on a subset of the instruments and scaled to the whole universe.
+# Usage (from the project root): python benchmarks/bench_esg_analytics.py [instruments] [periods] [loop_instruments]
+
+import sys
+import os
+import time
+import numpy as np
+import pandas as pd
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from rdp_controller import rdp_esg_analytics
+
+VALUE_COLUMNS = ['ESG Score', 'ESG Combined Score', 'ESG Controversies Score']
+GRADE_COLUMN = 'ESG Score Grade'
+
+# Synthetic convert_pandas output: categorical instruments and grades, datetime64 periods, float64 scores
+def make_esg_frame(instrument_count, period_count, seed = 0):
+    generator = np.random.default_rng(seed)
+    row_count = instrument_count * period_count
+    instruments = pd.Categorical.from_codes(np.repeat(np.arange(instrument_count), period_count),
+                                            categories = [f'RIC{index}.L' for index in range(instrument_count)])
+    period_ends = pd.date_range(end = '2024-12-31', periods = period_count, freq = 'YE').to_numpy()[::-1]
+    columns = {'Instrument': instruments, 'Period End Date': np.tile(period_ends, instrument_count)}
+    for title in VALUE_COLUMNS:
+        columns[title] = np.round(generator.uniform(0, 100, row_count), 2)
+    columns[GRADE_COLUMN] = pd.Categorical.from_codes(generator.integers(0, len(rdp_esg_analytics.GRADES), row_count),
+                                                      categories = list(rdp_esg_analytics.GRADES))
+    return pd.DataFrame(columns)
+
+# The per-instrument loop: latest period, YoY changes and grade change of every instrument, then the universe ranks
+def latest_summary_loop(df):
+    records = []
+    for instrument, rows in df.groupby('Instrument', observed = True, sort = False):
+        rows = rows.sort_values('Period End Date')
+        latest = rows.iloc[-1]
+        record = {'Instrument': instrument, 'Period End Date': latest['Period End Date']}
+        for title in VALUE_COLUMNS:
+            record[title] = latest[title]
+            record[f'{title} Change'] = latest[title] - rows.iloc[-2][title] if len(rows) > 1 else np.nan
+        grade = rdp_esg_analytics.GRADE_SCALE.get(latest[GRADE_COLUMN], np.nan)
+        previous_grade = rdp_esg_analytics.GRADE_SCALE.get(rows.iloc[-2][GRADE_COLUMN], np.nan) if len(rows) > 1 else np.nan
+        record[f'{GRADE_COLUMN} Change'] = grade - previous_grade
+        records.append(record)
+    summary = pd.DataFrame(records)
+    for title in VALUE_COLUMNS:
+        summary[f'{title} Rank'] = summary[title].rank(pct = True)
+    return summary
+
+def measure(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+if __name__ == '__main__':
+    instrument_count = int(sys.argv[1]) if len(sys.argv) > 1 else 40_000
+    period_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    loop_instruments = min(int(sys.argv[3]) if len(sys.argv) > 3 else 2_000, instrument_count)
+
+    df = make_esg_frame(instrument_count, period_count)
+    print(f'{instrument_count} instruments x {period_count} periods = {len(df)} rows')
+    print(f'{"operation":>25} {"seconds":>10}')
+    vectorized = (
+        ('latest_periods', rdp_esg_analytics.latest_periods, (df,)),
+        ('period_changes', rdp_esg_analytics.period_changes, (df, VALUE_COLUMNS)),
+        ('grade_transitions', rdp_esg_analytics.grade_transitions, (df, GRADE_COLUMN)),
+        ('grade_transition_matrix', rdp_esg_analytics.grade_transition_matrix, (df, GRADE_COLUMN)),
+        ('cross_sectional_ranks', rdp_esg_analytics.cross_sectional_ranks, (df, VALUE_COLUMNS, 'Period End Date')),
+        ('latest_summary', rdp_esg_analytics.latest_summary, (df, VALUE_COLUMNS, [GRADE_COLUMN])),
+    )
+    for name, function, args in vectorized:
+        elapsed, result = measure(function, *args)
+        print(f'{name:>25} {elapsed:>10.3f}')
+    summary_seconds = elapsed
+
+    # Time the loop on the first loop_instruments instruments and scale it to the universe
+    subset = df[df['Instrument'].cat.codes < loop_instruments]
+    loop_seconds, loop_summary = measure(latest_summary_loop, subset)
+    loop_seconds *= instrument_count / loop_instruments
+    print(f'{"per-instrument loop":>25} {loop_seconds:>10.3f} (scaled from {loop_instruments} instruments)')
+    print(f'latest_summary speed-up: {loop_seconds / summary_seconds:.0f}x')
+
+    # Both implementations give the same changes for the timed subset
+    subset_summary = rdp_esg_analytics.latest_summary(subset, VALUE_COLUMNS, [GRADE_COLUMN])
+    for title in [f'{title} Change' for title in VALUE_COLUMNS] + [f'{GRADE_COLUMN} Change']:
+        np.testing.assert_allclose(subset_summary[title].to_numpy(), loop_summary[title].to_numpy(dtype = np.float64))
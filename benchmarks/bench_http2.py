@@ -0,0 +1,72 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+# Compare concurrent ESG requests/sec of the pooled HTTP/1.1 session against the HTTP/2 transport (one multiplexed connection)
+# on a local HTTP/2 capable stand-in server (hypercorn). Uses TLS with a self-signed certificate when openssl is available,
+# otherwise plain HTTP/1.1 against h2c (HTTP/2 prior knowledge).
+# Usage (from the project root): python benchmarks/bench_http2.py [number_of_requests] [concurrency] [server_latency]
+
+import sys
+import os
+import time
+import logging
+import tempfile
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from rdp_controller import rdp_http_controller
+from tests.mock_rdp_h2_server import MockRDPH2Server, create_self_signed_cert
+
+ACCESS_TOKEN = 'access_token_mock1mock2mock3mock4mock5'
+
+# Run the stand-in server in its own process, so it does not share the GIL with the client threads
+def serve_forever(latency, cert, url_queue):
+    logging.disable(logging.CRITICAL) # Connections closed by the benchmark end are not errors
+    server = MockRDPH2Server(latency = latency, certfile = cert[0] if cert else None, keyfile = cert[1] if cert else None).start()
+    url_queue.put(server.esg_url)
+    server._thread.join()
+
+def bench_controller(controller, esg_url, count, concurrency):
+    with ThreadPoolExecutor(max_workers = concurrency) as executor:
+        list(executor.map(lambda index: controller.rdp_request_esg(esg_url, ACCESS_TOKEN, f'RIC{index % 50}.L'), range(concurrency))) # Warm up
+        start = time.perf_counter()
+        list(executor.map(lambda index: controller.rdp_request_esg(esg_url, ACCESS_TOKEN, f'RIC{index}.L'), range(count)))
+        return count / (time.perf_counter() - start)
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    latency = float(sys.argv[3]) if len(sys.argv) > 3 else 0.02
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cert = create_self_signed_cert(temp_dir)
+        if cert is not None:
+            os.environ['REQUESTS_CA_BUNDLE'] = cert[0]
+        url_queue = multiprocessing.Queue()
+        server_process = multiprocessing.Process(target = serve_forever, args = (latency, cert, url_queue), daemon = True)
+        server_process.start()
+        esg_url = url_queue.get()
+        try:
+            # single_flight off: every request goes to the server, as with distinct universes
+            with rdp_http_controller.RDPHTTPController(pool_maxsize = concurrency, single_flight = False) as controller:
+                http1_rps = bench_controller(controller, esg_url, count, concurrency)
+            with rdp_http_controller.RDPHTTPController(http2 = True, http2_prior_knowledge = cert is None, single_flight = False) as controller:
+                http2_rps = bench_controller(controller, esg_url, count, concurrency)
+        finally:
+            server_process.terminate()
+
+    print(f'ESG requests: {count}, concurrency: {concurrency}, server latency: {latency}s, {"TLS (ALPN)" if cert else "plain (h2c)"}')
+    print(f'HTTP/1.1 pooled session ({concurrency} connections): {http1_rps:10.1f} req/s')
+    print(f'HTTP/2 multiplexed (1 connection):    {http2_rps:10.1f} req/s')
+    print(f'Speed up:                             {http2_rps / http1_rps:10.2f}x')
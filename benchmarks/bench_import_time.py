@@ -0,0 +1,65 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+# Measure the start-up cost of the console application: the wall time of fresh interpreters running each scenario
+# (median of repeat runs, the bare interpreter start-up is reported first) and the slowest imports of 'import app'
+# reported by python -X importtime.
+# Usage (from the project root): python benchmarks/bench_import_time.py [repeat] [top_imports]
+
+import sys
+import os
+import time
+import statistics
+import subprocess
+
+PROJECT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+SCENARIOS = (
+    ('python start-up', ['-c', 'pass']),
+    ('import app', ['-c', 'import app']),
+    ('auth-only controller', ['-c', 'import app; from rdp_controller import rdp_http_controller, rdp_token_manager; rdp_http_controller.RDPHTTPController().close()']),
+    ('app.py --help', ['app.py', '--help']),
+    ('import app + pandas', ['-c', 'import app, pandas']),
+    ('import app + analytics', ['-c', 'import app; from rdp_controller import rdp_esg_analytics']),
+)
+
+def run_seconds(arguments):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *arguments], cwd = PROJECT_DIR, stdout = subprocess.DEVNULL, stderr = subprocess.DEVNULL, check = True)
+    return time.perf_counter() - start
+
+# Cumulative import time (microseconds) of the modules imported by code and of their direct imports, slowest first
+def slowest_imports(code, count):
+    stderr = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd = PROJECT_DIR, capture_output = True, text = True, check = True).stderr
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2  # The import nesting level is the indentation of the name
+        if depth <= 1:
+            imports.append((int(cumulative), name.strip()))
+    return sorted(imports, reverse = True)[:count]
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    top_imports = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    print(f'{"scenario":>25} {"median ms":>10} {"min ms":>10}')
+    for name, arguments in SCENARIOS:
+        run_seconds(arguments)  # Warm up the file system cache
+        timings = [run_seconds(arguments) for _ in range(repeat)]
+        print(f'{name:>25} {statistics.median(timings) * 1000:>10.1f} {min(timings) * 1000:>10.1f}')
+
+    print(f'\nSlowest imports of "import app" (cumulative ms):')
+    for cumulative, name in slowest_imports('import app', top_imports):
+        print(f'{cumulative / 1000:>10.1f}  {name}')
@@ -0,0 +1,49 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+# Compare paging through Search Explore hits on demand against prefetching the next page while the current one is processed.
+# Usage (from the project root): python benchmarks/bench_search_pager.py [number_of_pages] [page_latency] [processing_time_per_page]
+
+import sys
+import os
+import time
+import contextlib
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from rdp_controller import rdp_http_controller
+from tests.mock_rdp_server import MockRDPServer
+
+ACCESS_TOKEN = 'access_token_mock1mock2mock3mock4mock5'
+PAGE_SIZE = 100
+
+def bench_pager(controller, search_url, prefetch, processing_time):
+    payload = {'View': 'Entities', 'Filter': 'ExchangeCode eq \'TEST\'', 'Select': 'RIC,IssuerCommonName'}
+    start = time.perf_counter()
+    for hits in controller.rdp_paginate_search_explore(search_url, ACCESS_TOKEN, payload, page_size = PAGE_SIZE, prefetch = prefetch).pages():
+        time.sleep(processing_time)  # Stand-in for the caller's work on one page
+    return time.perf_counter() - start
+
+if __name__ == '__main__':
+    page_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+    processing_time = float(sys.argv[3]) if len(sys.argv) > 3 else 0.05
+
+    with MockRDPServer(latency = latency) as server, open(os.devnull, 'w') as devnull:
+        server.set_search_hits([{'RIC': f'TEST{index}.RIC', 'IssuerCommonName': f'Test Data Name {index}'} for index in range(page_count * PAGE_SIZE)])
+        with rdp_http_controller.RDPHTTPController() as controller, contextlib.redirect_stdout(devnull):
+            on_demand_time = bench_pager(controller, server.search_url, 0, processing_time)
+            prefetch_time = bench_pager(controller, server.search_url, 1, processing_time)
+
+    print(f'Pages: {page_count}, page latency: {latency}s, processing time: {processing_time}s per page')
+    print(f'Sum of latency and processing:  {page_count * (latency + processing_time):8.2f}s')
+    print(f'Max of latency and processing:  {page_count * max(latency, processing_time) + min(latency, processing_time):8.2f}s')
+    print(f'On demand (prefetch = 0):       {on_demand_time:8.2f}s')
+    print(f'Prefetch (prefetch = 1):        {prefetch_time:8.2f}s')
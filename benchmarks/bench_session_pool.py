@@ -0,0 +1,52 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+# Compare ESG requests/sec of the per-call requests.get() path against the pooled RDPHTTPController session.
+# Usage (from the project root): python benchmarks/bench_session_pool.py [number_of_requests]
+
+import sys
+import os
+import time
+import contextlib
+import requests
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from rdp_controller import rdp_http_controller
+from tests.mock_rdp_server import MockRDPServerProcess
+
+ACCESS_TOKEN = 'access_token_mock1mock2mock3mock4mock5'
+
+def bench_per_call(esg_url, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        response = requests.get(esg_url, headers={'Authorization': f'Bearer {ACCESS_TOKEN}'}, params = {'universe': 'TEST.RIC'})
+        response.json()
+    return count / (time.perf_counter() - start)
+
+def bench_pooled(esg_url, count):
+    with rdp_http_controller.RDPHTTPController() as controller:
+        start = time.perf_counter()
+        for _ in range(count):
+            controller.rdp_request_esg(esg_url, ACCESS_TOKEN, 'TEST.RIC')
+        return count / (time.perf_counter() - start)
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with MockRDPServerProcess() as server, open(os.devnull, 'w') as devnull:
+        with contextlib.redirect_stdout(devnull):
+            per_call_rps = bench_per_call(server.esg_url, count)
+            pooled_rps = bench_pooled(server.esg_url, count)
+
+    print(f'ESG requests: {count}')
+    print(f'Per-call requests.get(): {per_call_rps:10.1f} req/s')
+    print(f'Pooled session:          {pooled_rps:10.1f} req/s')
+    print(f'Speed up:                {pooled_rps / per_call_rps:10.2f}x')
@@ -0,0 +1,176 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+# Benchmark suite: throughput and latency percentiles of the auth, ESG and Search Explore calls against the local
+# stand-in server, and convert_pandas time and peak memory across row counts. Results are saved as JSON and can be
+# compared with a previous run, the comparison exits with status 1 when a metric regresses more than --threshold.
+# Usage (from the project root):
+#   python benchmarks/bench_suite.py --output baseline.json
+#   python benchmarks/bench_suite.py --output current.json --compare baseline.json
+#   python benchmarks/bench_suite.py --rows 10 1000 100000 1000000 10000000 --skip-http
+
+import sys
+import os
+import gc
+import json
+import math
+import time
+import platform
+import argparse
+import datetime
+import contextlib
+import subprocess
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from rdp_controller import rdp_http_controller
+from tests.mock_rdp_server import MockRDPServerProcess
+from benchmarks.bench_convert_pandas import make_esg_data
+from app import convert_pandas
+
+ACCESS_TOKEN = 'access_token_mock1mock2mock3mock4mock5'
+SEARCH_PAYLOAD = {
+    'View': 'Entities',
+    'Filter': 'RIC eq \'TEST.RIC\'',
+    'Select': 'IssuerCommonName,DocumentTitle,RCSExchangeCountryLeaf,IssueISIN,ExchangeName,ExchangeCode,SearchAllCategoryv3,RCSTRBC2012Leaf'
+}
+# Metrics where a larger value is better, every other metric is better when smaller
+HIGHER_IS_BETTER = ('throughput_rps', 'rows_per_second')
+# Metrics reported but never flagged as regressions: run parameters and single outliers
+NOT_COMPARED = ('requests', 'concurrency', 'rows', 'max_ms')
+
+# Nearest-rank percentile of sorted values
+def percentile(sorted_values, percent):
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+# Run the request benchmark repeat times and keep the run with the median throughput to reduce the noise
+def bench_requests(request_function, count, concurrency, repeat):
+    for index in range(20):  # Warm up the connection pool
+        request_function(index)
+    runs = sorted((run_requests(request_function, count, concurrency) for _ in range(repeat)), key = lambda run: run['throughput_rps'])
+    return runs[len(runs) // 2]
+
+# Run request_function(index) count times on concurrency threads, record the latency of every call
+def run_requests(request_function, count, concurrency):
+
+    def timed_call(index):
+        start = time.perf_counter()
+        request_function(index)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers = concurrency) as executor:
+        latencies = sorted(executor.map(timed_call, range(count)))
+    elapsed = time.perf_counter() - start
+    return {
+        'requests': count,
+        'concurrency': concurrency,
+        'throughput_rps': count / elapsed,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p90_ms': percentile(latencies, 90) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'max_ms': latencies[-1] * 1000
+    }
+
+def bench_http(count, concurrency, latency, repeat):
+    results = {}
+    with MockRDPServerProcess(latency = latency) as server, open(os.devnull, 'w') as devnull:
+        with rdp_http_controller.RDPHTTPController(pool_maxsize = concurrency) as controller, contextlib.redirect_stdout(devnull):
+            results['auth'] = bench_requests(lambda index: controller.rdp_authentication(server.auth_url, 'username', 'password', 'client_id',
+                                                                                         f'refresh_token_{index}'), count, concurrency, repeat)
+            results['esg'] = bench_requests(lambda index: controller.rdp_request_esg(server.esg_url, ACCESS_TOKEN, f'RIC{index}.L'), count, concurrency, repeat)
+            results['search_explore'] = bench_requests(lambda index: controller.rdp_request_search_explore(server.search_url, ACCESS_TOKEN,
+                                                                                                         dict(SEARCH_PAYLOAD, Skip = index)), count, concurrency, repeat)
+    return results
+
+# Time convert_pandas, then measure its peak traced memory in a second run (tracemalloc slows the conversion down)
+def bench_convert_pandas(row_count):
+    esg_data = make_esg_data(row_count)
+    gc.collect()
+    start = time.perf_counter()
+    df = convert_pandas(esg_data)
+    elapsed = time.perf_counter() - start
+    del df
+    gc.collect()
+
+    tracemalloc.start()
+    df = convert_pandas(esg_data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {'rows': row_count, 'seconds': elapsed, 'rows_per_second': row_count / elapsed if elapsed else 0.0,
+            'peak_mb': peak / 2**20, 'frame_mb': df.memory_usage(deep = True).sum() / 2**20}
+
+def get_metadata():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output = True, text = True,
+                                cwd = os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        commit = ''
+    return {'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec = 'seconds'),
+            'commit': commit, 'python': platform.python_version(), 'platform': platform.platform(), 'processor': platform.machine()}
+
+# Print every metric of the current run against the baseline, return the regressions above threshold (fraction)
+def compare(baseline, current, threshold):
+    regressions = []
+    print(f'{"benchmark":<28} {"metric":<16} {"baseline":>12} {"current":>12} {"change":>9}')
+    for name, metrics in current['results'].items():
+        for metric, value in metrics.items():
+            base_value = baseline['results'].get(name, {}).get(metric)
+            if base_value is None or metric in NOT_COMPARED:
+                continue
+            change = (value - base_value) / base_value if base_value else 0.0
+            worse = -change if metric in HIGHER_IS_BETTER else change
+            flag = ' REGRESSION' if worse > threshold else ''
+            if flag:
+                regressions.append((name, metric))
+            print(f'{name:<28} {metric:<16} {base_value:>12.3f} {value:>12.3f} {change:>+8.1%}{flag}')
+    return regressions
+
+def print_results(results):
+    for name, metrics in results.items():
+        print(f'{name:<28} ' + ', '.join(f'{metric} {value:.3f}' if isinstance(value, float) else f'{metric} {value}' for metric, value in metrics.items()))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'RDP controller and convert_pandas benchmark suite')
+    parser.add_argument('--requests', type = int, default = 2000, help = 'requests per HTTP benchmark')
+    parser.add_argument('--concurrency', type = int, default = 1, help = 'client threads per HTTP benchmark')
+    parser.add_argument('--repeat', type = int, default = 5, help = 'runs per HTTP benchmark, the median run is kept')
+    parser.add_argument('--latency', type = float, default = 0, help = 'stand-in server latency in seconds')
+    parser.add_argument('--rows', type = int, nargs = '+', default = [10, 1_000, 100_000, 1_000_000], help = 'convert_pandas row counts')
+    parser.add_argument('--skip-http', action = 'store_true')
+    parser.add_argument('--skip-convert', action = 'store_true')
+    parser.add_argument('--output', help = 'save the results to this JSON file')
+    parser.add_argument('--compare', help = 'compare the results with a previously saved JSON file')
+    parser.add_argument('--threshold', type = float, default = 0.10, help = 'regression threshold as a fraction (default 0.10)')
+    args = parser.parse_args()
+
+    results = {}
+    if not args.skip_http:
+        results.update(bench_http(args.requests, args.concurrency, args.latency, args.repeat))
+    if not args.skip_convert:
+        for row_count in args.rows:
+            results[f'convert_pandas_{row_count}'] = bench_convert_pandas(row_count)
+    report = {'metadata': get_metadata(), 'results': results}
+
+    print_results(results)
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(report, output_file, indent = 2)
+    if args.compare:
+        with open(args.compare, 'r') as baseline_file:
+            baseline = json.load(baseline_file)
+        print(f'\nCompared with {args.compare} ({baseline["metadata"].get("commit")}, {baseline["metadata"].get("timestamp")})')
+        regressions = compare(baseline, report, args.threshold)
+        if regressions:
+            print(f'{len(regressions)} metric(s) regressed more than {args.threshold:.0%}')
+            sys.exit(1)
@@ -0,0 +1,142 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import aiohttp
+import requests
+import json
+import logging
+from rdp_controller import rdp_codec
+
+logger = logging.getLogger(__name__)
+
+# Authorization header value of HTTP Basic authentication, aiohttp.encode_basic_auth() replaces the deprecated
+# BasicAuth/auth= API (older aiohttp releases only have BasicAuth)
+def basic_auth_header(login, password):
+    if hasattr(aiohttp, 'encode_basic_auth'):
+        return aiohttp.encode_basic_auth(login, password)
+    return aiohttp.BasicAuth(login, password).encode()
+
+# Copy an aiohttp response and its body into a requests.Response, so HTTPError carries the same response object as RDPHTTPController
+def to_requests_response(aiohttp_response, body):
+    response = requests.models.Response()
+    response.status_code = aiohttp_response.status
+    response.reason = aiohttp_response.reason
+    response.headers = requests.structures.CaseInsensitiveDict(aiohttp_response.headers)
+    response.url = str(aiohttp_response.url)
+    response.encoding = aiohttp_response.get_encoding()
+    response._content = body
+    return response
+
+class RDPAsyncHTTPController():
+
+    # Constructor Method
+    #   limit: maximum number of concurrent connections
+    #   limit_per_host: maximum number of concurrent connections per host (0 is no limit)
+    #   keepalive_timeout: seconds an idle connection is kept alive
+    def __init__(self, limit = 100, limit_per_host = 0, keepalive_timeout = 15):
+        self.scope = 'trapi'
+        self.client_secret = ''
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.session = None
+
+    # The aiohttp session must be created inside the running event loop
+    def _get_session(self):
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit = self.limit, limit_per_host = self.limit_per_host, keepalive_timeout = self.keepalive_timeout)
+            # No timeout, the same as the requests library default used by RDPHTTPController
+            self.session = aiohttp.ClientSession(connector = connector, timeout = aiohttp.ClientTimeout(total = None))
+        return self.session
+
+    # Close all pooled connections
+    async def aclose(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    # Send HTTP Post request to get Access Token (Password Grant and Refresh Grant) from the RDP Auth Service
+    async def rdp_authentication(self, auth_url, username, password, client_id, old_refresh_token = None):
+
+        if not auth_url or not username or not password or not client_id:
+            raise TypeError('Received invalid (None or Empty) arguments')
+
+        if old_refresh_token is None: # For the Password Grant scenario
+            payload=f'username={username}&password={password}&grant_type=password&scope={self.scope}&takeExclusiveSignOnControl=true&client_id={client_id}'
+        else:  # For the Refresh Token scenario
+            payload=f'username={username}&refresh_token={old_refresh_token}&grant_type=refresh_token&client_id={client_id}'
+
+        async with self._get_session().post(auth_url,
+            headers = {'Content-Type':'application/x-www-form-urlencoded', 'Authorization': basic_auth_header(client_id, self.client_secret)},
+            data = payload
+            ) as response:
+            body = await response.read()
+
+        if response.status != 200:
+            error_response = to_requests_response(response, body)
+            logger.error(f'RDP authentication failure: {response.status} {response.reason}')
+            logger.error(f'Text: {error_response.text}')
+            raise requests.exceptions.HTTPError(f'RDP authentication failure: {response.status} - {error_response.text} ', response = error_response)
+
+        logger.info('Authentication success')
+        auth_json = rdp_codec.loads(body)
+        return auth_json['access_token'], auth_json['refresh_token'], int(auth_json['expires_in'])
+
+    # Send HTTP Get request to the RDP ESG Service
+    async def rdp_request_esg(self, esg_url, access_token, universe):
+
+        if not esg_url or not access_token or not universe:
+            raise TypeError('Received invalid (None or Empty) arguments')
+
+        payload = {'universe': universe}
+        async with self._get_session().get(esg_url, headers={'Authorization': f'Bearer {access_token}'}, params = payload) as response:
+            body = await response.read()
+
+        if response.status == 200:  # HTTP Status 'OK'
+            logger.info('Receive ESG Data from RDP APIs')
+        else:
+            error_response = to_requests_response(response, body)
+            logger.error(f'RDP APIs: ESG data request failure: {response.status} {response.reason}')
+            logger.error(f'Text: {error_response.text}')
+            raise requests.exceptions.HTTPError(f'ESG data request failure: {response.status} - {error_response.text} ', response = error_response)
+
+        return rdp_codec.loads(body)
+
+    # Send HTTP Post request to the RDP Search Explore Service
+    async def rdp_request_search_explore(self, search_url, access_token, payload):
+
+        if not search_url or not access_token or not payload:
+            raise TypeError('Received invalid (None or Empty) arguments')
+
+        headers = {
+            'Accept': 'application/json',
+            'Authorization': f'Bearer {access_token}'
+        }
+
+        async with self._get_session().post(search_url, headers = headers, data = json.dumps(payload)) as response:
+            body = await response.read()
+
+        if response.status == 200:  # HTTP Status 'OK'
+            logger.info('Receive Search Explore Data from RDP APIs')
+        else:
+            error_response = to_requests_response(response, body)
+            logger.error(f'RDP APIs: Search Explore request failure: {response.status} {response.reason}')
+            logger.error(f'Text: {error_response.text}')
+            raise requests.exceptions.HTTPError(f'Search Explore request failure: {response.status} - {error_response.text} ', response = error_response)
+
+        return rdp_codec.loads(body)
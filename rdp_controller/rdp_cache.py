@@ -0,0 +1,180 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from rdp_controller import rdp_codec
+
+# Cache key of a request: the endpoint URL plus the query parameters or JSON payload
+def make_cache_key(url, params = None):
+    return hashlib.sha256(json.dumps([url, params], sort_keys = True).encode('utf-8')).hexdigest()
+
+class MemoryCache():
+
+    # In-memory LRU cache of parsed JSON responses.
+    #   max_entries: least recently used entries are evicted above this size
+    #   ttl: seconds an entry stays valid (None never expires)
+    # Values are kept serialized as JSON bytes and parsed on every get(), so callers get their own copy and cannot modify
+    # the cached responses (parsing, with orjson when installed, is several times faster than copy.deepcopy).
+    def __init__(self, max_entries = 1024, ttl = 3600, clock = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[0] is None or self.clock() < entry[0]):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                value = entry[1]
+            else:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+        return rdp_codec.loads(value)
+
+    def set(self, key, value):
+        value = json.dumps(value).encode('utf-8')
+        expires_at = self.clock() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last = False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self)}
+
+    def __len__(self):
+        return len(self._entries)
+
+class DiskCache():
+
+    # On-disk cache of JSON responses, one file per key in 'directory', shared by processes using the same directory.
+    #   max_entries: least recently used entries (by file modification time) are evicted above this size, down to
+    #     evict_ratio * max_entries so the directory is only scanned once every few sets
+    #   ttl: seconds an entry stays valid (None never expires)
+    # The entry count is tracked by this process and recounted on every eviction, entries written or removed by other
+    # processes are picked up then.
+    def __init__(self, directory, max_entries = 10000, ttl = 86400, clock = time.time, evict_ratio = 0.9):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self.evict_ratio = evict_ratio
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok = True)
+        self._entry_count = len(self)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f'{key}.json')
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding = 'utf-8') as cache_file:
+                entry = json.load(cache_file)
+        except (OSError, ValueError):
+            entry = None
+        if entry is not None and (entry['expires_at'] is None or self.clock() < entry['expires_at']):
+            self._touch(path)
+            with self._lock:
+                self.hits += 1
+            return entry['value']
+        if entry is not None:
+            self.delete(key)
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key, value):
+        expires_at = self.clock() + self.ttl if self.ttl is not None else None
+        # Write to a temporary file first, so readers never see a partially written entry
+        file_descriptor, temp_path = tempfile.mkstemp(dir = self.directory, suffix = '.tmp')
+        with os.fdopen(file_descriptor, 'w', encoding = 'utf-8') as cache_file:
+            json.dump({'expires_at': expires_at, 'value': value}, cache_file)
+        is_new = not os.path.exists(self._path(key))
+        os.replace(temp_path, self._path(key))
+        self._touch(self._path(key))
+        with self._lock:
+            if is_new:
+                self._entry_count += 1
+            evict = self._entry_count > self.max_entries
+        if evict:
+            self._evict()
+
+    # The file modification time records the last use for the LRU eviction
+    def _touch(self, path):
+        now = self.clock()
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+
+    def delete(self, key):
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            return
+        with self._lock:
+            self._entry_count -= 1
+
+    def clear(self):
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.json'):
+                self.delete(entry.name[:-len('.json')])
+
+    # Remove the least recently used entries down to evict_ratio * max_entries. Other processes may remove
+    # files while the directory is scanned, those entries are skipped.
+    def _evict(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith('.json'):
+                continue
+            try:
+                entries.append((entry.stat().st_mtime, entry.name[:-len('.json')]))
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            self._entry_count = len(entries)
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort()
+        for modified, key in entries[:len(entries) - int(self.max_entries * self.evict_ratio)]:
+            self.delete(key)
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self)}
+
+    def __len__(self):
+        return sum(1 for entry in os.scandir(self.directory) if entry.name.endswith('.json'))
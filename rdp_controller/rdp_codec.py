@@ -0,0 +1,70 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import gzip
+import json
+import zlib
+import urllib3
+
+try:
+    import orjson
+except ImportError:  # optional dependency, the json module parses the responses without it
+    orjson = None
+try:
+    import brotli
+except ImportError:  # optional dependency, enables the 'br' content coding
+    brotli = None
+try:
+    import zstandard
+except ImportError:  # optional dependency, enables the 'zstd' content coding
+    zstandard = None
+
+# Accept-Encoding of the response content codings urllib3 decodes in this environment:
+# gzip and deflate, plus br when brotli is installed and zstd when zstandard is installed
+ACCEPT_ENCODING = urllib3.util.make_headers(accept_encoding = True)['accept-encoding']
+
+# Request body compressors and decompressors by content coding
+# (zstandard compressor/decompressor objects are not thread-safe, one is created per call)
+COMPRESSORS = {'gzip': gzip.compress, 'deflate': zlib.compress}
+DECOMPRESSORS = {'gzip': gzip.decompress, 'deflate': zlib.decompress}
+if brotli is not None:
+    COMPRESSORS['br'] = brotli.compress
+    DECOMPRESSORS['br'] = brotli.decompress
+if zstandard is not None:
+    COMPRESSORS['zstd'] = lambda data: zstandard.ZstdCompressor().compress(data)
+    DECOMPRESSORS['zstd'] = lambda data: zstandard.ZstdDecompressor().decompress(data)
+
+# Parse JSON straight from the (already decompressed) response bytes, without decoding them into a str first.
+# Uses orjson when installed, the json module parses what orjson rejects (e.g. NaN literals, integers above 64 bits).
+def loads(data):
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+# Compress a request body with a content coding, returns the compressed bytes
+def compress(body, encoding):
+    if encoding not in COMPRESSORS:
+        raise ValueError(f'Unsupported content coding: {encoding}')
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    return COMPRESSORS[encoding](body)
+
+# Decompress a body received with a content coding (None or 'identity' returns it unchanged)
+def decompress(body, encoding):
+    if encoding in (None, '', 'identity'):
+        return body
+    if encoding not in DECOMPRESSORS:
+        raise ValueError(f'Unsupported content coding: {encoding}')
+    return DECOMPRESSORS[encoding](body)
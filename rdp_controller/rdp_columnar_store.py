@@ -0,0 +1,92 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import time
+import uuid
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.fs as pafs
+except ImportError:  # optional dependency, only ColumnarStore needs it
+    pa = None
+
+class ColumnarStore():
+
+    # Columnar on-disk store of ESG and Search Explore results, one dataset directory per name under 'directory'.
+    #   file_format: 'parquet' (compressed, smallest files) or 'feather' (Arrow IPC files, memory-mapped zero-copy on read)
+    #   compression: codec name, None uses the default of the format ('snappy' for Parquet, uncompressed for Feather)
+    # Every append() writes one new file with the whole batch, so batches are stored as they arrive without rewriting
+    # the existing files. The batches may have different columns (Search Explore leaves out null fields): the dataset
+    # is read with the union of the file schemas, in append order, a column only null so far is read as string.
+    # The ESG rows of a batch are sorted by instrument and period, so the Parquet statistics let filters on those
+    # columns skip row groups within a file. The dataset is not partitioned (a partition per instrument or period
+    # writes one tiny file per row), so the instrument and period ranges of the files overlap and a filter still
+    # opens every file: compact the dataset (read it and write it sorted once) when it has many batches.
+    def __init__(self, directory, file_format = 'parquet', compression = None):
+        if pa is None:
+            raise ImportError('ColumnarStore requires pyarrow, install it with: pip install pyarrow')
+        if file_format not in ('parquet', 'feather'):
+            raise ValueError(f'Unsupported file format: {file_format}')
+        self.directory = directory
+        self.file_format = file_format
+        self.extension = 'parquet' if file_format == 'parquet' else 'arrow'
+        self._format = ds.ParquetFileFormat() if file_format == 'parquet' else ds.IpcFileFormat()
+        if file_format == 'parquet':
+            self._write_options = self._format.make_write_options(compression = compression or 'snappy')
+        else:
+            self._write_options = self._format.make_write_options(compression = compression)
+
+    def _path(self, name):
+        return f'{self.directory}/{name}'
+
+    # Append a DataFrame to the 'name' dataset as one new file
+    def append(self, name, df):
+        if df is None or df.empty:
+            return
+        table = pa.Table.from_pandas(df, preserve_index = False)
+        # Store categorical columns as plain strings, the dictionary of every batch is different
+        for index, field in enumerate(table.schema):
+            if pa.types.is_dictionary(field.type):
+                table = table.set_column(index, field.name, table.column(index).cast(pa.string()))
+        ds.write_dataset(table, self._path(name), format = self._format, file_options = self._write_options,
+                         basename_template = f'part-{time.time_ns():020d}-{uuid.uuid4().hex}-{{i}}.{self.extension}',
+                         existing_data_behavior = 'overwrite_or_ignore')
+
+    # Append converted ESG rows sorted by 'Instrument' and 'Period End Date'
+    def append_esg(self, esg_df):
+        if esg_df is None or esg_df.empty:
+            return
+        self.append('esg', esg_df.sort_values(['Instrument', 'Period End Date'], kind = 'stable', ignore_index = True))
+
+    # Append Search Explore hits
+    def append_search(self, hits):
+        if not hits:
+            return
+        self.append('search', pd.DataFrame(hits))
+
+    # The 'name' dataset, memory_map reads the files through memory mapping instead of copying them into memory.
+    # Its schema unifies the schemas of all files (the file names sort in append order), null columns promoted to the
+    # type of the other files.
+    def dataset(self, name, memory_map = True):
+        filesystem = pafs.LocalFileSystem(use_mmap = memory_map)
+        dataset = ds.dataset(self._path(name), format = self._format, filesystem = filesystem)
+        fragments = sorted(dataset.get_fragments(), key = lambda fragment: fragment.path)
+        schema = pa.unify_schemas([fragment.physical_schema for fragment in fragments], promote_options = 'permissive') if fragments else dataset.schema
+        return ds.dataset([fragment.path for fragment in fragments], schema = schema, format = self._format, filesystem = filesystem)
+
+    # Read the 'name' dataset (optionally a subset of columns or rows matching a pyarrow.dataset filter expression)
+    # into a DataFrame, string columns become categorical as in rdp_dataframe
+    def read(self, name, columns = None, filter = None, memory_map = True):
+        table = self.dataset(name, memory_map).to_table(columns = columns, filter = filter)
+        return table.to_pandas(strings_to_categorical = True)
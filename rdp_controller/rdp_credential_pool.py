@@ -0,0 +1,197 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import copy
+import logging
+import threading
+import time
+import requests
+from rdp_controller import rdp_token_manager
+from rdp_controller import rdp_rate_limiter
+from rdp_controller import rdp_retry
+from rdp_controller import rdp_search_pager
+from rdp_controller import rdp_esg_sync
+
+logger = logging.getLogger(__name__)
+
+class NoAccountAvailableError(requests.exceptions.RequestException):
+    pass
+
+class PoolAccount():
+
+    # State of one RDP account in the pool: its token manager, optional quota bucket and routing counters
+    def __init__(self, name, token_manager, bucket = None):
+        self.name = name
+        self.token_manager = token_manager
+        self.bucket = bucket
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.unavailable_until = 0
+        self.last_error = None
+
+    def stats(self):
+        return {'outstanding': self.outstanding, 'requests': self.requests, 'failures': self.failures,
+                'available': self.unavailable_until == 0, 'last_error': self.last_error}
+
+class CredentialPool():
+
+    # Spread ESG and Search Explore requests across several RDP accounts to raise the aggregate quota.
+    # Every account logs in through controller.rdp_authentication and keeps its token fresh with its own RDPTokenManager.
+    #   credentials: list of (username, password, client_id) tuples
+    #   strategy: 'least_outstanding' routes to the account with the fewest requests in flight,
+    #     'remaining_quota' to the account with the most tokens left in its quota_rate requests/sec bucket
+    #     (use it instead of a controller rate_limiter, which would limit all accounts together)
+    #   cooldown: seconds an account is out of rotation after an auth failure or HTTP 429 (a longer Retry-After wins)
+    #   token_store: rdp_token_store.TokenStore keeping the tokens of every account for the next processes
+    # A request rejected with an auth failure or HTTP 429 is sent again on another account. The pool sends through a
+    # copy of the controller (same session, caches and limits) whose retry policy does not retry HTTP 429, so a throttled
+    # request fails over to another account at once instead of waiting for Retry-After on the same account.
+    def __init__(self, controller, auth_url, credentials, strategy = 'least_outstanding', quota_rate = None, quota_capacity = None,
+                 cooldown = 60, refresh_margin = 60, clock = time.monotonic, sleep = time.sleep, token_store = None):
+        if not controller or not auth_url or not credentials:
+            raise TypeError('Received invalid (None or Empty) arguments')
+        if strategy not in ('least_outstanding', 'remaining_quota'):
+            raise ValueError(f'Unsupported routing strategy: {strategy}')
+        if strategy == 'remaining_quota' and not quota_rate:
+            raise ValueError('The remaining_quota strategy requires quota_rate')
+
+        self.controller = self._without_throttle_retries(controller)
+        self.auth_url = auth_url
+        self.strategy = strategy
+        self.cooldown = cooldown
+        self.clock = clock
+        self.sleep = sleep
+        self.accounts = []
+        for username, password, client_id in credentials:
+            token_manager = rdp_token_manager.RDPTokenManager(self.controller, auth_url, username, password, client_id, refresh_margin, clock, token_store)
+            bucket = rdp_rate_limiter.TokenBucket(quota_rate, quota_capacity, clock) if quota_rate else None
+            self.accounts.append(PoolAccount(username, token_manager, bucket))
+        self._lock = threading.Lock()
+        self._retry_after = rdp_retry.RetryPolicy().parse_retry_after
+
+    @staticmethod
+    def _without_throttle_retries(controller):
+        retry_policy = controller.retry_policy
+        if 429 not in retry_policy.retry_statuses:
+            return controller
+        retry_policy = copy.copy(retry_policy)
+        retry_policy.retry_statuses = retry_policy.retry_statuses - {429}
+        pool_controller = copy.copy(controller)
+        pool_controller.retry_policy = retry_policy
+        return pool_controller
+
+    # Login every account, an account that cannot login starts out of rotation
+    def start(self):
+        last_error = None
+        for account in self.accounts:
+            try:
+                account.token_manager.start()
+            except requests.exceptions.RequestException as exp:
+                logger.error(f'RDP account {account.name} login failure: {exp}')
+                self._take_out(account, exp)
+                last_error = exp
+        if all(account.unavailable_until for account in self.accounts):
+            raise NoAccountAvailableError('No RDP account could login') from last_error
+        return self
+
+    def stop(self):
+        for account in self.accounts:
+            account.token_manager.stop()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    # Request ESG data on the next account
+    def request_esg(self, esg_url, universe, start = None, end = None):
+        return self._call(lambda token_manager: token_manager.request_esg(esg_url, universe, start, end))
+
+    # Request Search Explore data on the next account
+    def request_search_explore(self, search_url, payload):
+        return self._call(lambda token_manager: token_manager.request_search_explore(search_url, payload))
+
+    # Incremental ESG sync across the accounts, see rdp_esg_sync.ESGSync
+    def esg_sync(self, esg_url, state_path = None, recent_periods = 2, chunk_size = 50, update_column = None):
+        return rdp_esg_sync.ESGSync(lambda universe, start, end: self.request_esg(esg_url, universe, start, end),
+                                    state_path, recent_periods, chunk_size, update_column)
+
+    # Page through all Search Explore 'Hits', every page is routed on its own
+    def paginate_search_explore(self, search_url, payload, page_size = 100, prefetch = 1, max_hits = None):
+        return rdp_search_pager.SearchExplorePager(lambda page_payload: self.request_search_explore(search_url, page_payload),
+                                                   payload, page_size, prefetch, max_hits)
+
+    # Routing counters of every account
+    def stats(self):
+        with self._lock:
+            return {account.name: account.stats() for account in self.accounts}
+
+    def _call(self, request_function):
+        tried = set()
+        last_error = None
+        while True:
+            try:
+                account = self._acquire(tried)
+            except NoAccountAvailableError as exp:
+                raise exp from last_error
+            try:
+                return request_function(account.token_manager)
+            except requests.exceptions.RequestException as exp:
+                if not self._is_account_failure(exp):
+                    raise
+                logger.warning(f'RDP account {account.name} out of rotation: {exp}')
+                self._take_out(account, exp)
+                tried.add(account)
+                last_error = exp
+            finally:
+                with self._lock:
+                    account.outstanding -= 1
+
+    # Auth failures (RDP Auth Service errors, HTTP 401/403 after the token renewal) and HTTP 429 take the account out of rotation
+    def _is_account_failure(self, exp):
+        response = getattr(exp, 'response', None)
+        if response is None:
+            return False
+        return response.status_code in (401, 403, 429) or (response.url or '').startswith(self.auth_url)
+
+    def _take_out(self, account, exp):
+        response = getattr(exp, 'response', None)
+        retry_after = self._retry_after(response) if response is not None and response.status_code == 429 else None
+        with self._lock:
+            account.failures += 1
+            account.last_error = str(exp)
+            account.unavailable_until = self.clock() + max(self.cooldown, retry_after or 0)
+
+    # Pick the account for the next request and count it as outstanding, waiting for its quota when it has a bucket
+    def _acquire(self, tried):
+        with self._lock:
+            now = self.clock()
+            for account in self.accounts:
+                if account.unavailable_until and now >= account.unavailable_until:
+                    account.unavailable_until = 0 # Cooldown over, back in rotation
+            candidates = [account for account in self.accounts if not account.unavailable_until and account not in tried]
+            if not candidates:
+                raise NoAccountAvailableError('All RDP accounts are out of rotation')
+            if self.strategy == 'remaining_quota':
+                account = max(candidates, key = lambda account: (account.bucket.available(), -account.outstanding))
+            else:
+                account = min(candidates, key = lambda account: (account.outstanding, account.requests))
+            account.outstanding += 1
+            account.requests += 1
+        if account.bucket is not None:
+            wait = account.bucket.try_acquire()
+            while wait > 0:
+                self.sleep(wait)
+                wait = account.bucket.try_acquire()
+        return account
@@ -0,0 +1,46 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Build one typed column from a list/tuple of JSON values using the RDP 'headers' type
+#   number -> float64 (null -> NaN), date/datetime -> datetime64[ns] (null -> NaT), string -> category
+def build_column(values, column_type):
+    if column_type == 'number':
+        try:
+            return np.array(values, dtype = np.float64)
+        except (TypeError, ValueError):
+            return pd.to_numeric(pd.Series(values, dtype = object), errors = 'coerce').to_numpy(dtype = np.float64)
+    if column_type in ('date', 'datetime'):
+        return pd.to_datetime(pd.Series(values, dtype = object), format = 'ISO8601', errors = 'coerce').to_numpy()
+    if column_type == 'string':
+        return pd.Categorical(values)
+    return np.array(values, dtype = object)
+
+# Build a typed DataFrame column by column from the RDP 'headers' metadata and the 'data' row lists,
+# without creating an intermediate whole-matrix NumPy array
+def build_dataframe(headers, rows):
+    titles = [header['title'] for header in headers]
+    width = len(titles)
+    if any(len(row) != width for row in rows):
+        raise ValueError(f'Data rows do not match the {width} header columns')
+
+    # zip(*rows) transposes the row lists into per-column tuples of references to the parsed JSON values
+    columns = zip(*rows) if rows else ((),) * width
+    # Columns keyed by position, duplicate header titles must not overwrite each other
+    data = {}
+    for position, (header, values) in enumerate(zip(headers, columns)):
+        data[position] = build_column(values, header.get('type'))
+    df = pd.DataFrame(data, columns = range(width), copy = False)
+    df.columns = titles
+    return df
@@ -0,0 +1,144 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import numpy as np
+import pandas as pd
+
+# ESG score grades from the lowest to the highest, mapped to 1 (D-) ... 12 (A+)
+GRADES = ('D-', 'D', 'D+', 'C-', 'C', 'C+', 'B-', 'B', 'B+', 'A-', 'A', 'A+')
+GRADE_SCALE = {grade: float(score) for score, grade in enumerate(GRADES, 1)}
+
+# Vectorized analytics over the ESG DataFrame of convert_pandas (one row per instrument and period).
+# Every function sorts the rows once by instrument then period and works on the column arrays: group boundaries
+# come from comparing neighbouring instrument codes, so there is no per-instrument or per-row Python loop.
+# Rows without a period end date are ignored.
+
+# Integer codes and categories of a string column, categorical columns are used without conversion
+def _codes(values):
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return np.asarray(values.cat.codes), values.cat.categories
+    return pd.factorize(values)
+
+# Sort the rows by instrument then period, returns the sorted frame and the group number of every row
+def _sort_periods(df, instrument_column, period_column):
+    periods = df[period_column].to_numpy(dtype = 'datetime64[ns]')
+    instrument_codes = _codes(df[instrument_column])[0]
+    order = np.lexsort((periods, instrument_codes))
+    order = order[~np.isnat(periods[order])]
+    instrument_codes = instrument_codes[order]
+    group_starts = np.ones(len(order), dtype = bool)
+    group_starts[1:] = instrument_codes[1:] != instrument_codes[:-1]
+    return df.iloc[order].reset_index(drop = True), np.cumsum(group_starts) - 1
+
+# Numeric columns other than the instrument and period columns
+def _value_columns(df, value_columns, exclude):
+    if value_columns is not None:
+        return list(value_columns)
+    return [title for title in df.columns if title not in exclude and pd.api.types.is_numeric_dtype(df[title].dtype)]
+
+# Shift a column array by 'periods' rows within each instrument, rows without an earlier period get fill_value
+def _shift_within(values, groups, periods, fill_value):
+    shifted = np.full(len(values), fill_value, dtype = values.dtype)
+    if 0 < periods < len(values):
+        same_instrument = groups[periods:] == groups[:-periods]
+        shifted[periods:] = np.where(same_instrument, values[:-periods], fill_value)
+    return shifted
+
+# Map grades ('A+', 'B-', ...) to numbers (float64, NaN for missing or unknown grades). The scale is looked up once
+# per distinct grade and the numbers are gathered by the integer codes.
+def grade_to_numeric(grades, scale = GRADE_SCALE):
+    codes, categories = _codes(pd.Series(grades, copy = False))
+    # Code -1 (missing grade) picks the trailing NaN
+    numbers = np.array([scale.get(category, np.nan) for category in categories] + [np.nan], dtype = np.float64)
+    return numbers[codes]
+
+# The latest 'periods' rows of every instrument, sorted by instrument then period
+def latest_periods(df, periods = 1, instrument_column = 'Instrument', period_column = 'Period End Date'):
+    sorted_df, groups = _sort_periods(df, instrument_column, period_column)
+    return sorted_df[_from_end(groups) < periods].reset_index(drop = True)
+
+# Number of later rows of the same instrument for every row (0 on the latest period)
+def _from_end(groups):
+    row_count = len(groups)
+    group_ends = np.flatnonzero(np.append(groups[1:] != groups[:-1], True)) if row_count else np.array([], dtype = np.intp)
+    return group_ends[groups] - np.arange(row_count)
+
+# Change of the value columns (default: every numeric column) since the period 'periods' rows earlier of the same
+# instrument, the year-over-year change for the annual ESG periods. Returns the instrument, the period and one
+# '<column><suffix>' column per value column, sorted by instrument then period (NaN on the first periods).
+def period_changes(df, value_columns = None, periods = 1, instrument_column = 'Instrument', period_column = 'Period End Date', suffix = ' Change'):
+    sorted_df, groups = _sort_periods(df, instrument_column, period_column)
+    return _period_changes(sorted_df, groups, _value_columns(df, value_columns, (instrument_column, period_column)), periods,
+                           instrument_column, period_column, suffix)
+
+def _period_changes(sorted_df, groups, value_columns, periods, instrument_column, period_column, suffix):
+    changes = {instrument_column: sorted_df[instrument_column], period_column: sorted_df[period_column]}
+    for title in value_columns:
+        values = sorted_df[title].to_numpy(dtype = np.float64)
+        changes[title + suffix] = values - _shift_within(values, groups, periods, np.nan)
+    return pd.DataFrame(changes)
+
+# Grade transitions between consecutive periods of every instrument: the instrument, the period, the grade
+# 'From' the previous period, the grade 'To' and the numeric 'Change' (positive for upgrades), sorted by
+# instrument then period. The first period of every instrument has no 'From' grade.
+def grade_transitions(df, grade_column, instrument_column = 'Instrument', period_column = 'Period End Date', scale = GRADE_SCALE):
+    sorted_df, groups = _sort_periods(df, instrument_column, period_column)
+    codes, categories = _codes(sorted_df[grade_column])
+    previous_codes = _shift_within(codes, groups, 1, -1)
+    numbers = grade_to_numeric(sorted_df[grade_column], scale)
+    return pd.DataFrame({
+        instrument_column: sorted_df[instrument_column],
+        period_column: sorted_df[period_column],
+        'From': pd.Categorical.from_codes(previous_codes, categories = categories),
+        'To': pd.Categorical.from_codes(codes, categories = categories),
+        'Change': numbers - _shift_within(numbers, groups, 1, np.nan),
+    })
+
+# Count of the grade transitions between consecutive periods, rows are the 'From' grades and columns the 'To'
+# grades in scale order. Grades missing from the scale are not counted.
+def grade_transition_matrix(df, grade_column, instrument_column = 'Instrument', period_column = 'Period End Date', scale = GRADE_SCALE):
+    sorted_df, groups = _sort_periods(df, instrument_column, period_column)
+    grades = sorted(scale, key = scale.get)
+    codes = pd.Categorical(sorted_df[grade_column], categories = grades).codes.astype(np.intp)
+    previous_codes = _shift_within(codes, groups, 1, -1)
+    counted = (codes >= 0) & (previous_codes >= 0)
+    grade_count = len(grades)
+    counts = np.bincount(previous_codes[counted] * grade_count + codes[counted], minlength = grade_count * grade_count)
+    return pd.DataFrame(counts.reshape(grade_count, grade_count), index = pd.Index(grades, name = 'From'), columns = pd.Index(grades, name = 'To'))
+
+# Cross-sectional rank of the value columns (default: every numeric column), one '<column><suffix>' column per
+# value column aligned with df. pct ranks are percentiles in (0, 1], ties get the average rank and NaN stays NaN.
+#   by: column(s) ranking each group separately (e.g. the period column), None ranks across all the rows
+def cross_sectional_ranks(df, value_columns = None, by = None, pct = True, exclude = ('Instrument', 'Period End Date'), suffix = ' Rank'):
+    value_columns = _value_columns(df, value_columns, exclude)
+    if by is None:
+        ranks = df[value_columns].rank(pct = pct)
+    else:
+        ranks = df.groupby(by, sort = False, observed = True)[value_columns].rank(pct = pct)
+    return ranks.add_suffix(suffix)
+
+# Latest period of every instrument with the change of its value columns since the previous period and their
+# universe-wide percentile rank, plus the numeric grade and grade change of the grade columns.
+def latest_summary(df, value_columns = None, grade_columns = (), instrument_column = 'Instrument', period_column = 'Period End Date',
+                   scale = GRADE_SCALE):
+    sorted_df, groups = _sort_periods(df, instrument_column, period_column)
+    value_columns = _value_columns(df, value_columns, (instrument_column, period_column))
+    changes = _period_changes(sorted_df, groups, value_columns, 1, instrument_column, period_column, ' Change')
+    summary = pd.concat([sorted_df[[instrument_column, period_column, *value_columns]], changes.iloc[:, 2:]], axis = 1)
+    for title in grade_columns:
+        numbers = grade_to_numeric(sorted_df[title], scale)
+        summary[title] = sorted_df[title]
+        summary[f'{title} Numeric'] = numbers
+        summary[f'{title} Change'] = numbers - _shift_within(numbers, groups, 1, np.nan)
+    summary = summary[_from_end(groups) == 0].reset_index(drop = True)
+    ranks = cross_sectional_ranks(summary, value_columns)
+    return pd.concat([summary, ranks], axis = 1)
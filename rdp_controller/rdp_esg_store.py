@@ -0,0 +1,155 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import sys
+import numpy as np
+import pandas as pd
+from rdp_controller import rdp_dataframe
+
+class ESGRecordStore():
+
+    # Compact read-only store of ESG rows for lookups, one NumPy array per column instead of a DataFrame:
+    #   number -> float64, date/datetime -> datetime64[ns], string -> interned categorical codes (int8/16/32) + categories
+    # The rows are sorted by instrument then period, so each instrument is one contiguous slice found through a hash
+    # index (dict), and its periods are sorted for binary search range scans. 'period_order' is the index sorting
+    # all rows by period for scans across the instruments. Rows without a period (NaT) are kept in the columns but
+    # left out of both indexes, an instrument whose periods are all NaT is not indexed.
+    def __init__(self, columns, instrument_column = 'Instrument', period_column = 'Period End Date'):
+        if not columns or instrument_column not in columns or period_column not in columns:
+            raise ValueError(f'The columns must include {instrument_column} and {period_column}')
+        self.instrument_column = instrument_column
+        self.period_column = period_column
+
+        # Sort the rows by instrument (the interned codes) then period
+        columns = {title: (column if isinstance(column, pd.Categorical) else np.asarray(column)) for title, column in columns.items()}
+        instruments = columns[instrument_column]
+        if not isinstance(instruments, pd.Categorical):
+            instruments = columns[instrument_column] = pd.Categorical(instruments)
+        periods = np.asarray(columns[period_column], dtype = 'datetime64[ns]')
+        order = np.lexsort((periods, instruments.codes))
+        self.columns = {}
+        self.categories = {}
+        for title, column in columns.items():
+            if isinstance(column, pd.Categorical):
+                self.columns[title] = column.codes[order]
+                self.categories[title] = np.asarray(column.categories, dtype = object)
+            else:
+                self.columns[title] = column[order]
+        self.periods = self.columns[period_column] = periods[order]
+        dated = np.flatnonzero(~np.isnat(self.periods))
+        self.period_order = dated[np.argsort(self.periods[dated], kind = 'stable')].astype(np.int32 if len(self.periods) < 2 ** 31 else np.intp)
+
+        # Hash index: instrument -> (start, stop) row slice of its dated periods (NaT sorts after them)
+        codes = self.columns[instrument_column]
+        boundaries = np.flatnonzero(np.diff(codes)) + 1
+        starts = np.concatenate(([0], boundaries)) if len(codes) else np.array([], dtype = np.intp)
+        counts = np.add.reduceat(~np.isnat(self.periods), starts) if len(codes) else np.array([], dtype = np.intp)
+        instrument_names = self.categories[instrument_column]
+        self.index = {instrument_names[codes[start]]: (int(start), int(start + count)) for start, count in zip(starts, counts)
+                      if codes[start] >= 0 and count}
+
+    # Build the store from an ESG response ('headers' and 'data' row lists)
+    @classmethod
+    def from_json(cls, esg_data, instrument_column = 'Instrument', period_column = 'Period End Date'):
+        if not esg_data or not esg_data.get('headers'):
+            raise TypeError('Received invalid (None or Empty) JSON data')
+        headers = esg_data['headers']
+        rows = esg_data.get('data', [])
+        columns = zip(*rows) if rows else ((),) * len(headers)
+        return cls({header['title']: rdp_dataframe.build_column(values, header.get('type')) for header, values in zip(headers, columns)},
+                   instrument_column, period_column)
+
+    # Build the store from a DataFrame, categorical columns keep their codes and categories without conversion
+    # and object (string) columns are interned into categoricals
+    @classmethod
+    def from_dataframe(cls, df, instrument_column = 'Instrument', period_column = 'Period End Date'):
+        columns = {}
+        for title in df.columns:
+            column = df[title]
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                columns[title] = column.array
+            elif column.dtype == object:
+                columns[title] = pd.Categorical(column)
+            else:
+                columns[title] = column.to_numpy()
+        return cls(columns, instrument_column, period_column)
+
+    def __len__(self):
+        return len(self.periods)
+
+    def __contains__(self, instrument):
+        return instrument in self.index
+
+    @property
+    def instruments(self):
+        return list(self.index)
+
+    # Bytes used by the column arrays, the categories and the period index
+    @property
+    def nbytes(self):
+        return (sum(column.nbytes for column in self.columns.values()) + self.period_order.nbytes
+                + sum(categories.nbytes + sum(sys.getsizeof(value) for value in categories) for categories in self.categories.values()))
+
+    def _value(self, title, position):
+        value = self.columns[title][position]
+        if title in self.categories:
+            return self.categories[title][value] if value >= 0 else None
+        if isinstance(value, np.floating):
+            return float(value)
+        if isinstance(value, np.datetime64):
+            return pd.Timestamp(value) if not np.isnat(value) else None
+        return value
+
+    # Values of the latest period of an instrument: one column value, or a dict of all (or the listed) columns.
+    # Returns None for an unknown instrument or an instrument without any dated period.
+    def latest(self, instrument, columns = None):
+        position = self.index.get(instrument)
+        if position is None:
+            return None
+        position = position[1] - 1
+        if isinstance(columns, str):
+            return self._value(columns, position)
+        return {title: self._value(title, position) for title in (columns or self.columns)}
+
+    # Row positions of an instrument, optionally the periods between start and end (inclusive)
+    def positions(self, instrument, start = None, end = None):
+        start_row, stop_row = self.index.get(instrument, (0, 0))
+        periods = self.periods[start_row:stop_row]
+        low = np.searchsorted(periods, np.datetime64(pd.Timestamp(start)), 'left') if start is not None else 0
+        high = np.searchsorted(periods, np.datetime64(pd.Timestamp(end)), 'right') if end is not None else len(periods)
+        return np.arange(start_row + low, start_row + high)
+
+    # Row positions of all instruments with a period between start and end (inclusive), in period order
+    def period_positions(self, start = None, end = None):
+        periods = self.periods[self.period_order]
+        low = np.searchsorted(periods, np.datetime64(pd.Timestamp(start)), 'left') if start is not None else 0
+        high = np.searchsorted(periods, np.datetime64(pd.Timestamp(end)), 'right') if end is not None else len(periods)
+        return self.period_order[low:high]
+
+    # DataFrame of the periods of an instrument between start and end (inclusive), oldest period first
+    def history(self, instrument, start = None, end = None, columns = None):
+        return self.to_dataframe(columns, self.positions(instrument, start, end))
+
+    # DataFrame of all instruments with a period between start and end (inclusive)
+    def between(self, start = None, end = None, columns = None):
+        return self.to_dataframe(columns, self.period_positions(start, end))
+
+    # DataFrame of the rows at positions (default: all rows), string columns become categoricals sharing the
+    # interned categories, so no strings are created
+    def to_dataframe(self, columns = None, positions = None):
+        data = {}
+        for title in (columns or self.columns):
+            column = self.columns[title] if positions is None else self.columns[title][positions]
+            if title in self.categories:
+                column = pd.Categorical.from_codes(column, categories = self.categories[title], validate = False)
+            data[title] = column
+        return pd.DataFrame(data, copy = False)
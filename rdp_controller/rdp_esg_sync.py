@@ -0,0 +1,197 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import json
+import logging
+import os
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+class ESGSync():
+
+    # Incremental ESG sync: keeps the rows already fetched, keyed by ('Instrument', 'Period End Date') (the first two
+    # columns of the ESG rows), and requests only the latest periods of the instruments it already has.
+    #   request_esg: function(universe, start, end) sending one ESG request and returning the JSON response
+    #   state_path: file storing the fetched rows between runs (None keeps them in memory only). It is an append-only log of
+    #     JSON lines: every sync appends one line with the rows it inserted or updated, instead of rewriting all rows
+    #   compact_ratio: the state file is rewritten with the current rows only once it holds more than compact_ratio
+    #     times as many rows (superseded rows of updated periods)
+    #   recent_periods: latest periods requested for the known instruments (start = 1 - recent_periods, end = 0),
+    #     an instrument whose recent periods do not overlap the stored ones (missed periods) is fetched in full
+    #   chunk_size: RICs per ESG request (comma separated universe)
+    #   update_column: title of the row update timestamp column (default: the last column of the headers)
+    def __init__(self, request_esg, state_path = None, recent_periods = 2, chunk_size = 50, update_column = None, compact_ratio = 2):
+        if not request_esg:
+            raise TypeError('Received invalid (None or Empty) arguments')
+        if recent_periods < 1 or chunk_size < 1:
+            raise ValueError('recent_periods and chunk_size must be greater than 0')
+        if compact_ratio < 1:
+            raise ValueError('compact_ratio must be at least 1')
+
+        self.request_esg = request_esg
+        self.state_path = state_path
+        self.recent_periods = recent_periods
+        self.chunk_size = chunk_size
+        self.update_column = update_column
+        self.compact_ratio = compact_ratio
+        self.headers = []
+        self.rows = {}  # Instrument -> {Period End Date -> row}
+        self._changes = []  # Rows inserted or updated since the last save
+        self._log_rows = None  # Rows in the state file, None when it must be rewritten
+        if state_path and os.path.exists(state_path):
+            self.load()
+
+    # Replay the state file, a later row replaces an earlier row of the same period
+    def load(self):
+        self.headers = []
+        self.rows = {}
+        self._changes = []
+        self._log_rows = 0
+        with open(self.state_path, 'r', encoding = 'utf-8') as state_file:
+            for line in state_file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Incomplete last line of an interrupted save, the next save rewrites the state file
+                    logger.warning(f'ESG sync: ignore the incomplete last line of {self.state_path}')
+                    self._log_rows = None
+                    break
+                if 'headers' in record:
+                    self.headers = record['headers']
+                for row in record['data']:
+                    self.rows.setdefault(row[0], {})[row[1]] = row
+                self._log_rows += len(record['data'])
+
+    # Append the rows changed since the last save as one line, the whole state is rewritten (compacted) instead
+    # when the log would hold more than compact_ratio times the current rows, or after clear()
+    def save(self):
+        row_count = sum(len(periods) for periods in self.rows.values())
+        if self._log_rows is None or self._log_rows + len(self._changes) > self.compact_ratio * max(row_count, 1):
+            self.compact()
+        elif self._changes:
+            with open(self.state_path, 'a', encoding = 'utf-8') as state_file:
+                state_file.write(json.dumps({'data': self._changes}) + '\n')
+            self._log_rows += len(self._changes)
+        self._changes = []
+
+    # Rewrite the state file with the current rows. Write to a temporary file first, so an interrupted compaction
+    # never leaves a partial state file.
+    def compact(self):
+        data = [row for periods in self.rows.values() for row in periods.values()]
+        directory = os.path.dirname(os.path.abspath(self.state_path))
+        file_descriptor, temp_path = tempfile.mkstemp(dir = directory, suffix = '.tmp')
+        with os.fdopen(file_descriptor, 'w', encoding = 'utf-8') as state_file:
+            state_file.write(json.dumps({'headers': self.headers, 'data': data}) + '\n')
+        os.replace(temp_path, self.state_path)
+        self._log_rows = len(data)
+        self._changes = []
+
+    def clear(self):
+        self.headers = []
+        self.rows = {}
+        self._changes = []
+        self._log_rows = None
+
+    # Bring the rows of every RIC in universe_list up to date and save the state.
+    # Returns the sync statistics: rows 'received', 'inserted', 'updated' and 'unchanged', the number of
+    # 'full' and 'delta' requests and the 'failed' RICs (request failure or no ESG data).
+    def sync(self, universe_list):
+        if not universe_list:
+            raise TypeError('Received invalid (None or Empty) arguments')
+
+        rics = list(dict.fromkeys(ric for ric in universe_list if ric))
+        stats = {'full': 0, 'delta': 0, 'received': 0, 'inserted': 0, 'updated': 0, 'unchanged': 0, 'failed': []}
+        known = [ric for ric in rics if ric in self.rows]
+        new = [ric for ric in rics if ric not in self.rows]
+
+        # Known instruments: request the latest periods only, instruments with missed periods are fetched in full
+        for chunk in self._chunks(known):
+            esg_data = self._request(chunk, 1 - self.recent_periods, 0, stats)
+            if esg_data is None:
+                continue
+            stats['delta'] += 1
+            delta_rows = {}
+            for row in esg_data.get('data', []):
+                delta_rows.setdefault(row[0], []).append(row)
+            for ric in chunk:
+                if any(row[1] in self.rows[ric] for row in delta_rows.get(ric, [])):
+                    self._merge(delta_rows[ric], stats)
+                elif delta_rows.get(ric):
+                    new.append(ric)
+
+        # New instruments: request the full history
+        for chunk in self._chunks(new):
+            esg_data = self._request(chunk, None, None, stats)
+            if esg_data is None:
+                continue
+            stats['full'] += 1
+            self._merge(esg_data.get('data', []), stats)
+            stats['failed'].extend(ric for ric in chunk if ric not in self.rows)
+
+        if self.state_path:
+            self.save()
+        return stats
+
+    def _chunks(self, rics):
+        return [rics[index:index + self.chunk_size] for index in range(0, len(rics), self.chunk_size)]
+
+    # Send one ESG request, a failure or an error block marks all RICs of the chunk as failed
+    def _request(self, chunk, start, end, stats):
+        try:
+            esg_data = self.request_esg(','.join(chunk), start, end)
+        except Exception as exp:
+            logger.error(f'ESG sync request failure for {len(chunk)} RICs: {str(exp)}')
+            stats['failed'].extend(chunk)
+            return None
+        if not esg_data or 'error' in esg_data:
+            logger.error(f'ESG sync: no ESG data for {len(chunk)} RICs: {esg_data.get("error") if esg_data else None}')
+            stats['failed'].extend(chunk)
+            return None
+        self._check_headers(esg_data.get('headers', []))
+        stats['received'] += len(esg_data.get('data', []))
+        return esg_data
+
+    def _check_headers(self, headers):
+        if not self.headers:
+            self.headers = headers
+        elif [header['title'] for header in headers] != [header['title'] for header in self.headers]:
+            raise ValueError('ESG headers do not match the stored rows, clear() the sync state and sync again')
+
+    # Insert the rows of new periods, replace the rows whose update timestamp is newer than the stored one
+    def _merge(self, rows, stats):
+        update_index = self._update_index()
+        for row in rows:
+            periods = self.rows.setdefault(row[0], {})
+            stored = periods.get(row[1])
+            if stored is None:
+                stats['inserted'] += 1
+            elif (row[update_index] or '') > (stored[update_index] or ''):
+                stats['updated'] += 1
+            else:
+                stats['unchanged'] += 1
+                continue
+            periods[row[1]] = row
+            if self.state_path:
+                self._changes.append(row)
+
+    def _update_index(self):
+        if self.update_column is None:
+            return len(self.headers) - 1
+        return [header['title'] for header in self.headers].index(self.update_column)
+
+    # ESG response ('headers' and 'data') with the stored rows of universe_list (default: all instruments),
+    # in the universe_list order and the latest period first, ready for convert_pandas/rdp_dataframe
+    def to_json(self, universe_list = None):
+        rics = self.rows if universe_list is None else [ric for ric in dict.fromkeys(universe_list) if ric in self.rows]
+        data = [self.rows[ric][period] for ric in rics for period in sorted(self.rows[ric], reverse = True)]
+        return {'headers': self.headers, 'data': data}
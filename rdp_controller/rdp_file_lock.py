@@ -0,0 +1,40 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import os
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Open (create if missing) a file and hold an exclusive inter-process lock on it while the block runs.
+# The file is opened in 'r+b' mode, the caller reads/writes the shared state through the yielded file object.
+@contextmanager
+def locked_file(path):
+    file_descriptor = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    with os.fdopen(file_descriptor, 'r+b') as state_file:
+        if fcntl is not None:
+            fcntl.flock(state_file.fileno(), fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(state_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield state_file
+        finally:
+            state_file.flush()
+            if fcntl is not None:
+                fcntl.flock(state_file.fileno(), fcntl.LOCK_UN)
+            else:
+                state_file.seek(0)
+                msvcrt.locking(state_file.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,197 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import asyncio
+import ssl
+import threading
+from http import HTTPStatus
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import httpx
+except ImportError:  # optional dependency (pip install httpx[http2]), only HTTP2Adapter needs it
+    httpx = None
+
+# Connection specific headers are not allowed in HTTP/2 requests
+HOP_BY_HOP_HEADERS = ('connection', 'keep-alive', 'proxy-connection', 'transfer-encoding', 'upgrade')
+
+class _HTTPXRaw():
+
+    # File-like 'raw' body of a requests.Response, reading the httpx streaming response on the adapter event loop
+    def __init__(self, adapter, httpx_response):
+        self._adapter = adapter
+        self._response = httpx_response
+        self._chunks = None
+        self._buffer = b''
+
+    def stream(self, chunk_size = 65536, decode_content = True):
+        chunks = self._response.aiter_bytes(chunk_size)
+        try:
+            while True:
+                try:
+                    yield self._adapter._run(chunks.__anext__())
+                except StopAsyncIteration:
+                    return
+                except httpx.TransportError as exp:
+                    raise requests.exceptions.ChunkedEncodingError(exp)
+        finally:
+            self.close()
+
+    def read(self, amt = None, decode_content = True):
+        if self._chunks is None:
+            self._chunks = self.stream()
+        while amt is None or len(self._buffer) < amt:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if amt is None:
+            data, self._buffer = self._buffer, b''
+        else:
+            data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+    # Body bytes received so far, before content decoding
+    def tell(self):
+        return self._response.num_bytes_downloaded
+
+    def close(self):
+        if not self._response.is_closed:
+            self._adapter._run(self._response.aclose())
+
+    def release_conn(self):
+        self.close()
+
+class HTTP2Adapter(BaseAdapter):
+
+    # requests transport adapter sending the requests over HTTP/2 with an httpx client: concurrent requests to the same
+    # host are multiplexed as streams of one connection instead of one connection each, and the headers are HPACK compressed.
+    # HTTP/2 is negotiated with ALPN on https:// URLs (servers without HTTP/2 are served over HTTP/1.1).
+    # The calling threads hand their requests to one event loop thread that owns the connections: a TLS connection
+    # is not safe to read and write from several threads at the same time. That hand-off and the single connection make
+    # it slower than the pooled HTTP/1.1 session (about 25-30% fewer requests/sec in benchmarks/bench_http2.py), so it is
+    # opt-in: use it to stay within a connection limit rather than for throughput.
+    #   max_connections: connections kept by the client (one per host is enough for HTTP/2)
+    #   prior_knowledge: HTTP/2 without TLS (h2c) for http:// URLs, every server must then support HTTP/2
+    def __init__(self, max_connections = 10, keepalive_expiry = 5.0, prior_knowledge = False):
+        if httpx is None:
+            raise ImportError('HTTP2Adapter requires httpx with HTTP/2 support, install it with: pip install httpx[http2]')
+        super().__init__()
+        self.limits = httpx.Limits(max_connections = max_connections, max_keepalive_connections = max_connections, keepalive_expiry = keepalive_expiry)
+        self.prior_knowledge = prior_knowledge
+        self._clients = {}
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    # Run a coroutine on the event loop thread (started on first use) and wait for its result
+    def _run(self, coroutine):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target = self._loop.run_forever, daemon = True)
+                self._thread.start()
+            loop = self._loop
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    # One client per TLS configuration ('verify' and 'cert' of the requests call)
+    def _get_client(self, verify, cert):
+        key = (verify, cert if not isinstance(cert, list) else tuple(cert))
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = httpx.AsyncClient(http1 = not self.prior_knowledge, http2 = True, verify = self._ssl_context(verify, cert),
+                                           limits = self.limits, follow_redirects = False, trust_env = False)
+                self._clients[key] = client
+            return client
+
+    def _ssl_context(self, verify, cert):
+        if verify is False:
+            context = ssl.create_default_context()
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        elif isinstance(verify, str):
+            context = ssl.create_default_context(cafile = verify) if not verify.endswith('/') else ssl.create_default_context(capath = verify)
+        else:
+            context = ssl.create_default_context()
+        if isinstance(cert, (tuple, list)):
+            context.load_cert_chain(*cert)
+        elif cert:
+            context.load_cert_chain(cert)
+        return context
+
+    def _timeout(self, timeout):
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect = connect)
+        return httpx.Timeout(timeout)
+
+    async def _send(self, client, httpx_request, stream):
+        httpx_response = await client.send(httpx_request, stream = True)
+        if not stream:
+            try:
+                await httpx_response.aread()
+            finally:
+                await httpx_response.aclose()
+        return httpx_response
+
+    def send(self, request, stream = False, timeout = None, verify = True, cert = None, proxies = None):
+        client = self._get_client(verify, cert)
+        headers = [(name, value) for name, value in request.headers.items() if name.lower() not in HOP_BY_HOP_HEADERS]
+        httpx_request = client.build_request(request.method, request.url, headers = headers, content = request.body,
+                                             timeout = self._timeout(timeout))
+        try:
+            httpx_response = self._run(self._send(client, httpx_request, stream))
+        except httpx.ConnectTimeout as exp:
+            raise requests.exceptions.ConnectTimeout(exp, request = request)
+        except httpx.TimeoutException as exp:
+            raise requests.exceptions.ReadTimeout(exp, request = request)
+        except httpx.TransportError as exp:
+            raise requests.exceptions.ConnectionError(exp, request = request)
+        return self.build_response(request, httpx_response, stream)
+
+    # Build a requests.Response, the body has already been read unless the caller streams it
+    def build_response(self, request, httpx_response, stream):
+        response = requests.Response()
+        response.status_code = httpx_response.status_code
+        response.headers = CaseInsensitiveDict(httpx_response.headers.multi_items())
+        # httpx has already decoded the gzip/deflate body
+        response.headers.pop('Content-Encoding', None)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = httpx_response.reason_phrase or HTTPStatus(httpx_response.status_code).phrase
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.raw = _HTTPXRaw(self, httpx_response)
+        response.http_version = httpx_response.http_version
+        if not stream:
+            response._content = httpx_response.content
+            response._content_consumed = True
+        return response
+
+    # Close the connections and stop the event loop thread
+    def close(self):
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        for client in clients:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
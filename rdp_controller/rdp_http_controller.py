@@ -12,14 +12,128 @@ ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR
 
 import requests
 import json
+import logging
+from rdp_controller import rdp_json_stream
+from rdp_controller import rdp_retry
+from rdp_controller import rdp_cache
+from rdp_controller import rdp_single_flight
+from rdp_controller import rdp_search_pager
+from rdp_controller import rdp_metrics
+from rdp_controller import rdp_codec
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
 
 class RDPHTTPController():
 
     # Constructor Method
-    def __init__(self):
+    #   pool_connections: number of per-host connection pools to keep
+    #   pool_maxsize: maximum number of kept-alive connections per host
+    #   pool_block: block (instead of opening throwaway connections) when a host's pool is exhausted
+    #   keep_alive: reuse connections between requests (send 'Connection: close' when False)
+    #   retry_policy: rdp_retry.RetryPolicy for connection errors, HTTP 429 and 5xx (default RetryPolicy(), RetryPolicy(max_retries = 0) disables retries)
+    #   circuit_breaker: optional rdp_retry.CircuitBreaker shared by all requests of this controller
+    #   rate_limiter: optional rdp_rate_limiter.RateLimiter consulted before every request (including retries)
+    #   cache: optional rdp_cache.MemoryCache or rdp_cache.DiskCache for ESG and Search Explore responses
+    #   conditional_requests: opt-in, keep the last ESG body (serialized, see rdp_cache.MemoryCache) and its ETag/Last-Modified
+    #     validators per universe (up to validator_max_entries universes) and re-request with If-None-Match/If-Modified-Since,
+    #     a 304 returns the kept body
+    #   single_flight: concurrent identical authentication, ESG and Search Explore calls share one in-flight request
+    #   instrumentation: rdp_metrics.Instrumentation whose hooks receive the RequestMetrics of every call
+    #     (default: an Instrumentation without hooks, add them with controller.instrumentation.add_hook())
+    #   http2: send https:// requests over HTTP/2 (rdp_http2_transport.HTTP2Adapter, requires httpx[http2]), concurrent
+    #     requests to a host are multiplexed over one connection. http2_prior_knowledge also uses HTTP/2 (h2c) for http:// URLs.
+    #     Off by default: it is about 25-30% slower than the pooled HTTP/1.1 session (benchmarks/bench_http2.py), only
+    #     use it when the number of connections is limited (e.g. a proxy or server connection limit)
+    #     The connect/TLS timings of the instrumentation are not measured on HTTP/2 connections.
+    #   request_compression: content coding ('gzip', 'deflate', 'br' or 'zstd', see rdp_codec.COMPRESSORS) of the Search Explore
+    #     request bodies of at least request_compression_min_size bytes (None sends them uncompressed)
+    # Responses are requested with every content coding that can be decoded (rdp_codec.ACCEPT_ENCODING) and parsed from the bytes.
+    def __init__(self, pool_connections = 10, pool_maxsize = 10, pool_block = False, keep_alive = True, retry_policy = None, circuit_breaker = None,
+                 rate_limiter = None, cache = None, conditional_requests = False, validator_max_entries = 1024, single_flight = True,
+                 instrumentation = None, http2 = False, http2_prior_knowledge = False, request_compression = None, request_compression_min_size = 1024):
+        if request_compression is not None and request_compression not in rdp_codec.COMPRESSORS:
+            raise ValueError(f'Unsupported request_compression: {request_compression}')
         self.scope = 'trapi'
         self.client_secret = ''
-        pass
+        self.session = self._create_session(pool_connections, pool_maxsize, pool_block, keep_alive, http2, http2_prior_knowledge)
+        self.retry_policy = retry_policy if retry_policy is not None else rdp_retry.RetryPolicy()
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.validator_store = rdp_cache.MemoryCache(max_entries = validator_max_entries, ttl = None) if conditional_requests else None
+        self.single_flight = rdp_single_flight.SingleFlight() if single_flight else None
+        self.instrumentation = instrumentation if instrumentation is not None else rdp_metrics.Instrumentation()
+        self.request_compression = request_compression
+        self.request_compression_min_size = request_compression_min_size
+
+    # Create the pooled HTTP session owned by this controller
+    def _create_session(self, pool_connections, pool_maxsize, pool_block, keep_alive, http2 = False, http2_prior_knowledge = False):
+        session = requests.Session()
+        adapter = rdp_metrics.InstrumentedHTTPAdapter(pool_connections = pool_connections, pool_maxsize = pool_maxsize, pool_block = pool_block)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if http2:
+            # httpx and asyncio are only imported when HTTP/2 is enabled
+            from rdp_controller import rdp_http2_transport
+            http2_adapter = rdp_http2_transport.HTTP2Adapter(max_connections = pool_connections, prior_knowledge = http2_prior_knowledge)
+            session.mount('https://', http2_adapter)
+            if http2_prior_knowledge:
+                session.mount('http://', http2_adapter)
+        session.headers['Accept-Encoding'] = rdp_codec.ACCEPT_ENCODING
+        if not keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
+    # Close all pooled connections
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # Send an HTTP request through the pooled session with the retry policy and circuit breaker.
+    # Connection errors that are not retried anymore are raised to the caller.
+    def _send(self, method, url, metrics = None, **kwargs):
+        return self.retry_policy.call(lambda: self._send_once(method, url, metrics, **kwargs), self.circuit_breaker)
+
+    # Run the request function, or wait for the identical request already in flight and get a copy of its result
+    def _coalesce(self, key, request_function, metrics = None):
+        if self.single_flight is None:
+            return request_function()
+        result = self.single_flight.do(key, request_function)
+        if metrics is not None and metrics.attempts == 0:
+            metrics.cache = 'coalesced'
+        return result
+
+    # Cache a successful response, error blocks (e.g. unresolved identifiers) are not cached
+    def _cache_set(self, cache_key, json_data):
+        if self.cache is not None and 'error' not in json_data:
+            self.cache.set(cache_key, json_data)
+
+    # Keep the ETag/Last-Modified validators and the body of a successful response for conditional requests
+    def _store_validators(self, cache_key, response, json_data):
+        if self.validator_store is None or 'error' in json_data:
+            return
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            self.validator_store.set(cache_key, {'etag': etag, 'last_modified': last_modified, 'body': json_data})
+
+    # Send one HTTP request attempt once the rate limiter allows it
+    def _send_once(self, method, url, metrics = None, **kwargs):
+        if self.rate_limiter is None:
+            return self._session_request(method, url, metrics, **kwargs)
+        with self.rate_limiter.limit(url):
+            return self._session_request(method, url, metrics, **kwargs)
+
+    def _session_request(self, method, url, metrics, **kwargs):
+        if metrics is None:
+            return self.session.request(method, url, **kwargs)
+        return rdp_metrics.send_measured(self.session, metrics, method, url, **kwargs)
     
     # Send HTTP Post request to get Access Token (Password Grant and Refresh Grant) from the RDP Auth Service
     def rdp_authentication(self, auth_url, username, password, client_id, old_refresh_token = None):
@@ -27,59 +141,169 @@ class RDPHTTPController():
         if not auth_url or not username or not password or not client_id:
             raise TypeError('Received invalid (None or Empty) arguments')
 
-        access_token = None
-        refresh_token = None
-        expires_in = 0
         if old_refresh_token is None: # For the Password Grant scenario
             payload=f'username={username}&password={password}&grant_type=password&scope={self.scope}&takeExclusiveSignOnControl=true&client_id={client_id}'
         else:  # For the Refresh Token scenario
             payload=f'username={username}&refresh_token={old_refresh_token}&grant_type=refresh_token&client_id={client_id}'
 
+        # Concurrent refreshes with the same credentials share one authentication request
+        with self.instrumentation.measure('authentication', 'POST', auth_url) as metrics:
+            return self._coalesce(('POST', auth_url, client_id, payload), lambda: self._request_authentication(auth_url, client_id, payload, metrics), metrics)
+
+    def _request_authentication(self, auth_url, client_id, payload, metrics = None):
+
+        access_token = None
+        refresh_token = None
+        expires_in = 0
+
         # Send HTTP Request
-        try:
-            response = requests.post(auth_url, 
+        response = self._send('POST', auth_url, metrics,
                 headers = {'Content-Type':'application/x-www-form-urlencoded'}, 
                 data = payload, 
                 auth = (client_id, self.client_secret)
                 )
-        except Exception as exp:
-            print(f'Caught exception: {exp}')
-    
 
         if response.status_code == 200:  # HTTP Status 'OK'
-            print('Authentication success')
-            access_token = response.json()['access_token']
-            refresh_token = response.json()['refresh_token']
-            expires_in = int(response.json()['expires_in'])
+            logger.info('Authentication success')
+            auth_json = rdp_metrics.parse_json(response, metrics)  # Parse the response once
+            access_token = auth_json['access_token']
+            refresh_token = auth_json['refresh_token']
+            expires_in = int(auth_json['expires_in'])
         if response.status_code != 200:
-            print(f'RDP authentication failure: {response.status_code} {response.reason}')
-            print(f'Text: {response.text}')
+            logger.error(f'RDP authentication failure: {response.status_code} {response.reason}')
+            logger.error(f'Text: {response.text}')
             raise requests.exceptions.HTTPError(f'RDP authentication failure: {response.status_code} - {response.text} ', response = response )
         
         return access_token, refresh_token, expires_in
     
     # Send HTTP Get request to the RDP ESG Service
-    def rdp_request_esg(self, esg_url, access_token, universe):
+    # start/end select the periods relative to the latest one (e.g. start = -1, end = 0 for the last two periods), None returns all periods
+    def rdp_request_esg(self, esg_url, access_token, universe, start = None, end = None):
 
         if not esg_url or not access_token or not universe:
             raise TypeError('Received invalid (None or Empty) arguments')
 
         payload = {'universe': universe}
+        if start is not None:
+            payload['start'] = start
+        if end is not None:
+            payload['end'] = end
+        cache_key = rdp_cache.make_cache_key(esg_url, payload)
+        with self.instrumentation.measure('esg', 'GET', esg_url) as metrics:
+            if self.cache is not None:
+                esg_data = self.cache.get(cache_key)
+                if metrics is not None:
+                    metrics.cache = 'miss' if esg_data is None else 'hit'
+                if esg_data is not None:
+                    return esg_data
+
+            return self._coalesce(('GET', esg_url, cache_key, access_token), lambda: self._request_esg(esg_url, access_token, payload, cache_key, metrics), metrics)
+
+    def _request_esg(self, esg_url, access_token, payload, cache_key, metrics = None):
+
+        headers = {'Authorization': f'Bearer {access_token}'}
+        validators = self.validator_store.get(cache_key) if self.validator_store is not None else None
+        if validators is not None:
+            if validators['etag']:
+                headers['If-None-Match'] = validators['etag']
+            if validators['last_modified']:
+                headers['If-Modified-Since'] = validators['last_modified']
+
         # Request data for ESG Score Full Service
-        try:
-            response = requests.get(esg_url, headers={'Authorization': f'Bearer {access_token}'}, params = payload)
-        except Exception as exp:
-            print(f'Caught exception: {exp}')
+        response = self._send('GET', esg_url, metrics, headers = headers, params = payload)
+
+        if response.status_code == 304 and validators is not None:  # HTTP Status 'Not Modified'
+            logger.info('ESG Data from RDP APIs not modified')
+            if metrics is not None:
+                metrics.cache = 'not_modified'
+            esg_data = validators['body']
+            self._cache_set(cache_key, esg_data)
+            return esg_data
+        if response.status_code == 200:  # HTTP Status 'OK'
+            logger.info('Receive ESG Data from RDP APIs')
+        else:
+            logger.error(f'RDP APIs: ESG data request failure: {response.status_code} {response.reason}')
+            logger.error(f'Text: {response.text}')
+            raise requests.exceptions.HTTPError(f'ESG data request failure: {response.status_code} - {response.text} ', response = response )
+
+        esg_data = rdp_metrics.parse_json(response, metrics)
+        self._cache_set(cache_key, esg_data)
+        self._store_validators(cache_key, response, esg_data)
+        return esg_data
+
+    # Send HTTP Get request to the RDP ESG Service and stream the 'data' rows as the body arrives.
+    # Returns a JSONArrayStream iterator, the other response fields ('headers', 'universe', 'error', ...)
+    # are available in its 'fields' dict once the iteration has finished.
+    def rdp_stream_esg(self, esg_url, access_token, universe, chunk_size = 65536):
+
+        if not esg_url or not access_token or not universe:
+            raise TypeError('Received invalid (None or Empty) arguments')
+
+        payload = {'universe': universe}
+        with self.instrumentation.measure('esg_stream', 'GET', esg_url) as metrics:
+            response = self._send('GET', esg_url, metrics, headers={'Authorization': f'Bearer {access_token}'}, params = payload, stream = True)
 
         if response.status_code == 200:  # HTTP Status 'OK'
-            print('Receive ESG Data from RDP APIs')
-            #print(response.json())
+            logger.info('Receive ESG Data stream from RDP APIs')
         else:
-            print(f'RDP APIs: ESG data request failure: {response.status_code} {response.reason}')
-            print(f'Text: {response.text}')
+            logger.error(f'RDP APIs: ESG data request failure: {response.status_code} {response.reason}')
+            logger.error(f'Text: {response.text}')
             raise requests.exceptions.HTTPError(f'ESG data request failure: {response.status_code} - {response.text} ', response = response )
 
-        return response.json()
+        return rdp_json_stream.JSONArrayStream(response.iter_content(chunk_size), 'data', response.encoding or 'utf-8', on_close = response.close)
+
+    # Request ESG data for an arbitrarily large list of RICs. The list is split into chunk_size RICs per request
+    # (comma separated universe), the chunks run concurrently on max_workers threads sharing the pooled session,
+    # and the responses are merged back into one ESG response with the 'headers', 'data' and 'universe' blocks.
+    def rdp_request_esg_bulk(self, esg_url, access_token, universe_list, chunk_size = 50, max_workers = 8):
+
+        if not esg_url or not access_token or not universe_list:
+            raise TypeError('Received invalid (None or Empty) arguments')
+        if chunk_size < 1 or max_workers < 1:
+            raise ValueError('chunk_size and max_workers must be greater than 0')
+
+        # Remove empty and duplicate RICs, keep the request order
+        rics = list(dict.fromkeys(ric for ric in universe_list if ric))
+        if not rics:
+            raise TypeError('Received invalid (None or Empty) arguments')
+        chunks = [','.join(rics[index:index + chunk_size]) for index in range(0, len(rics), chunk_size)]
+
+        with ThreadPoolExecutor(max_workers = min(max_workers, len(chunks))) as executor:
+            esg_responses = list(executor.map(lambda universe: self.rdp_request_esg(esg_url, access_token, universe), chunks))
+
+        return self._merge_esg_responses(chunks, esg_responses)
+
+    # Merge chunked ESG responses, a chunk that returns an error block (e.g. unresolved identifiers) is kept in 'errors'.
+    # 'messages' codes (one entry per data row) are concatenated like the rows and 'links' count is the merged row count,
+    # 'messages' is left out when a chunk has no codes for its rows.
+    def _merge_esg_responses(self, chunks, esg_responses):
+        merged = {'headers': [], 'data': [], 'universe': []}
+        codes = []
+        descriptions = {}
+        for universe, esg_response in zip(chunks, esg_responses):
+            if 'error' in esg_response:
+                merged.setdefault('errors', []).append({'universe': universe, 'error': esg_response['error']})
+                continue
+            for key, value in esg_response.items():
+                if key not in merged and key not in ('links', 'messages'):
+                    merged[key] = value
+            if not merged['headers']:
+                merged['headers'] = esg_response.get('headers', [])
+            data = esg_response.get('data', [])
+            merged['data'].extend(data)
+            merged['universe'].extend(esg_response.get('universe', []))
+            messages = esg_response.get('messages') or {}
+            if codes is not None and len(messages.get('codes', [])) == len(data):
+                codes.extend(messages['codes'])
+                for description in messages.get('descriptions', []):
+                    descriptions.setdefault(description.get('code'), description)
+            else:
+                codes = None
+            if 'links' in esg_response:
+                merged['links'] = dict(esg_response['links'], count = len(merged['data']))
+        if codes:
+            merged['messages'] = {'codes': codes, 'descriptions': list(descriptions.values())}
+        return merged
 
     # Send HTTP Post request to the RDP Search Explore Service
     def rdp_request_search_explore(self, search_url, access_token, payload):
@@ -92,18 +316,66 @@ class RDPHTTPController():
             'Authorization': f'Bearer {access_token}'
         }
 
-        try:
-            response = requests.post(search_url, headers = headers, data = json.dumps(payload))
-        except Exception as exp:
-            print(f'Caught exception: {exp}')
-        
+        cache_key = rdp_cache.make_cache_key(search_url, payload)
+        with self.instrumentation.measure('search_explore', 'POST', search_url) as metrics:
+            if self.cache is not None:
+                search_data = self.cache.get(cache_key)
+                if metrics is not None:
+                    metrics.cache = 'miss' if search_data is None else 'hit'
+                if search_data is not None:
+                    return search_data
+
+            return self._coalesce(('POST', search_url, cache_key, access_token), lambda: self._request_search_explore(search_url, headers, payload, cache_key, metrics), metrics)
+
+    def _request_search_explore(self, search_url, headers, payload, cache_key, metrics = None):
+
+        body = json.dumps(payload)
+        if self.request_compression is not None and len(body) >= self.request_compression_min_size:
+            body = rdp_codec.compress(body, self.request_compression)
+            headers = dict(headers, **{'Content-Encoding': self.request_compression})
+        response = self._send('POST', search_url, metrics, headers = headers, data = body)
+
         if response.status_code == 200:  # HTTP Status 'OK'
-            print('Receive Search Explore Data from RDP APIs')
-            #print(response.json())
+            logger.info('Receive Search Explore Data from RDP APIs')
         else:
-            print(f'RDP APIs: Search Explore request failure: {response.status_code} {response.reason}')
-            print(f'Text: {response.text}')
+            logger.error(f'RDP APIs: Search Explore request failure: {response.status_code} {response.reason}')
+            logger.error(f'Text: {response.text}')
             raise requests.exceptions.HTTPError(f'Search Explore request failure: {response.status_code} - {response.text} ', response = response )
 
-        return response.json()
+        search_data = rdp_metrics.parse_json(response, metrics)
+        self._cache_set(cache_key, search_data)
+        return search_data
+
+    # Page through all Search Explore 'Hits' of the payload query with 'Top'/'Skip', the next page is requested
+    # while the current one is consumed. Returns a SearchExplorePager: iterate it for the hits, or call to_dataframe().
+    def rdp_paginate_search_explore(self, search_url, access_token, payload, page_size = 100, prefetch = 1, max_hits = None):
+
+        if not search_url or not access_token or not payload:
+            raise TypeError('Received invalid (None or Empty) arguments')
+
+        return rdp_search_pager.SearchExplorePager(lambda page_payload: self.rdp_request_search_explore(search_url, access_token, page_payload),
+                                                   payload, page_size, prefetch, max_hits)
+
+    # Send HTTP Post request to the RDP Search Explore Service and stream the 'Hits' as the body arrives.
+    # Returns a JSONArrayStream iterator, 'Total' is available in its 'fields' dict.
+    def rdp_stream_search_explore(self, search_url, access_token, payload, chunk_size = 65536):
+
+        if not search_url or not access_token or not payload:
+            raise TypeError('Received invalid (None or Empty) arguments')
+
+        headers = {
+            'Accept': 'application/json',
+            'Authorization': f'Bearer {access_token}'
+        }
+
+        with self.instrumentation.measure('search_explore_stream', 'POST', search_url) as metrics:
+            response = self._send('POST', search_url, metrics, headers = headers, data = json.dumps(payload), stream = True)
+
+        if response.status_code == 200:  # HTTP Status 'OK'
+            logger.info('Receive Search Explore Data stream from RDP APIs')
+        else:
+            logger.error(f'RDP APIs: Search Explore request failure: {response.status_code} {response.reason}')
+            logger.error(f'Text: {response.text}')
+            raise requests.exceptions.HTTPError(f'Search Explore request failure: {response.status_code} - {response.text} ', response = response )
 
+        return rdp_json_stream.JSONArrayStream(response.iter_content(chunk_size), 'Hits', response.encoding or 'utf-8', on_close = response.close)
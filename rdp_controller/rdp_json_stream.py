@@ -0,0 +1,129 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import codecs
+import json
+
+WHITESPACE = ' \t\n\r'
+
+class JSONArrayStream():
+
+    # Incrementally parse a top-level JSON object from an iterable of byte chunks and yield the items of
+    # one of its array fields (e.g. ESG 'data' rows or Search Explore 'Hits') as they arrive.
+    # The other top-level fields are parsed whole and collected in self.fields; fields that come after
+    # the array (e.g. the ESG 'headers') are only available once the iteration has finished.
+    #   chunks: iterable of bytes, e.g. response.iter_content(chunk_size)
+    #   array_key: name of the top-level array to stream
+    #   on_close: optional callback run when the stream finishes or is closed (e.g. response.close)
+    def __init__(self, chunks, array_key, encoding = 'utf-8', on_close = None):
+        self.array_key = array_key
+        self.fields = {}
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._json_decoder = json.JSONDecoder()
+        self._on_close = on_close
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self._items = self._parse()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._items)
+
+    def close(self):
+        self._items.close()
+
+    # Read the next chunk into the buffer, return False at the end of the stream
+    def _fill(self):
+        if self._eof:
+            return False
+        # Drop the consumed part of the buffer so memory stays flat regardless of the response size
+        if self._pos:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self._buffer += text
+                return True
+        self._buffer += self._decoder.decode(b'', final = True)
+        self._eof = True
+        return False
+
+    # Return the next non-whitespace character without consuming it
+    def _peek(self):
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise json.JSONDecodeError('Unexpected end of JSON data', self._buffer, self._pos)
+
+    def _expect(self, character):
+        if self._peek() != character:
+            raise json.JSONDecodeError(f'Expecting {character!r}', self._buffer, self._pos)
+        self._pos += 1
+
+    # Decode one complete JSON value at the current position, reading more chunks until it is complete
+    def _decode_value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+                # A value ending at the buffer end may be a truncated number or literal, confirm with more data
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            # Read at least as much again as is pending, so large values are not re-parsed once per chunk
+            pending = len(self._buffer) - self._pos
+            while self._fill() and len(self._buffer) - self._pos < 2 * pending:
+                pass
+
+    def _parse(self):
+        try:
+            self._expect('{')
+            if self._peek() == '}':
+                return
+            while True:
+                key = self._decode_value()
+                self._expect(':')
+                if key == self.array_key and self._peek() == '[':
+                    self._pos += 1
+                    if self._peek() == ']':
+                        self._pos += 1
+                    else:
+                        while True:
+                            yield self._decode_value()
+                            separator = self._peek()
+                            self._pos += 1
+                            if separator == ']':
+                                break
+                            if separator != ',':
+                                raise json.JSONDecodeError("Expecting ',' or ']'", self._buffer, self._pos - 1)
+                else:
+                    self.fields[key] = self._decode_value()
+                separator = self._peek()
+                self._pos += 1
+                if separator == '}':
+                    return
+                if separator != ',':
+                    raise json.JSONDecodeError("Expecting ',' or '}'", self._buffer, self._pos - 1)
+        finally:
+            if self._on_close is not None:
+                self._on_close()
@@ -0,0 +1,287 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import heapq
+import json
+import logging
+import threading
+import time
+from collections import Counter, deque
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from rdp_controller import rdp_codec
+
+logger = logging.getLogger(__name__)
+
+# The RequestMetrics of the request being sent by the current thread, read by the timed connections
+_local = threading.local()
+
+class RequestMetrics():
+
+    # Measurements of one controller call (e.g. one rdp_request_esg call including its retries).
+    #   operation: 'authentication', 'esg', 'esg_stream', 'search_explore' or 'search_explore_stream'
+    #   attempts: HTTP requests sent (0 when served from the cache or by an identical request in flight)
+    #   cache: None, 'hit', 'miss', 'not_modified' (HTTP 304) or 'coalesced' (single-flight)
+    #   request_bytes, response_bytes: body sizes as sent and received on the wire (compressed when a content coding is used)
+    #   timings: seconds spent in 'connect' (DNS and TCP), 'tls', 'ttfb' (request sent to response headers),
+    #     'download', 'json_parse' and 'total' (the whole call, including retry backoff)
+    def __init__(self, operation, method, url):
+        self.operation = operation
+        self.method = method
+        self.url = url
+        self.status_code = None
+        self.attempts = 0
+        self.cache = None
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.error = None
+        self.timings = dict.fromkeys(('connect', 'tls', 'ttfb', 'download', 'json_parse', 'total'), 0.0)
+
+    @property
+    def retries(self):
+        return max(self.attempts - 1, 0)
+
+    def to_dict(self):
+        return {'operation': self.operation, 'method': self.method, 'url': self.url, 'status_code': self.status_code,
+                'attempts': self.attempts, 'retries': self.retries, 'cache': self.cache, 'request_bytes': self.request_bytes,
+                'response_bytes': self.response_bytes, 'error': self.error, 'timings': dict(self.timings)}
+
+class _Measurement():
+
+    # Time one controller call and pass its RequestMetrics to the hooks when the call ends
+    def __init__(self, instrumentation, metrics):
+        self.instrumentation = instrumentation
+        self.metrics = metrics
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self.metrics
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.metrics.timings['total'] = time.perf_counter() - self.start
+        if exc_type is not None:
+            self.metrics.error = exc_type.__name__
+        self.instrumentation.emit(self.metrics)
+
+class _NullMeasurement():
+
+    # Used when no hook is registered, the controller then skips every measurement
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+_NULL_MEASUREMENT = _NullMeasurement()
+
+class Instrumentation():
+
+    # Hooks receiving the RequestMetrics of every controller call. A hook is any callable taking one
+    # RequestMetrics argument (e.g. LoggingExporter, MetricsCollector). Without hooks nothing is measured.
+    def __init__(self, hooks = None):
+        self.hooks = tuple(hooks or ())
+        self._lock = threading.Lock()
+
+    # Hooks are replaced (not modified in place), so emit() can iterate them without locking
+    def add_hook(self, hook):
+        with self._lock:
+            self.hooks = self.hooks + (hook,)
+        return hook
+
+    def remove_hook(self, hook):
+        with self._lock:
+            self.hooks = tuple(registered for registered in self.hooks if registered != hook)
+
+    def measure(self, operation, method, url):
+        if not self.hooks:
+            return _NULL_MEASUREMENT
+        return _Measurement(self, RequestMetrics(operation, method, url))
+
+    # A failing hook is logged and never fails the request
+    def emit(self, metrics):
+        for hook in self.hooks:
+            try:
+                hook(metrics)
+            except Exception:
+                logger.exception('RDP instrumentation hook failure')
+
+class LoggingExporter():
+
+    # Log every RequestMetrics as one JSON line
+    def __init__(self, logger = logger, level = logging.INFO):
+        self.logger = logger
+        self.level = level
+
+    def __call__(self, metrics):
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, json.dumps(metrics.to_dict()))
+
+class MetricsCollector():
+
+    # Aggregate RequestMetrics per operation: latency percentiles of the last max_samples calls,
+    # status codes, cache outcomes, retries and errors, and keep the slowest_count slowest calls
+    def __init__(self, max_samples = 10000, slowest_count = 10):
+        self.max_samples = max_samples
+        self.slowest_count = slowest_count
+        self._operations = {}
+        self._slowest = []
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, metrics):
+        with self._lock:
+            operation = self._operations.get(metrics.operation)
+            if operation is None:
+                operation = self._operations[metrics.operation] = {'count': 0, 'errors': 0, 'retries': 0, 'request_bytes': 0, 'response_bytes': 0,
+                                                                   'totals': deque(maxlen = self.max_samples), 'status_codes': Counter(), 'cache': Counter()}
+            operation['count'] += 1
+            operation['errors'] += metrics.error is not None
+            operation['retries'] += metrics.retries
+            operation['request_bytes'] += metrics.request_bytes
+            operation['response_bytes'] += metrics.response_bytes
+            operation['totals'].append(metrics.timings['total'])
+            if metrics.status_code is not None:
+                operation['status_codes'][metrics.status_code] += 1
+            if metrics.cache is not None:
+                operation['cache'][metrics.cache] += 1
+            # Min-heap of the slowest calls, the sequence number breaks ties between equal totals
+            self._sequence += 1
+            entry = (metrics.timings['total'], self._sequence, metrics)
+            if len(self._slowest) < self.slowest_count:
+                heapq.heappush(self._slowest, entry)
+            elif entry[0] > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    # Per operation: count, errors, retries, bytes, p50/p90/p99/max total milliseconds, status codes and cache outcomes
+    def summary(self):
+        with self._lock:
+            summary = {}
+            for name, operation in self._operations.items():
+                totals = sorted(operation['totals'])
+                summary[name] = {
+                    'count': operation['count'],
+                    'errors': operation['errors'],
+                    'retries': operation['retries'],
+                    'request_bytes': operation['request_bytes'],
+                    'response_bytes': operation['response_bytes'],
+                    'p50_ms': _percentile(totals, 50) * 1000,
+                    'p90_ms': _percentile(totals, 90) * 1000,
+                    'p99_ms': _percentile(totals, 99) * 1000,
+                    'max_ms': totals[-1] * 1000 if totals else 0.0,
+                    'status_codes': dict(operation['status_codes']),
+                    'cache': dict(operation['cache'])
+                }
+            return summary
+
+    # The slowest calls seen, slowest first
+    def slowest(self):
+        with self._lock:
+            return [metrics for total, sequence, metrics in sorted(self._slowest, reverse = True)]
+
+    def reset(self):
+        with self._lock:
+            self._operations.clear()
+            self._slowest.clear()
+
+# Nearest-rank percentile of sorted values
+def _percentile(sorted_values, percent):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(int(-(-percent * len(sorted_values) // 100)), 1) - 1]
+
+def _current_metrics():
+    return getattr(_local, 'metrics', None)
+
+class TimedHTTPConnection(HTTPConnection):
+
+    # Add the DNS lookup and TCP connect time of a new connection to the current request's metrics
+    def _new_conn(self):
+        start = time.perf_counter()
+        sock = super()._new_conn()
+        metrics = _current_metrics()
+        if metrics is not None:
+            metrics.timings['connect'] += time.perf_counter() - start
+        return sock
+
+class TimedHTTPSConnection(HTTPSConnection):
+
+    # connect() opens the socket with _new_conn() and then runs the TLS handshake
+    def _new_conn(self):
+        start = time.perf_counter()
+        sock = super()._new_conn()
+        self._connect_time = time.perf_counter() - start
+        return sock
+
+    def connect(self):
+        self._connect_time = 0.0
+        start = time.perf_counter()
+        super().connect()
+        metrics = _current_metrics()
+        if metrics is not None:
+            metrics.timings['connect'] += self._connect_time
+            metrics.timings['tls'] += time.perf_counter() - start - self._connect_time
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+class InstrumentedHTTPAdapter(HTTPAdapter):
+
+    # HTTPAdapter whose new connections report their connect and TLS handshake times
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': TimedHTTPConnectionPool, 'https': TimedHTTPSConnectionPool}
+
+# Send one HTTP request attempt with session and add its timings and sizes to metrics.
+# response.elapsed covers connect, TLS and the wait for the response headers, the body is read after it.
+def send_measured(session, metrics, method, url, **kwargs):
+    connect_before = metrics.timings['connect'] + metrics.timings['tls']
+    _local.metrics = metrics
+    start = time.perf_counter()
+    try:
+        response = session.request(method, url, **kwargs)
+    finally:
+        _local.metrics = None
+        metrics.attempts += 1
+    total = time.perf_counter() - start
+    headers_time = response.elapsed.total_seconds()
+    metrics.timings['ttfb'] += max(headers_time - (metrics.timings['connect'] + metrics.timings['tls'] - connect_before), 0.0)
+    metrics.status_code = response.status_code
+    body = response.request.body
+    metrics.request_bytes = len(body) if body else 0
+    if kwargs.get('stream'):
+        metrics.response_bytes = int(response.headers.get('Content-Length', 0))
+    else:
+        metrics.timings['download'] += max(total - headers_time, 0.0)
+        metrics.response_bytes = _wire_bytes(response)
+    return response
+
+# Size of the read response body as received on the wire (before content decoding), the transport raw body reports
+# the bytes it read with tell(), Content-Length or the decoded size are the fallbacks
+def _wire_bytes(response):
+    content = response.content
+    tell = getattr(response.raw, 'tell', None)
+    if tell is not None:
+        return tell()
+    return int(response.headers.get('Content-Length', len(content)))
+
+# Parse the JSON body from the response bytes and add the parse time to metrics (when measured)
+def parse_json(response, metrics):
+    if metrics is None:
+        return rdp_codec.loads(response.content)
+    start = time.perf_counter()
+    json_data = rdp_codec.loads(response.content)
+    metrics.timings['json_parse'] += time.perf_counter() - start
+    return json_data
@@ -0,0 +1,123 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from rdp_controller import rdp_file_lock
+
+class TokenBucket():
+
+    # Allow 'rate' requests per second on average with bursts of up to 'capacity' requests (default: one second of rate)
+    def __init__(self, rate, capacity = None, clock = time.monotonic):
+        if rate <= 0:
+            raise ValueError('rate must be greater than 0')
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1)
+        self.clock = clock
+        self.tokens = self.capacity
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    # Take one token, return 0 when taken or the seconds to wait before a token is available
+    def try_acquire(self):
+        with self._lock:
+            self.tokens, self.updated, wait = self._take(self.tokens, self.updated, self.clock())
+            return wait
+
+    # Tokens available now, without taking one
+    def available(self):
+        with self._lock:
+            return min(self.capacity, self.tokens + (self.clock() - self.updated) * self.rate)
+
+    def _take(self, tokens, updated, now):
+        tokens = min(self.capacity, tokens + (now - updated) * self.rate)
+        # Tolerate floating point rounding, so waiting exactly (1 - tokens) / rate always yields a token
+        if tokens >= 1 - 1e-9:
+            return max(tokens - 1, 0), now, 0
+        return tokens, now, (1 - tokens) / self.rate
+
+class FileTokenBucket(TokenBucket):
+
+    # A TokenBucket whose state lives in a file guarded by an inter-process lock, so every process on
+    # the host that uses the same path shares one quota. Uses the wall clock, which all processes share.
+    def __init__(self, path, rate, capacity = None, clock = time.time):
+        super().__init__(rate, capacity, clock)
+        self.path = path
+
+    def try_acquire(self):
+        with rdp_file_lock.locked_file(self.path) as state_file:
+            content = state_file.read()
+            now = self.clock()
+            state = json.loads(content) if content else {'tokens': self.capacity, 'updated': now}
+            tokens, updated, wait = self._take(state['tokens'], state['updated'], now)
+            state_file.seek(0)
+            state_file.truncate()
+            state_file.write(json.dumps({'tokens': tokens, 'updated': updated}).encode('utf-8'))
+            return wait
+
+    def available(self):
+        with rdp_file_lock.locked_file(self.path) as state_file:
+            content = state_file.read()
+        if not content:
+            return self.capacity
+        state = json.loads(content)
+        return min(self.capacity, state['tokens'] + (self.clock() - state['updated']) * self.rate)
+
+class EndpointLimit():
+
+    # Requests/sec (token bucket) and in-flight request limits of one endpoint
+    def __init__(self, bucket = None, max_concurrency = None):
+        self.bucket = bucket
+        self.semaphore = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+
+class RateLimiter():
+
+    # Client-side rate limiter consulted by RDPHTTPController before every request.
+    # Limits are registered per endpoint URL prefix, the longest matching prefix applies.
+    def __init__(self, sleep = time.sleep):
+        self.sleep = sleep
+        self.limits = {}
+
+    # Register a limit for URLs starting with url_prefix.
+    #   rate/capacity: requests per second and burst size, or pass a shared bucket (e.g. FileTokenBucket)
+    #   max_concurrency: maximum number of requests in flight from this process
+    def add_limit(self, url_prefix, rate = None, capacity = None, max_concurrency = None, bucket = None):
+        if bucket is None and rate is not None:
+            bucket = TokenBucket(rate, capacity)
+        self.limits[url_prefix] = EndpointLimit(bucket, max_concurrency)
+        return self
+
+    def get_limit(self, url):
+        matches = [prefix for prefix in self.limits if url.startswith(prefix)]
+        return self.limits[max(matches, key = len)] if matches else None
+
+    # Block until the request to url is allowed, hold its concurrency slot while the block runs
+    @contextmanager
+    def limit(self, url):
+        endpoint_limit = self.get_limit(url)
+        if endpoint_limit is None:
+            yield
+            return
+        if endpoint_limit.semaphore is not None:
+            endpoint_limit.semaphore.acquire()
+        try:
+            if endpoint_limit.bucket is not None:
+                wait = endpoint_limit.bucket.try_acquire()
+                while wait > 0:
+                    self.sleep(wait)
+                    wait = endpoint_limit.bucket.try_acquire()
+            yield
+        finally:
+            if endpoint_limit.semaphore is not None:
+                endpoint_limit.semaphore.release()
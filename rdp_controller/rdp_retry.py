@@ -0,0 +1,175 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Raised instead of sending a request while the circuit breaker is open
+class CircuitOpenError(requests.exceptions.RequestException):
+    pass
+
+class RetryBudget():
+
+    # Limit retries to a ratio of the original requests so retries cannot amplify the load during an outage.
+    # Every original request deposits 'ratio' tokens (up to max_tokens), every retry withdraws one token.
+    def __init__(self, ratio = 0.2, min_tokens = 10, max_tokens = 100):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = min_tokens
+        self._lock = threading.Lock()
+
+    def on_request(self):
+        with self._lock:
+            self.tokens = min(self.tokens + self.ratio, self.max_tokens)
+
+    def try_spend(self):
+        with self._lock:
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+class CircuitBreaker():
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    # Stop sending requests after failure_threshold consecutive failures (connection errors, HTTP 429/5xx).
+    # After reset_timeout seconds one trial request is let through, a success closes the circuit again.
+    def __init__(self, failure_threshold = 5, reset_timeout = 30, clock = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0
+        self._lock = threading.Lock()
+
+    def allow_request(self):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and self.clock() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN # Let this one trial request through
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = self.clock()
+
+    # The trial request ended without a result (an unexpected exception), the next request is let through as the trial
+    def release_trial(self):
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+
+class RetryPolicy():
+
+    # Retry connection errors and retry_statuses responses up to max_retries times with full-jitter exponential backoff
+    # (a random wait between 0 and backoff_factor * 2^attempt, capped at max_backoff seconds).
+    # A Retry-After header is honoured when present, responses asking to wait longer than max_backoff are not retried.
+    def __init__(self, max_retries = 3, backoff_factor = 0.5, max_backoff = 30, retry_statuses = (429, 500, 502, 503, 504),
+                 budget = None, jitter = random.random, sleep = time.sleep):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.budget = budget
+        self.jitter = jitter
+        self.sleep = sleep
+
+    def is_retryable_status(self, status_code):
+        return status_code in self.retry_statuses
+
+    # Seconds to wait before retry number attempt + 1, or None when the request must not be retried
+    def get_backoff(self, attempt, response = None):
+        if attempt >= self.max_retries:
+            return None
+        retry_after = self.parse_retry_after(response)
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_backoff else None
+        return self.jitter() * min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+
+    # Retry-After is either delay-seconds or an HTTP date
+    def parse_retry_after(self, response):
+        if response is None:
+            return None
+        retry_after = response.headers.get('Retry-After')
+        if not retry_after:
+            return None
+        try:
+            return max(float(retry_after), 0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0)
+        except (TypeError, ValueError):
+            return None
+
+    # Send one request through send_function with retries, circuit_breaker is optional
+    def call(self, send_function, circuit_breaker = None):
+        if self.budget is not None:
+            self.budget.on_request()
+        attempt = 0
+        while True:
+            if circuit_breaker is not None and not circuit_breaker.allow_request():
+                raise CircuitOpenError('Circuit breaker is open, request not sent')
+            try:
+                response = send_function()
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as exp:
+                if circuit_breaker is not None:
+                    circuit_breaker.record_failure()
+                backoff = self._next_backoff(attempt)
+                if backoff is None:
+                    raise
+                logger.warning(f'Caught exception: {exp}, retry in {backoff:.2f} seconds')
+            except BaseException:
+                # Neither a success nor a failure, do not keep the HALF_OPEN trial slot forever
+                if circuit_breaker is not None:
+                    circuit_breaker.release_trial()
+                raise
+            else:
+                if not self.is_retryable_status(response.status_code):
+                    if circuit_breaker is not None:
+                        circuit_breaker.record_success()
+                    return response
+                if circuit_breaker is not None:
+                    circuit_breaker.record_failure()
+                backoff = self._next_backoff(attempt, response)
+                if backoff is None:
+                    return response
+                logger.warning(f'Receive HTTP {response.status_code}, retry in {backoff:.2f} seconds')
+                response.close()
+            self.sleep(backoff)
+            attempt += 1
+
+    def _next_backoff(self, attempt, response = None):
+        backoff = self.get_backoff(attempt, response)
+        if backoff is None or (self.budget is not None and not self.budget.try_spend()):
+            return None
+        return backoff
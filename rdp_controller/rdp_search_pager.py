@@ -0,0 +1,125 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+class SearchExplorePager():
+
+    # Iterate over all Search Explore 'Hits' of a query, page by page with 'Top'/'Skip'.
+    #   request_page: function sending one Search Explore payload and returning the JSON response
+    #   page_size: 'Top' of each page request
+    #   prefetch: pages requested on a background thread ahead of the page being consumed,
+    #     at most prefetch + 1 pages are held in memory (prefetch = 0 requests the pages on demand)
+    #   max_hits: stop after this many hits (default: the 'Total' of the first page)
+    # 'total' is available once the first page has been received.
+    def __init__(self, request_page, payload, page_size = 100, prefetch = 1, max_hits = None):
+        if not request_page or not payload:
+            raise TypeError('Received invalid (None or Empty) arguments')
+        if page_size < 1 or prefetch < 0 or (max_hits is not None and max_hits < 1):
+            raise ValueError('page_size and max_hits must be greater than 0 and prefetch must not be negative')
+
+        self.request_page = request_page
+        self.payload = {key: value for key, value in payload.items() if key not in ('Top', 'Skip')}
+        self.page_size = page_size
+        self.prefetch = prefetch
+        self.max_hits = max_hits
+        self.total = None
+        self._executor = None
+
+    def __iter__(self):
+        for hits in self.pages():
+            yield from hits
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # Stop the background page requests
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait = False, cancel_futures = True)
+            self._executor = None
+
+    # Yield the 'Hits' list of every page
+    def pages(self):
+        first_page = self._request(0, self._limit(self.page_size))
+        self.total = first_page.get('Total', 0)
+        limit = self._limit(self.total)
+        hits = first_page.get('Hits', [])
+        del first_page
+
+        skips = iter(range(self.page_size, limit, self.page_size))
+        if self.prefetch:
+            self._executor = ThreadPoolExecutor(max_workers = 1)
+        pending = []
+        try:
+            while True:
+                # Request the following pages before the caller consumes the current page
+                while self._executor is not None and len(pending) < self.prefetch:
+                    skip = next(skips, None)
+                    if skip is None:
+                        break
+                    pending.append(self._executor.submit(self._request, skip, min(self.page_size, limit - skip)))
+
+                yield hits
+                if len(hits) < self.page_size:
+                    return # Short page: the result set ended before 'Total' hits
+
+                if self._executor is not None:
+                    if not pending:
+                        return
+                    hits = pending.pop(0).result().get('Hits', [])
+                else:
+                    skip = next(skips, None)
+                    if skip is None:
+                        return
+                    hits = self._request(skip, min(self.page_size, limit - skip)).get('Hits', [])
+        finally:
+            self.close()
+
+    # Build a DataFrame page by page, only the column lists are kept instead of every hit dict.
+    # columns default to the 'Select' fields of the payload, or the fields of the hits in order of appearance.
+    # Repeated string values are stored as categories.
+    def to_dataframe(self, columns = None):
+        if columns is None and self.payload.get('Select'):
+            columns = [field.strip() for field in self.payload['Select'].split(',')]
+        data = {field: [] for field in columns or []}
+        row_count = 0
+        for hits in self.pages():
+            for hit in hits:
+                if columns is None:
+                    for field in hit:
+                        if field not in data:
+                            data[field] = [None] * row_count
+                for field, values in data.items():
+                    values.append(hit.get(field))
+                row_count += 1
+        # pandas is imported on first use, so paging through the raw hits does not pay its import time
+        import pandas as pd
+        return pd.DataFrame({field: self._build_column(values) for field, values in data.items()}, columns = list(data), copy = False)
+
+    def _build_column(self, values):
+        from rdp_controller import rdp_dataframe
+        if values and all(value is None or isinstance(value, str) for value in values):
+            return rdp_dataframe.build_column(values, 'string')
+        return rdp_dataframe.build_column(values, None)
+
+    def _limit(self, count):
+        return count if self.max_hits is None else min(count, self.max_hits)
+
+    def _request(self, skip, top):
+        page_payload = dict(self.payload)
+        page_payload['Top'] = top
+        page_payload['Skip'] = skip
+        return self.request_page(page_payload)
@@ -0,0 +1,72 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import copy
+import threading
+
+class _Call():
+
+    # One in-flight call, the number of callers waiting for it and its outcome
+    def __init__(self):
+        self.done = threading.Event()
+        self.waiters = 0
+        self.result = None
+        self.error = None
+
+class SingleFlight():
+
+    # Request coalescing: concurrent calls with the same key share one execution of the function.
+    # The first caller runs the function, the others wait for it and get a deep copy of its result
+    # (or a copy of its exception chained from the original), so no caller can modify another caller's data.
+    def __init__(self):
+        self.shared_calls = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, function):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+            else:
+                call.waiters += 1
+                self.shared_calls += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise self._copy_error(call.error) from call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            # No caller can join once the call is removed, the result is only copied when it is shared
+            with self._lock:
+                del self._calls[key]
+                waiters = call.waiters
+            call.done.set()
+        return copy.deepcopy(call.result) if waiters else call.result
+
+    # A waiter raises its own copy of the shared exception, so the tracebacks of the callers are not mixed up
+    # in one exception object. The shared exception is raised when it cannot be copied.
+    @staticmethod
+    def _copy_error(error):
+        try:
+            return copy.copy(error)
+        except Exception:
+            return error
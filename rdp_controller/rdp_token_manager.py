@@ -0,0 +1,196 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import logging
+import threading
+import time
+import requests
+from rdp_controller import rdp_search_pager
+from rdp_controller import rdp_esg_sync
+
+logger = logging.getLogger(__name__)
+
+class RDPTokenManager():
+
+    # Constructor Method
+    #   controller: the RDPHTTPController used to call the RDP Auth Service
+    #   refresh_margin: seconds before expires_in elapses to renew the token in the background
+    #   clock: monotonic time source (replaceable in tests)
+    #   token_store: rdp_token_store.TokenStore shared with other processes, a still valid stored Access Token is reused and
+    #     an expired one is renewed with the stored Refresh Token, the Password Grant is only used when both fail
+    def __init__(self, controller, auth_url, username, password, client_id, refresh_margin = 60, clock = time.monotonic, token_store = None):
+        if not controller or not auth_url or not username or not password or not client_id:
+            raise TypeError('Received invalid (None or Empty) arguments')
+
+        self.controller = controller
+        self.auth_url = auth_url
+        self.username = username
+        self.password = password
+        self.client_id = client_id
+        self.refresh_margin = refresh_margin
+        self.clock = clock
+        self.token_store = token_store
+
+        self.access_token = None
+        self.refresh_token = None
+        self.expires_at = 0
+        self._lock = threading.Lock()
+        self._timer = None
+        self._stopped = False
+
+    # Login with the Password Grant (or reuse the token store tokens) and schedule the background refresh
+    def start(self):
+        self._stopped = False
+        with self._lock:
+            if self.token_store is not None:
+                self._renew()
+            else:
+                self._login(None)
+        return self
+
+    # Cancel the background refresh
+    def stop(self):
+        self._stopped = True
+        with self._lock:
+            self._cancel_timer()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def is_valid(self):
+        return self.access_token is not None and self.clock() < self.expires_at
+
+    # Return a valid Access Token. The cached token is returned without locking, callers only
+    # block when there is no valid token at all (first call or after the background refresh failed).
+    def get_access_token(self):
+        access_token = self.access_token
+        if access_token is not None and self.clock() < self.expires_at:
+            return access_token
+        with self._lock:
+            if not self.is_valid():
+                self._renew()
+            return self.access_token
+
+    # Mark the token rejected by the server (HTTP 401) as invalid and renew it. Concurrent callers
+    # that hit 401 with the same token trigger only one renewal.
+    def invalidate(self, access_token):
+        with self._lock:
+            if access_token == self.access_token:
+                self._renew(rejected_token = access_token)
+            return self.access_token
+
+    # Request ESG data with the managed token, renewing the token once on HTTP 401
+    def request_esg(self, esg_url, universe, start = None, end = None):
+        return self._call_with_token(lambda token: self.controller.rdp_request_esg(esg_url, token, universe, start, end))
+
+    # Request Search Explore data with the managed token, renewing the token once on HTTP 401
+    def request_search_explore(self, search_url, payload):
+        return self._call_with_token(lambda token: self.controller.rdp_request_search_explore(search_url, token, payload))
+
+    # Incremental ESG sync with the managed token, see rdp_esg_sync.ESGSync
+    def esg_sync(self, esg_url, state_path = None, recent_periods = 2, chunk_size = 50, update_column = None):
+        return rdp_esg_sync.ESGSync(lambda universe, start, end: self.request_esg(esg_url, universe, start, end),
+                                    state_path, recent_periods, chunk_size, update_column)
+
+    # Page through all Search Explore 'Hits' with the managed token, every page renews the token once on HTTP 401
+    def paginate_search_explore(self, search_url, payload, page_size = 100, prefetch = 1, max_hits = None):
+        return rdp_search_pager.SearchExplorePager(lambda page_payload: self.request_search_explore(search_url, page_payload),
+                                                   payload, page_size, prefetch, max_hits)
+
+    def _call_with_token(self, request_function):
+        access_token = self.get_access_token()
+        try:
+            return request_function(access_token)
+        except requests.exceptions.HTTPError as exp:
+            if exp.response is None or exp.response.status_code != 401:
+                raise
+        return request_function(self.invalidate(access_token))
+
+    # Must be called with self._lock held. With a token store, the store stays locked while renewing so only one
+    # process logs in, the others reuse its tokens.
+    def _renew(self, rejected_token = None):
+        if self.token_store is None:
+            self._renew_tokens()
+            return
+        with self.token_store.entry(self.auth_url, self.username, self.client_id) as entry:
+            if rejected_token is not None and entry.get('access_token') == rejected_token:
+                entry.pop('access_token')
+                entry.pop('expires_at', None)
+            if self._adopt(entry):
+                return
+            if entry.get('refresh_token') is not None:
+                self.refresh_token = entry['refresh_token']
+            self._renew_tokens()
+            expires_in = self.expires_at - self.clock()
+            entry.update(access_token = self.access_token, refresh_token = self.refresh_token, expires_at = self.token_store.clock() + expires_in)
+
+    # Use the stored tokens of another process (or of a previous run) unless they are the current ones or expire
+    # within refresh_margin seconds
+    def _adopt(self, entry):
+        access_token = entry.get('access_token')
+        if access_token is None or access_token == self.access_token:
+            return False
+        expires_in = entry['expires_at'] - self.token_store.clock()
+        if expires_in <= self.refresh_margin:
+            return False
+        self.access_token = access_token
+        self.refresh_token = entry.get('refresh_token')
+        self.expires_at = self.clock() + expires_in
+        self._schedule_refresh(expires_in)
+        return True
+
+    # Renew with the Refresh Grant when possible, fall back to the Password Grant
+    def _renew_tokens(self):
+        if self.refresh_token is not None:
+            try:
+                self._login(self.refresh_token)
+                return
+            except requests.exceptions.HTTPError as exp:
+                logger.warning(f'RDP token refresh failure, login with password: {exp}')
+        self._login(None)
+
+    # Must be called with self._lock held
+    def _login(self, old_refresh_token):
+        access_token, refresh_token, expires_in = self.controller.rdp_authentication(self.auth_url, self.username, self.password, self.client_id, old_refresh_token)
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self.expires_at = self.clock() + expires_in
+        self._schedule_refresh(expires_in)
+
+    def _schedule_refresh(self, expires_in):
+        self._cancel_timer()
+        if self._stopped:
+            return
+        # At least half the token lifetime (and 1 second), so a refresh_margin close to or above expires_in
+        # does not renew the token in a tight loop against the RDP Auth Service
+        delay = max(expires_in - self.refresh_margin, expires_in / 2, 1)
+        self._timer = threading.Timer(delay, self._background_refresh)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _background_refresh(self):
+        with self._lock:
+            if self._stopped:
+                return
+            try:
+                self._renew()
+            except Exception as exp:
+                # Keep serving the current token, get_access_token() renews synchronously once it expires
+                logger.error(f'RDP background token refresh failure: {exp}')
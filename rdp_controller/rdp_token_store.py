@@ -0,0 +1,103 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from contextlib import contextmanager
+from rdp_controller import rdp_file_lock
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # optional dependency, only TokenStore requires it
+    Fernet = None
+
+logger = logging.getLogger(__name__)
+
+class TokenStore():
+
+    # Encrypted on-disk store of the RDP Access and Refresh Tokens, shared by every process that uses the same path and key,
+    # so short-lived processes reuse a valid token (or renew it with the Refresh Grant) instead of a Password Grant login.
+    #   path: the token file, the whole file is one Fernet (AES-128-CBC + HMAC-SHA256) token guarded by an inter-process lock
+    #   key: Fernet key (generate_key()), keep it outside the token file, e.g. in a secret or an environment variable
+    #   clock: wall clock, the token expiry is stored as seconds since the epoch so every process can check it
+    # Entries are keyed by a hash of the Auth URL, the username and the client id, the password is never stored.
+    # A file that cannot be decrypted (other key, partial write) is treated as empty and overwritten.
+    def __init__(self, path, key, clock = time.time):
+        if Fernet is None:
+            raise ImportError('TokenStore requires the cryptography package: pip install cryptography')
+        if not path or not key:
+            raise TypeError('Received invalid (None or Empty) arguments')
+        self.path = path
+        self.clock = clock
+        self._fernet = Fernet(key)
+
+    @staticmethod
+    def generate_key():
+        if Fernet is None:
+            raise ImportError('TokenStore requires the cryptography package: pip install cryptography')
+        return Fernet.generate_key().decode('ascii')
+
+    @staticmethod
+    def make_key(auth_url, username, client_id):
+        return hashlib.sha256(json.dumps([auth_url, username, client_id]).encode('utf-8')).hexdigest()
+
+    # Hold the inter-process lock and yield the entry (a dict with access_token, refresh_token and expires_at, empty
+    # when nothing is stored) of the account, the entry is written back when the block exits
+    @contextmanager
+    def entry(self, auth_url, username, client_id):
+        entry_key = self.make_key(auth_url, username, client_id)
+        with rdp_file_lock.locked_file(self.path) as token_file:
+            entries = self._decrypt(token_file.read())
+            entry = dict(entries.get(entry_key, {}))
+            try:
+                yield entry
+            finally:
+                if entry != entries.get(entry_key, {}):
+                    if entry:
+                        entries[entry_key] = entry
+                    else:
+                        entries.pop(entry_key, None)
+                    token_file.seek(0)
+                    token_file.truncate()
+                    token_file.write(self._fernet.encrypt(json.dumps(entries).encode('utf-8')))
+
+    # The stored entry of the account (empty dict when nothing is stored)
+    def load(self, auth_url, username, client_id):
+        with self.entry(auth_url, username, client_id) as entry:
+            return dict(entry)
+
+    def save(self, auth_url, username, client_id, access_token, refresh_token, expires_at):
+        with self.entry(auth_url, username, client_id) as entry:
+            entry.update(access_token = access_token, refresh_token = refresh_token, expires_at = expires_at)
+
+    # Forget the Access Token of the account (e.g. rejected with HTTP 401), keep the Refresh Token.
+    # With access_token set, only that token is forgotten so a newer token stored by another process stays.
+    def invalidate(self, auth_url, username, client_id, access_token = None):
+        with self.entry(auth_url, username, client_id) as entry:
+            if entry.get('access_token') is not None and access_token in (None, entry['access_token']):
+                entry.pop('access_token')
+                entry.pop('expires_at', None)
+
+    def clear(self, auth_url, username, client_id):
+        with self.entry(auth_url, username, client_id) as entry:
+            entry.clear()
+
+    def _decrypt(self, content):
+        if not content:
+            return {}
+        try:
+            return json.loads(self._fernet.decrypt(content))
+        except (InvalidToken, ValueError):
+            logger.warning(f'Cannot decrypt the token store {self.path}, starting with an empty store')
+            return {}
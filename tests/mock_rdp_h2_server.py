@@ -0,0 +1,158 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import socket
+import subprocess
+import threading
+from urllib.parse import parse_qs
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+
+from tests.mock_rdp_server import load_fixture, config
+
+# Create a self-signed certificate for 127.0.0.1 and localhost with the openssl command line tool,
+# returns (certfile, keyfile) or None when openssl is not available
+def create_self_signed_cert(directory):
+    if shutil.which('openssl') is None:
+        return None
+    certfile = os.path.join(directory, 'mock_rdp_cert.pem')
+    keyfile = os.path.join(directory, 'mock_rdp_key.pem')
+    subprocess.run(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-keyout', keyfile, '-out', certfile, '-days', '1',
+                    '-subj', '/CN=127.0.0.1', '-addext', 'subjectAltName=IP:127.0.0.1,DNS:localhost'], check = True, capture_output = True)
+    return certfile, keyfile
+
+
+class MockRDPH2App():
+
+    # ASGI application serving the RDP Auth, ESG and Search Explore fixtures over HTTP/1.1 and HTTP/2
+    def __init__(self, latency = 0, esg_rows_per_ric = 5):
+        self.latency = latency
+        self.esg_rows_per_ric = esg_rows_per_ric
+        self.auth_json = load_fixture('rdp_test_auth_fixture.json')
+        self.esg_json = load_fixture('rdp_test_esg_fixture.json')
+        self.search_json = load_fixture('rdp_test_search_fixture.json')
+        self.calls = []
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            while (await receive())['type'] != 'lifespan.shutdown':
+                await send({'type': 'lifespan.startup.complete'})
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+        body = b''
+        while True:
+            message = await receive()
+            body += message.get('body', b'')
+            if not message.get('more_body'):
+                break
+        self.calls.append((scope['method'], scope['path'], scope['http_version'], body))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        path = scope['path']
+        if scope['method'] == 'POST' and path == config['RDP_AUTH_URL']:
+            status, json_data = 200, self.auth_json
+        elif scope['method'] == 'GET' and path == config['RDP_ESG_URL']:
+            status, json_data = 200, self._esg(parse_qs(scope['query_string'].decode('utf-8')).get('universe', [''])[0])
+        elif scope['method'] == 'POST' and path == config['RDP_SEARCH_EXPLORE_URL']:
+            status, json_data = 200, self.search_json
+        else:
+            status, json_data = 404, {'error': {'code': '404', 'message': 'Not Found'}}
+        response_body = json.dumps(json_data).encode('utf-8')
+        await send({'type': 'http.response.start', 'status': status,
+                    'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(response_body)).encode('ascii'))]})
+        await send({'type': 'http.response.body', 'body': response_body})
+
+    # ESG data for every RIC of the comma separated universe, built from the fixture rows
+    def _esg(self, universe):
+        esg_json = {key: value for key, value in self.esg_json.items() if key != 'data'}
+        esg_json['data'] = [[ric] + row[1:] for ric in universe.split(',') if ric for row in self.esg_json['data'][:self.esg_rows_per_ric]]
+        return esg_json
+
+
+class MockRDPH2Server():
+
+    # Local HTTP/2 capable stand-in for the RDP services (hypercorn), serving HTTP/1.1 and h2c (prior knowledge) on http://,
+    # or HTTP/1.1 and HTTP/2 negotiated with ALPN on https:// when certfile and keyfile are given.
+    #   latency: delay (seconds) added to every response without blocking the other requests of the connection
+    def __init__(self, host = '127.0.0.1', port = 0, latency = 0, esg_rows_per_ric = 5, certfile = None, keyfile = None):
+        self.app = MockRDPH2App(latency, esg_rows_per_ric)
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind((host, port))
+        self.socket.listen(1024)
+        self.address = self.socket.getsockname()[:2]
+        self.scheme = 'https' if certfile else 'http'
+        self.hypercorn_config = Config()
+        self.hypercorn_config.bind = [f'fd://{self.socket.fileno()}']
+        self.hypercorn_config.certfile = certfile
+        self.hypercorn_config.keyfile = keyfile
+        self.hypercorn_config.errorlog = None
+        # Keep connections open for the whole test or benchmark instead of sending GOAWAY after 1000 requests
+        self.hypercorn_config.keep_alive_max_requests = 2 ** 31
+        self._loop = None
+        self._shutdown = None
+        self._started = threading.Event()
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.address
+        return f'{self.scheme}://{host}:{port}'
+
+    @property
+    def auth_url(self):
+        return self.base_url + config['RDP_AUTH_URL']
+
+    @property
+    def esg_url(self):
+        return self.base_url + config['RDP_ESG_URL']
+
+    @property
+    def search_url(self):
+        return self.base_url + config['RDP_SEARCH_EXPLORE_URL']
+
+    # Received requests as (method, path, HTTP version, body) tuples
+    @property
+    def calls(self):
+        return self.app.calls
+
+    async def _serve(self):
+        self._loop = asyncio.get_running_loop()
+        self._shutdown = asyncio.Event()
+        self._started.set()
+        await serve(self.app, self.hypercorn_config, shutdown_trigger = self._shutdown.wait)
+
+    def start(self):
+        self._thread = threading.Thread(target = asyncio.run, args = (self._serve(),), daemon = True)
+        self._thread.start()
+        self._started.wait()
+        return self
+
+    def stop(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._shutdown.set)
+        if self._thread is not None:
+            self._thread.join()
+            self.socket.detach() # hypercorn owns and closes the listening socket file descriptor
+        else:
+            self.socket.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
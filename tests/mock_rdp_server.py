@@ -0,0 +1,439 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import random
+import re
+import time
+import threading
+import multiprocessing
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from email.utils import formatdate, parsedate_to_datetime
+from urllib.parse import urlsplit, parse_qs
+from dotenv import dotenv_values
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from rdp_controller import rdp_codec
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+config = dotenv_values(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '.env.test'))
+
+# Load a JSON fixture file from the tests/fixtures folder
+def load_fixture(file_name):
+    with open(os.path.join(FIXTURES_DIR, file_name), 'r') as fixture_input:
+        return json.loads(fixture_input.read())
+
+
+class MockRDPRequestHandler(BaseHTTPRequestHandler):
+
+    # Use HTTP/1.1 so clients can keep connections alive between requests
+    protocol_version = 'HTTP/1.1'
+    # Avoid Nagle/delayed-ACK stalls between the header and body writes on kept-alive connections
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        path = self.path.split('?')[0]
+        length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(length)
+        self._record('POST', body)
+        try:
+            body = rdp_codec.decompress(body, self.headers.get('Content-Encoding'))
+        except ValueError:
+            self._send_json(415, {'error': {'code': '415', 'message': 'Unsupported Media Type'}})
+            return
+        if ('POST', path) in self.server.overrides:
+            self._send_json(*self.server.overrides[('POST', path)])
+        elif self._inject_fault():
+            pass
+        elif path == config['RDP_AUTH_URL']:
+            self._send_json(200, self._authenticate())
+        elif path == config['RDP_SEARCH_EXPLORE_URL']:
+            if self._check_token():
+                self._send_json(200, self._search_page(json.loads(body or b'{}')))
+        else:
+            self._send_json(404, {'error': {'code': '404', 'message': 'Not Found'}})
+
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        self._record('GET', b'')
+        if ('GET', path) in self.server.overrides:
+            self._send_json(*self.server.overrides[('GET', path)])
+        elif self._inject_fault():
+            pass
+        elif path == config['RDP_ESG_URL']:
+            if not self._check_token():
+                return
+            esg_json = self._synthetic_esg() if self.server.synthetic else self.server.esg_json
+            esg_json = self._select_periods(esg_json)
+            if self.server.conditional:
+                self._send_conditional_json(esg_json)
+            else:
+                self._send_json(200, esg_json)
+        else:
+            self._send_json(404, {'error': {'code': '404', 'message': 'Not Found'}})
+
+    def _record(self, method, body):
+        if self.server.record_calls:
+            self.server.calls.append((method, self.path, dict(self.headers), body))
+
+    def _count(self, name):
+        with self.server.lock:
+            self.server.stats[name] += 1
+
+    # Randomly reply 503 Service Unavailable (error_rate) or 429 Too Many Requests (throttle_rate)
+    def _inject_fault(self):
+        draw = self.server.random.random()
+        if draw < self.server.error_rate:
+            self._count('errors')
+            self._send_json(503, {'error': {'code': '503', 'message': 'Service Unavailable'}})
+            return True
+        if draw < self.server.error_rate + self.server.throttle_rate:
+            self._count('throttled')
+            self._send_json(429, {'error': {'code': '429', 'message': 'Too Many Requests'}}, {'Retry-After': str(self.server.retry_after)})
+            return True
+        return False
+
+    # Issue a new Access Token valid for token_lifetime seconds, or the fixture tokens when tokens do not expire
+    def _authenticate(self):
+        if self.server.token_lifetime is None:
+            return self.server.auth_json
+        token_number = next(self.server.token_numbers)
+        auth_json = dict(self.server.auth_json)
+        auth_json['access_token'] = f'mock_access_token_{token_number}'
+        auth_json['refresh_token'] = f'mock_refresh_token_{token_number}'
+        auth_json['expires_in'] = str(self.server.token_lifetime)
+        with self.server.lock:
+            self.server.tokens[auth_json['access_token']] = time.monotonic() + self.server.token_lifetime
+        return auth_json
+
+    # Reply 401 with the token expired fixture when the Bearer token was not issued or has expired
+    def _check_token(self):
+        if self.server.token_lifetime is None:
+            return True
+        access_token = self.headers.get('Authorization', '').replace('Bearer ', '', 1)
+        with self.server.lock:
+            expires_at = self.server.tokens.get(access_token)
+        if expires_at is not None and time.monotonic() < expires_at:
+            return True
+        self._count('unauthorized')
+        self._send_json(401, self.server.token_expire_json)
+        return False
+
+    def _send_json(self, status, json_data, headers = None):
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        body = json.dumps(json_data).encode('utf-8')
+        headers = dict(headers or {})
+        compression = self._response_compression()
+        if compression is not None:
+            body = rdp_codec.compress(body, compression)
+            headers['Content-Encoding'] = compression
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    # The first of the server compression codings the client accepts, None sends the body uncompressed
+    def _response_compression(self):
+        accepted = {coding.split(';')[0].strip() for coding in self.headers.get('Accept-Encoding', '').split(',')}
+        for coding in self.server.compression:
+            if coding in accepted:
+                return coding
+        return None
+
+    # ESG data for every RIC of the comma separated universe, built from the fixture rows
+    def _synthetic_esg(self):
+        universe = parse_qs(urlsplit(self.path).query).get('universe', [''])[0]
+        rics = [ric for ric in universe.split(',') if ric]
+        template = self.server.esg_json
+        esg_json = {key: value for key, value in template.items() if key not in ('data', 'universe')}
+        esg_json['data'] = []
+        esg_json['universe'] = []
+        for ric in rics:
+            for row in itertools.islice(itertools.cycle(template['data']), self.server.esg_rows_per_ric):
+                esg_json['data'].append([ric] + row[1:])
+            universe_json = dict(template['universe'][0])
+            universe_json['Instrument'] = ric
+            universe_json['Company Common Name'] = f'{ric} ESG Data'
+            esg_json['universe'].append(universe_json)
+        esg_json['links'] = {'count': len(esg_json['data'])}
+        return esg_json
+
+    # Keep the rows of the periods between the 'start' and 'end' query parameters like the ESG service,
+    # the periods are relative to the latest period of each instrument (0: latest, -1: the one before)
+    def _select_periods(self, esg_json):
+        query = parse_qs(urlsplit(self.path).query)
+        if 'start' not in query and 'end' not in query:
+            return esg_json
+        start = int(query.get('start', ['-1000'])[0])
+        end = int(query.get('end', ['0'])[0])
+        periods = {}
+        for row in esg_json.get('data', []):
+            periods.setdefault(row[0], set()).add(row[1])
+        ranks = {}
+        for instrument, dates in periods.items():
+            for rank, date in enumerate(sorted(dates, reverse = True)):
+                ranks[(instrument, date)] = -rank
+        esg_json = dict(esg_json)
+        esg_json['data'] = [row for row in esg_json.get('data', []) if start <= ranks[(row[0], row[1])] <= end]
+        return esg_json
+
+    # Return the 'Top' hits after 'Skip' hits like the Search Explore service (default Top is 10)
+    def _search_page(self, payload):
+        if self.server.synthetic_search_total is not None:
+            return self._synthetic_search_page(payload)
+        hits = self.server.search_json['Hits']
+        # Filter hits with a 'RIC' field on the RIC eq '...' terms of the query (set_search_hits(filter_rics = True))
+        rics = set(re.findall(r"RIC eq '([^']*)'", payload.get('Filter', ''))) if self.server.filter_search_rics else set()
+        filtered = bool(rics and hits and 'RIC' in hits[0])
+        if filtered:
+            hits = [hit for hit in hits if hit.get('RIC') in rics]
+        elif 'Top' not in payload and 'Skip' not in payload:
+            return self.server.search_json
+        skip = payload.get('Skip', 0)
+        total = len(hits) if filtered else self.server.search_json.get('Total', len(hits))
+        return {'Total': total, 'Hits': hits[skip:skip + payload.get('Top', 10)]}
+
+    # Generate the requested page of synthetic_search_total hits with the 'Select' fields (default: the fixture fields)
+    def _synthetic_search_page(self, payload):
+        total = self.server.synthetic_search_total
+        if payload.get('Select'):
+            fields = [field.strip() for field in payload['Select'].split(',')]
+        else:
+            fields = list(self.server.search_json['Hits'][0])
+        skip = payload.get('Skip', 0)
+        hits = []
+        for index in range(skip, min(total, skip + payload.get('Top', 10))):
+            hits.append({field: f'TEST{index}.RIC' if field == 'RIC' else f'{field} {index}' for field in fields})
+        return {'Total': total, 'Hits': hits}
+
+    # Send ETag/Last-Modified validators and reply 304 Not Modified when the client's validators still match
+    def _send_conditional_json(self, json_data):
+        etag = '"' + hashlib.sha1(json.dumps(json_data).encode('utf-8')).hexdigest() + '"'
+        validators = {'ETag': etag, 'Last-Modified': formatdate(self.server.last_modified, usegmt = True)}
+        if_none_match = self.headers.get('If-None-Match')
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_none_match is not None:
+            not_modified = etag in [tag.strip() for tag in if_none_match.split(',')]
+        elif if_modified_since is not None:
+            not_modified = parsedate_to_datetime(if_modified_since).timestamp() >= int(self.server.last_modified)
+        else:
+            not_modified = False
+        if not not_modified:
+            self._send_json(200, json_data, validators)
+            return
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self.send_response(304)
+        for name, value in validators.items():
+            self.send_header(name, value)
+        self.end_headers()
+
+    # Keep the test and benchmark console output clean
+    def log_message(self, format, *args):
+        pass
+
+
+class MockRDPHTTPServer(ThreadingHTTPServer):
+
+    # Accept bursts of concurrent connections without SYN retries
+    request_queue_size = 1024
+    daemon_threads = True
+
+
+class MockRDPServer():
+
+    # Local stand-in for the RDP Auth, ESG and Search Explore services serving the tests/fixtures data.
+    #   port: 0 lets the OS pick a free port
+    #   latency: fixed delay (seconds) added to every response
+    #   conditional: send ETag/Last-Modified with ESG data and honour If-None-Match/If-Modified-Since
+    #   error_rate / throttle_rate: fraction of requests answered 503 / 429 (with 'Retry-After: retry_after')
+    #   token_lifetime: issue a new Access Token per authentication, valid for token_lifetime seconds,
+    #     ESG and Search Explore reply 401 to unknown or expired tokens (None accepts any token)
+    #   synthetic: ESG data for any comma separated universe, esg_rows_per_ric fixture rows per RIC
+    #   synthetic_search_total: Search Explore query result of this many generated hits, paged with Top/Skip
+    #   seed: random seed of the fault injection, for repeatable runs
+    #   record_calls: keep the received requests log (disable for long load tests)
+    #   compression: response content codings in order of preference (e.g. ('zstd', 'br', 'gzip')), a response is
+    #     compressed with the first one listed in the request Accept-Encoding. Compressed request bodies are always decoded.
+    def __init__(self, host = '127.0.0.1', port = 0, latency = 0, conditional = False, error_rate = 0, throttle_rate = 0, retry_after = 1,
+                 token_lifetime = None, synthetic = False, esg_rows_per_ric = 5, synthetic_search_total = None, seed = None, record_calls = True,
+                 compression = ()):
+        self.httpd = MockRDPHTTPServer((host, port), MockRDPRequestHandler)
+        self.httpd.latency = latency
+        self.httpd.conditional = conditional
+        self.httpd.last_modified = time.time()
+        self.httpd.error_rate = error_rate
+        self.httpd.throttle_rate = throttle_rate
+        self.httpd.retry_after = retry_after
+        self.httpd.token_lifetime = token_lifetime
+        self.httpd.synthetic = synthetic
+        self.httpd.esg_rows_per_ric = esg_rows_per_ric
+        self.httpd.synthetic_search_total = synthetic_search_total
+        self.httpd.random = random.Random(seed)
+        self.httpd.record_calls = record_calls
+        self.httpd.compression = tuple(compression)
+        self.httpd.auth_json = load_fixture('rdp_test_auth_fixture.json')
+        self.httpd.esg_json = load_fixture('rdp_test_esg_fixture.json')
+        self.httpd.search_json = load_fixture('rdp_test_search_fixture.json')
+        self.httpd.filter_search_rics = False
+        self.httpd.token_expire_json = load_fixture('rdp_test_token_expire_fixture.json')
+        self.httpd.tokens = {}
+        self.httpd.token_numbers = itertools.count(1)
+        self.httpd.stats = {'errors': 0, 'throttled': 0, 'unauthorized': 0}
+        self.httpd.lock = threading.Lock()
+        self.httpd.overrides = {}
+        self.httpd.calls = []
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def auth_url(self):
+        return self.base_url + config['RDP_AUTH_URL']
+
+    @property
+    def esg_url(self):
+        return self.base_url + config['RDP_ESG_URL']
+
+    @property
+    def search_url(self):
+        return self.base_url + config['RDP_SEARCH_EXPLORE_URL']
+
+    # Received requests as (method, path with query string, headers, body) tuples
+    @property
+    def calls(self):
+        return self.httpd.calls
+
+    # Reply to method + endpoint path (e.g. config['RDP_ESG_URL']) with a fixed status and JSON body
+    def add_response(self, method, path, status, json_data):
+        self.httpd.overrides[(method, path)] = (status, json_data)
+
+    # Replace the ESG data served by the ESG endpoint, a new ETag and Last-Modified time are sent with it
+    def set_esg_data(self, json_data):
+        self.httpd.esg_json = json_data
+        self.httpd.last_modified = time.time()
+
+    # Replace the Search Explore hits, 'Total' is the number of hits
+    #   filter_rics: answer queries with RIC eq '...' filter terms with the matching hits only
+    def set_search_hits(self, hits, filter_rics = False):
+        self.httpd.search_json = {'Total': len(hits), 'Hits': hits}
+        self.httpd.filter_search_rics = filter_rics
+
+    # Number of injected 503 ('errors'), 429 ('throttled') and 401 ('unauthorized') responses
+    @property
+    def stats(self):
+        return dict(self.httpd.stats)
+
+    # Expire every issued Access Token, the next ESG and Search Explore requests get HTTP 401
+    def expire_tokens(self):
+        with self.httpd.lock:
+            self.httpd.tokens.clear()
+
+    # Remove the fixed responses, the received requests log and the injected responses counts
+    def reset(self):
+        self.httpd.overrides.clear()
+        self.httpd.calls.clear()
+        with self.httpd.lock:
+            self.httpd.stats = dict.fromkeys(self.httpd.stats, 0)
+
+    def start(self):
+        self._thread = threading.Thread(target = self.httpd.serve_forever, daemon = True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def _serve_forever(host, port, options, port_queue):
+    server = MockRDPServer(host, port, **options)
+    port_queue.put(server.httpd.server_address[1])
+    server.httpd.serve_forever()
+
+
+class MockRDPServerProcess(MockRDPServer):
+
+    # Run the stand-in server in a child process so benchmark clients do not share the server's GIL.
+    # options are the MockRDPServer options (latency, error_rate, token_lifetime, ...).
+    def __init__(self, host = '127.0.0.1', port = 0, latency = 0, **options):
+        self.host = host
+        self.port = port
+        self.options = dict(options, latency = latency)
+        self._process = None
+
+    @property
+    def base_url(self):
+        return f'http://{self.host}:{self.port}'
+
+    def start(self):
+        port_queue = multiprocessing.Queue()
+        self._process = multiprocessing.Process(target = _serve_forever, args = (self.host, self.port, self.options, port_queue), daemon = True)
+        self._process.start()
+        self.port = port_queue.get(timeout = 10)
+        return self
+
+    def stop(self):
+        self._process.terminate()
+        self._process.join()
+
+
+# Run the stand-in server from the console, e.g. to point app.py (RDP_BASE_URL) or load test tools at it.
+# Usage (from the project root): python -m tests.mock_rdp_server --port 8080 --latency 0.05 --error-rate 0.01
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Local stand-in for the RDP Auth, ESG and Search Explore services')
+    parser.add_argument('--host', default = '127.0.0.1')
+    parser.add_argument('--port', type = int, default = 8080)
+    parser.add_argument('--latency', type = float, default = 0)
+    parser.add_argument('--conditional', action = 'store_true')
+    parser.add_argument('--error-rate', type = float, default = 0)
+    parser.add_argument('--throttle-rate', type = float, default = 0)
+    parser.add_argument('--retry-after', type = int, default = 1)
+    parser.add_argument('--token-lifetime', type = int, default = None)
+    parser.add_argument('--synthetic', action = 'store_true')
+    parser.add_argument('--esg-rows-per-ric', type = int, default = 5)
+    parser.add_argument('--synthetic-search-total', type = int, default = None)
+    parser.add_argument('--seed', type = int, default = None)
+    parser.add_argument('--compression', nargs = '*', default = (), choices = sorted(rdp_codec.COMPRESSORS))
+    args = parser.parse_args()
+
+    options = vars(args)
+    host = options.pop('host')
+    port = options.pop('port')
+    server = MockRDPServer(host, port, record_calls = False, **options)
+    print(f'Mock RDP server listening on {server.base_url}')
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
@@ -13,11 +13,23 @@ ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR
 import unittest
 import pandas as pd
 import json
+import io
 import sys
 import os
+import tempfile
+import threading
+import subprocess
+from unittest import mock
+from dotenv import dotenv_values
+config = dotenv_values("../.env.test")
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from app import convert_pandas
+import app
+from app import convert_pandas, run_pipeline, run_raw, read_universe_list
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_token_manager
+from rdp_controller import rdp_columnar_store
+from tests.mock_rdp_server import MockRDPServer
 
 class TestConsoleApp(unittest.TestCase):
         
@@ -35,6 +47,23 @@ class TestConsoleApp(unittest.TestCase):
         self.assertIsInstance(result, pd.DataFrame)
         self.assertFalse(result.empty)
     
+    def test_convert_json_typed_columns(self):
+        """
+        Test that the convert_pandas function builds typed columns from the headers metadata
+        """
+        with open('./fixtures/rdp_test_esg_fixture.json', 'r') as esg_fixture_input:
+            mock_esg_data = json.loads(esg_fixture_input.read())
+
+        result = convert_pandas(mock_esg_data)
+
+        self.assertEqual(list(result.columns), [header['title'] for header in mock_esg_data['headers']])
+        self.assertEqual(len(result), len(mock_esg_data['data']))
+        self.assertEqual(result['ESG Score'].dtype, 'float64')
+        self.assertTrue(pd.api.types.is_datetime64_dtype(result['Period End Date']))
+        self.assertTrue(pd.api.types.is_datetime64_dtype(result['TEST 10 Last Update Date']))
+        self.assertIsInstance(result['Instrument'].dtype, pd.CategoricalDtype)
+        self.assertEqual(result['ESG Score'].iloc[0], mock_esg_data['data'][0][2])
+
     def test_can_convert_json_none(self):
         """
         Test that the convert_pandas function can handle none/empty input
@@ -54,6 +83,114 @@ class TestConsoleApp(unittest.TestCase):
             result = convert_pandas({"message":"Invalid"})
 
         self.assertEqual(str(exception_context.exception),'Error converting JSON to Dataframe')
-        
+
+    def run_mock_pipeline(self, universe_list, convert_workers, server_options = None, store = None):
+        with MockRDPServer(synthetic = True, esg_rows_per_ric = 3, **(server_options or {})) as server:
+            server.set_search_hits([{'RIC': ric, 'IssuerCommonName': f'{ric} Name', 'ExchangeName': 'Test-Mock'} for ric in universe_list], filter_rics = True)
+            with rdp_http_controller.RDPHTTPController() as controller, \
+                 rdp_token_manager.RDPTokenManager(controller, server.auth_url, config['RDP_USERNAME'], config['RDP_PASSWORD'], config['RDP_CLIENTID']) as token_manager:
+                return run_pipeline(token_manager, server.esg_url, server.search_url, universe_list, fetch_workers = 4, convert_workers = convert_workers,
+                                    queue_size = 4, convert_batch_size = 5, search_batch_size = 7, select = 'RIC,IssuerCommonName,ExchangeName',
+                                    store = store)
+
+    def test_pipeline_merged_result(self):
+        """
+        Test that the batch pipeline merges the ESG rows of every RIC with the Search Explore metadata in the universe order
+        """
+        universe_list = [f'TEST{index}.RIC' for index in range(23)]
+        for convert_workers in (0, 2):
+            result_df, failed = self.run_mock_pipeline(universe_list, convert_workers)
+
+            self.assertEqual(failed, [])
+            self.assertEqual(len(result_df), 23 * 3)
+            self.assertEqual(list(result_df['Instrument'].unique()), universe_list)
+            self.assertEqual(result_df['IssuerCommonName'].iloc[-1], 'TEST22.RIC Name')
+            self.assertEqual(result_df['ESG Score'].dtype, 'float64')
+            self.assertIsInstance(result_df['Instrument'].dtype, pd.CategoricalDtype)
+
+    @unittest.skipIf(rdp_columnar_store.pa is None, 'pyarrow is not installed')
+    def test_pipeline_columnar_store(self):
+        """
+        Test that the batch pipeline appends every converted batch and the metadata to the columnar store
+        """
+        universe_list = [f'TEST{index}.RIC' for index in range(12)]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = rdp_columnar_store.ColumnarStore(temp_dir)
+            result_df, failed = self.run_mock_pipeline(universe_list, 0, store = store)
+            esg_df = store.read('esg')
+            search_df = store.read('search')
+
+        self.assertIsNone(result_df)
+        self.assertEqual(failed, [])
+        self.assertEqual(len(esg_df), 12 * 3)
+        self.assertEqual(set(esg_df['Instrument']), set(universe_list))
+        self.assertEqual(sorted(search_df['RIC']), sorted(universe_list))
+
+    def test_pipeline_failed_universe(self):
+        """
+        Test that RICs whose ESG request fails are reported and the pipeline still returns
+        """
+        with mock.patch.object(rdp_token_manager.RDPTokenManager, 'request_esg', side_effect = ValueError('ESG failure')):
+            result_df, failed = self.run_mock_pipeline(['TEST1.RIC', 'TEST2.RIC'], 0)
+
+        self.assertEqual(failed, ['TEST1.RIC', 'TEST2.RIC'])
+        self.assertTrue(result_df.empty)
+
+    def test_pipeline_consumer_failure(self):
+        """
+        Test that a failure of the conversion stage is raised and stops the fetch threads blocked on the full queue
+        """
+        store = mock.Mock()
+        store.append_esg.side_effect = OSError('Disk full')
+        universe_list = [f'TEST{index}.RIC' for index in range(40)]
+
+        with MockRDPServer(synthetic = True, esg_rows_per_ric = 3) as server, \
+             rdp_http_controller.RDPHTTPController() as controller, \
+             rdp_token_manager.RDPTokenManager(controller, server.auth_url, config['RDP_USERNAME'], config['RDP_PASSWORD'], config['RDP_CLIENTID']) as token_manager:
+            threads = set(threading.enumerate())
+            with self.assertRaises(OSError):
+                run_pipeline(token_manager, server.esg_url, server.search_url, universe_list, fetch_workers = 4, convert_workers = 0,
+                             queue_size = 4, convert_batch_size = 5, search_batch_size = 7, store = store)
+
+            # The fetch, sentinel and metadata threads end while the server is still up
+            for thread in set(threading.enumerate()) - threads:
+                if getattr(thread, '_target', None) in (app._fetch_esg, app._close_queue, app._fetch_metadata):
+                    thread.join(5)
+                    self.assertFalse(thread.is_alive())
+        self.assertEqual(store.append_esg.call_count, 1)
+
+    def test_raw_fetch(self):
+        """
+        Test that the fetch-only mode writes one JSON line per RIC with the ESG response
+        """
+        universe_list = [f'TEST{index}.RIC' for index in range(7)]
+        output_file = io.StringIO()
+        with MockRDPServer(synthetic = True, esg_rows_per_ric = 3) as server:
+            with rdp_http_controller.RDPHTTPController() as controller, \
+                 rdp_token_manager.RDPTokenManager(controller, server.auth_url, config['RDP_USERNAME'], config['RDP_PASSWORD'], config['RDP_CLIENTID']) as token_manager:
+                written, failed = run_raw(token_manager, server.esg_url, universe_list, output_file, fetch_workers = 3, queue_size = 2)
+
+        records = [json.loads(line) for line in output_file.getvalue().splitlines()]
+        self.assertEqual((written, failed), (7, []))
+        self.assertEqual(sorted(record['RIC'] for record in records), sorted(universe_list))
+        self.assertTrue(all(len(record['esg']['data']) == 3 for record in records))
+
+    def test_import_without_pandas(self):
+        """
+        Test that importing the app module and the HTTP controller does not import pandas, NumPy or pyarrow
+        """
+        code = ('import sys, app; from rdp_controller import rdp_credential_pool; '
+                'print(sorted(name for name in ("pandas", "numpy", "pyarrow", "httpx", "cryptography") if name in sys.modules))')
+        output = subprocess.run([sys.executable, '-c', code], cwd = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'),
+                                capture_output = True, text = True, check = True).stdout
+        self.assertEqual(output.strip(), '[]')
+
+    def test_read_universe_list(self):
+        """
+        Test that the universe list is read one RIC per line or comma separated, without blanks and duplicates
+        """
+        with mock.patch('sys.stdin', io.StringIO('A.L\nB.L, C.L\n\nA.L\n')):
+            self.assertEqual(read_universe_list('-'), ['A.L', 'B.L', 'C.L'])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,133 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import unittest
+import requests
+import sys
+import os
+from dotenv import dotenv_values
+config = dotenv_values("../.env.test")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_retry
+from rdp_controller import rdp_token_manager
+from rdp_controller import rdp_dataframe
+from tests.mock_rdp_server import MockRDPServer, MockRDPServerProcess
+
+class TestMockRDPServer(unittest.TestCase):
+
+    def get_esg(self, server, universe = 'TEST.RIC', access_token = 'access_token'):
+        return requests.get(server.esg_url, headers = {'Authorization': f'Bearer {access_token}'}, params = {'universe': universe})
+
+    def test_error_injection(self):
+        """
+        Test that error_rate and throttle_rate reply HTTP 503 and HTTP 429 with Retry-After
+        """
+        with MockRDPServer(error_rate = 1) as server:
+            self.assertEqual(self.get_esg(server).status_code, 503)
+            self.assertEqual(server.stats['errors'], 1)
+
+        with MockRDPServer(throttle_rate = 1, retry_after = 2) as server:
+            response = self.get_esg(server)
+            self.assertEqual(response.status_code, 429)
+            self.assertEqual(response.headers['Retry-After'], '2')
+            self.assertEqual(server.stats['throttled'], 1)
+
+    def test_error_injection_seed(self):
+        """
+        Test that the same seed injects the same faults
+        """
+        status_codes = []
+        for _ in range(2):
+            with MockRDPServer(error_rate = 0.3, throttle_rate = 0.3, seed = 7) as server:
+                status_codes.append([self.get_esg(server).status_code for _ in range(20)])
+
+        self.assertEqual(status_codes[0], status_codes[1])
+        self.assertTrue({200, 429, 503} <= set(status_codes[0]))
+
+    def test_controller_retry_injected_faults(self):
+        """
+        Test that the controller retry policy recovers from injected 503 and 429 responses over real sockets
+        """
+        retry_policy = rdp_retry.RetryPolicy(max_retries = 10, sleep = lambda seconds: None)
+        with MockRDPServer(error_rate = 0.2, throttle_rate = 0.2, seed = 1) as server:
+            with rdp_http_controller.RDPHTTPController(retry_policy = retry_policy) as controller:
+                for index in range(20):
+                    self.assertIn('data', controller.rdp_request_esg(server.esg_url, 'access_token', f'TEST{index}.RIC'))
+            self.assertGreater(server.stats['errors'] + server.stats['throttled'], 0)
+
+    def test_token_expiry(self):
+        """
+        Test that issued tokens are accepted until they expire and unknown tokens get HTTP 401
+        """
+        with MockRDPServer(token_lifetime = 600) as server:
+            with rdp_http_controller.RDPHTTPController() as controller:
+                access_token, refresh_token, expires_in = controller.rdp_authentication(server.auth_url, config['RDP_USERNAME'],
+                                                                                        config['RDP_PASSWORD'], config['RDP_CLIENTID'])
+            self.assertEqual(expires_in, 600)
+            self.assertEqual(self.get_esg(server, access_token = access_token).status_code, 200)
+            self.assertEqual(self.get_esg(server, access_token = 'unknown_token').status_code, 401)
+
+            server.expire_tokens()
+            response = self.get_esg(server, access_token = access_token)
+            self.assertEqual(response.status_code, 401)
+            self.assertEqual(response.json()['error']['message'], 'token expired')
+            self.assertEqual(server.stats['unauthorized'], 2)
+
+    def test_token_manager_expired_token(self):
+        """
+        Test that RDPTokenManager renews an Access Token the server expired early and repeats the request
+        """
+        with MockRDPServer(token_lifetime = 600) as server, rdp_http_controller.RDPHTTPController() as controller:
+            with rdp_token_manager.RDPTokenManager(controller, server.auth_url, config['RDP_USERNAME'], config['RDP_PASSWORD'], config['RDP_CLIENTID']) as token_manager:
+                old_access_token = token_manager.get_access_token()
+                server.expire_tokens()
+
+                self.assertIn('data', token_manager.request_esg(server.esg_url, 'TEST.RIC'))
+                self.assertNotEqual(token_manager.get_access_token(), old_access_token)
+
+    def test_synthetic_esg(self):
+        """
+        Test that synthetic ESG data has esg_rows_per_ric rows for every requested RIC
+        """
+        universe = [f'TEST{index}.RIC' for index in range(100)]
+        with MockRDPServer(synthetic = True, esg_rows_per_ric = 3) as server:
+            esg_json = self.get_esg(server, universe = ','.join(universe)).json()
+
+        self.assertEqual(len(esg_json['data']), 300)
+        self.assertEqual([row['Instrument'] for row in esg_json['universe']], universe)
+        df = rdp_dataframe.build_dataframe(esg_json['headers'], esg_json['data'])
+        self.assertEqual(list(df['Instrument'].unique()), universe)
+
+    def test_synthetic_search(self):
+        """
+        Test that the synthetic Search Explore result pages through synthetic_search_total hits
+        """
+        payload = {'View': 'Entities', 'Filter': 'ExchangeCode eq \'TEST\'', 'Select': 'RIC,IssuerCommonName'}
+        with MockRDPServer(synthetic_search_total = 1050) as server, rdp_http_controller.RDPHTTPController() as controller:
+            hits = list(controller.rdp_paginate_search_explore(server.search_url, 'access_token', payload, page_size = 500))
+
+        self.assertEqual(len(hits), 1050)
+        self.assertEqual(hits[1049], {'RIC': 'TEST1049.RIC', 'IssuerCommonName': 'IssuerCommonName 1049'})
+
+    def test_server_process_options(self):
+        """
+        Test that MockRDPServerProcess passes the server options to the child process
+        """
+        with MockRDPServerProcess(synthetic = True, esg_rows_per_ric = 2) as server:
+            esg_json = self.get_esg(server, universe = 'A.L,B.L').json()
+
+        self.assertEqual(len(esg_json['data']), 4)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,231 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import unittest
+import asyncio
+import requests
+import json
+import base64
+import sys
+import os
+from dotenv import dotenv_values
+config = dotenv_values("../.env.test")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from rdp_controller import rdp_async_http_controller
+from tests.mock_rdp_server import MockRDPServer
+
+class TestRDPAsyncHTTPController(unittest.IsolatedAsyncioTestCase):
+
+    # Start one local RDP stand-in server for all tests in the class
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockRDPServer().start()
+        with open('./fixtures/rdp_test_auth_fixture.json', 'r') as auth_fixture_input:
+            cls.mock_valid_auth_json = json.loads(auth_fixture_input.read())
+        with open('./fixtures/rdp_test_token_expire_fixture.json', 'r') as auth_expire_fixture_input:
+            cls.mock_token_expire_json = json.loads(auth_expire_fixture_input.read())
+        cls.search_explore_payload = {
+            'View': 'Entities',
+            'Filter': 'RIC eq \'TEST.RIC\'',
+            'Select': 'IssuerCommonName,DocumentTitle,RCSExchangeCountryLeaf,IssueISIN,ExchangeName,ExchangeCode,SearchAllCategoryv3,RCSTRBC2012Leaf'
+        }
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    async def asyncSetUp(self):
+        self.server.reset()
+        self.app = rdp_async_http_controller.RDPAsyncHTTPController()
+
+    async def asyncTearDown(self):
+        await self.app.aclose()
+
+    async def test_login_rdp_success(self):
+        """
+        Test that it can log in to the RDP Auth Service
+        """
+        access_token, refresh_token, expires_in = await self.app.rdp_authentication(self.server.auth_url, config['RDP_USERNAME'], config['RDP_PASSWORD'], config['RDP_CLIENTID'])
+
+        self.assertIsNotNone(access_token)
+        self.assertIsNotNone(refresh_token)
+        self.assertGreater(expires_in, 0)
+        self.assertIn(b'grant_type=password', self.server.calls[0][3])
+        self.assertEqual(self.server.calls[0][2]['Authorization'], 'Basic ' + base64.b64encode(f'{config["RDP_CLIENTID"]}:'.encode()).decode())
+
+    async def test_login_rdp_refreshtoken(self):
+        """
+        Test that it can handle token renewal using the refresh_token
+        """
+        access_token, refresh_token, expires_in = await self.app.rdp_authentication(self.server.auth_url, config['RDP_USERNAME'], config['RDP_PASSWORD'], config['RDP_CLIENTID'],
+                                                                                    self.mock_valid_auth_json['refresh_token'])
+
+        self.assertIsNotNone(access_token)
+        self.assertGreater(expires_in, 0)
+        self.assertIn(b'grant_type=refresh_token', self.server.calls[0][3])
+
+    async def test_login_rdp_invalid(self):
+        """
+        Test that it can handle some invalid credentials
+        """
+        self.server.add_response('POST', config['RDP_AUTH_URL'], 401, {'error': 'invalid_client', 'error_description':'Invalid Application Credential.'})
+
+        with self.assertRaises(requests.exceptions.HTTPError) as exception_context:
+            await self.app.rdp_authentication(self.server.auth_url, 'wrong_user1', 'wrong_password1', 'XXXXX')
+
+        self.assertEqual(exception_context.exception.response.status_code, 401)
+        self.assertEqual(exception_context.exception.response.reason, 'Unauthorized')
+        json_error = json.loads(exception_context.exception.response.text)
+        self.assertIn('error', json_error)
+        self.assertIn('error_description', json_error)
+
+    async def test_login_rdp_none_empty_params(self):
+        """
+        Test that the function can handle none/empty input
+        """
+        with self.assertRaises(TypeError) as exception_context:
+            await self.app.rdp_authentication(None, '', None, 'XXXXX')
+
+        self.assertEqual(str(exception_context.exception),'Received invalid (None or Empty) arguments')
+
+    async def test_request_esg(self):
+        """
+        Test that it can request ESG Data
+        """
+        response = await self.app.rdp_request_esg(self.server.esg_url, self.mock_valid_auth_json['access_token'], 'TEST.RIC')
+
+        self.assertIsInstance(response, dict)
+        self.assertIn('data', response)
+        self.assertIn('headers', response)
+        self.assertIn('universe', response)
+        self.assertIn('universe=TEST.RIC', self.server.calls[0][1])
+
+    async def test_request_esg_token_expire(self):
+        """
+        Test that it can handle token expiration requests
+        """
+        self.server.add_response('GET', config['RDP_ESG_URL'], 401, self.mock_token_expire_json)
+
+        with self.assertRaises(requests.exceptions.HTTPError) as exception_context:
+            await self.app.rdp_request_esg(self.server.esg_url, self.mock_valid_auth_json['access_token'], 'TEST.RIC')
+
+        self.assertEqual(exception_context.exception.response.status_code, 401)
+        self.assertEqual(exception_context.exception.response.reason, 'Unauthorized')
+        json_error = json.loads(exception_context.exception.response.text)
+        self.assertIn('message', json_error['error'])
+        self.assertIn('status', json_error['error'])
+
+    async def test_request_esg_invalid_ric(self):
+        """
+        Test that it can handle invalid RIC request
+        """
+        self.server.add_response('GET', config['RDP_ESG_URL'], 200, {'error': {'code': 412, 'description': 'Unable to resolve all requested identifiers.'}})
+
+        response = await self.app.rdp_request_esg(self.server.esg_url, self.mock_valid_auth_json['access_token'], 'INVALID.RIC')
+
+        self.assertIn('error', response)
+        self.assertIn('code', response['error'])
+        self.assertIn('description', response['error'])
+
+    async def test_request_esg_none_empty(self):
+        """
+        Test that the ESG function can handle none/empty input
+        """
+        with self.assertRaises(TypeError) as exception_context:
+            await self.app.rdp_request_esg(None, self.mock_valid_auth_json['access_token'], '')
+
+        self.assertEqual(str(exception_context.exception),'Received invalid (None or Empty) arguments')
+
+    async def test_request_search_explore(self):
+        """
+        Test that it can get RIC's metadata via the RDP Search Explore Service
+        """
+        response = await self.app.rdp_request_search_explore(self.server.search_url, self.mock_valid_auth_json['access_token'], self.search_explore_payload)
+
+        self.assertIn('Total', response)
+        self.assertIn('Hits', response)
+        self.assertEqual(json.loads(self.server.calls[0][3]), self.search_explore_payload)
+
+    async def test_request_search_explore_invalid_json(self):
+        """
+        Test that it can handle invalid JSON request payload
+        """
+        self.server.add_response('POST', config['RDP_SEARCH_EXPLORE_URL'], 400, {'error': {'code': '400', 'message': 'Validation error', 'status': 'Bad Request',
+                                 'errors': [{'key': 'json', 'reason': 'json.View in body should be one of [CatalogItems Entities]'}]}})
+
+        with self.assertRaises(requests.exceptions.HTTPError) as exception_context:
+            await self.app.rdp_request_search_explore(self.server.search_url, self.mock_valid_auth_json['access_token'], {'TestKey': 'InvalidValue'})
+
+        self.assertEqual(exception_context.exception.response.status_code, 400)
+        self.assertEqual(exception_context.exception.response.reason, 'Bad Request')
+        json_error = json.loads(exception_context.exception.response.text)
+        self.assertGreater(len(json_error['error']['errors']), 0)
+
+    async def test_request_search_explore_token_expire(self):
+        """
+        Test that it can handle token expiration requests
+        """
+        self.server.add_response('POST', config['RDP_SEARCH_EXPLORE_URL'], 401, self.mock_token_expire_json)
+
+        with self.assertRaises(requests.exceptions.HTTPError) as exception_context:
+            await self.app.rdp_request_search_explore(self.server.search_url, self.mock_valid_auth_json['access_token'], self.search_explore_payload)
+
+        self.assertEqual(exception_context.exception.response.status_code, 401)
+        self.assertEqual(exception_context.exception.response.reason, 'Unauthorized')
+        json_error = json.loads(exception_context.exception.response.text)
+        self.assertIsInstance(json_error, dict)
+        self.assertIn('error', json_error)
+        self.assertIn('message', json_error['error'])
+        self.assertIn('status', json_error['error'])
+
+    async def test_request_search_explore_invalid_ric(self):
+        """
+        Test that it can handle invalid RIC request
+        """
+        self.server.add_response('POST', config['RDP_SEARCH_EXPLORE_URL'], 200, {'Total': 0, 'Hits': []})
+        payload = dict(self.search_explore_payload, Filter = 'RIC eq "INVALID.RIC"')
+
+        response = await self.app.rdp_request_search_explore(self.server.search_url, self.mock_valid_auth_json['access_token'], payload)
+
+        self.assertIsInstance(response, dict)
+        self.assertIn('Hits', response)
+        self.assertIn('Total', response)
+        self.assertEqual(response['Total'], 0)
+        self.assertEqual(len(response['Hits']), 0)
+
+    async def test_request_search_explore_none_empty(self):
+        """
+        Test that the Search Explore function can handle none/empty input
+        """
+        with self.assertRaises(TypeError) as exception_context:
+            await self.app.rdp_request_search_explore('', self.mock_valid_auth_json['access_token'], {})
+
+        self.assertEqual(str(exception_context.exception),'Received invalid (None or Empty) arguments')
+
+    async def test_concurrent_requests(self):
+        """
+        Test that many ESG and Search Explore requests can run concurrently on one controller
+        """
+        access_token = self.mock_valid_auth_json['access_token']
+        esg_tasks = [self.app.rdp_request_esg(self.server.esg_url, access_token, f'RIC{index}.L') for index in range(50)]
+        search_tasks = [self.app.rdp_request_search_explore(self.server.search_url, access_token, self.search_explore_payload) for index in range(50)]
+
+        results = await asyncio.gather(*esg_tasks, *search_tasks)
+
+        self.assertEqual(len(results), 100)
+        self.assertTrue(all('data' in result for result in results[:50]))
+        self.assertTrue(all('Hits' in result for result in results[50:]))
+        self.assertEqual(len(self.server.calls), 100)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import unittest
+import responses
+import json
+import tempfile
+import sys
+import os
+from unittest import mock
+from dotenv import dotenv_values
+config = dotenv_values("../.env.test")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_cache
+
+class TestRDPCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.base_URL = config['RDP_BASE_URL']
+        cls.esg_endpoint = cls.base_URL + config['RDP_ESG_URL']
+        cls.search_endpoint = cls.base_URL + config['RDP_SEARCH_EXPLORE_URL']
+        with open('./fixtures/rdp_test_esg_fixture.json', 'r') as esg_fixture_input:
+            cls.mock_esg_data = json.loads(esg_fixture_input.read())
+        with open('./fixtures/rdp_test_search_fixture.json', 'r') as search_fixture_input:
+            cls.mock_search_data = json.loads(search_fixture_input.read())
+
+    def setUp(self):
+        self.now = 1000.0
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def create_caches(self, max_entries = 2, ttl = 60):
+        return [rdp_cache.MemoryCache(max_entries, ttl, clock = lambda: self.now),
+                rdp_cache.DiskCache(self.temp_dir.name, max_entries, ttl, clock = lambda: self.now, evict_ratio = 1)]
+
+    def test_cache_ttl(self):
+        """
+        Test that entries expire after ttl seconds and hits/misses are counted
+        """
+        for cache in self.create_caches():
+            cache.set('key1', {'data': [1]})
+            self.assertEqual(cache.get('key1'), {'data': [1]})
+            self.now += 60
+            self.assertIsNone(cache.get('key1'))
+            self.assertEqual(cache.stats(), {'hits': 1, 'misses': 1, 'entries': 0})
+            self.now -= 60
+
+    def test_cache_lru_eviction(self):
+        """
+        Test that the least recently used entry is evicted above max_entries
+        """
+        for cache in self.create_caches():
+            cache.set('key1', {'data': [1]})
+            self.now += 1
+            cache.set('key2', {'data': [2]})
+            self.now += 1
+            cache.get('key1') # key2 is now the least recently used entry
+            self.now += 1
+            cache.set('key3', {'data': [3]})
+
+            self.assertEqual(len(cache), 2)
+            self.assertIsNone(cache.get('key2'))
+            self.assertEqual(cache.get('key1'), {'data': [1]})
+            self.assertEqual(cache.get('key3'), {'data': [3]})
+
+    def test_memory_cache_copy(self):
+        """
+        Test that modifying a returned value does not modify the cached response
+        """
+        cache = rdp_cache.MemoryCache()
+        cache.set('key1', {'data': [1]})
+        cache.get('key1')['data'].append(2)
+
+        self.assertEqual(cache.get('key1'), {'data': [1]})
+
+    def test_disk_cache_eviction_batch(self):
+        """
+        Test that DiskCache evicts down to evict_ratio * max_entries only when above max_entries, and ignores files removed by another process
+        """
+        cache = rdp_cache.DiskCache(self.temp_dir.name, max_entries = 10, clock = lambda: self.now, evict_ratio = 0.5)
+        with mock.patch.object(cache, '_evict', wraps = cache._evict) as evict:
+            for index in range(10):
+                self.now += 1
+                cache.set(f'key{index}', {'data': [index]})
+            self.assertEqual(evict.call_count, 0)
+            self.now += 1
+            cache.set('key10', {'data': [10]})
+            self.assertEqual(evict.call_count, 1)
+
+        self.assertEqual(len(cache), 5)
+        self.assertIsNone(cache.get('key5'))
+        self.assertEqual(cache.get('key6'), {'data': [6]})
+
+        # Another process removes a file between the directory scan and the stat() of the entry
+        real_scandir = os.scandir
+        def scandir_removing_entry(path):
+            entries = list(real_scandir(path))
+            os.remove(os.path.join(path, 'key6.json'))
+            return entries
+        with mock.patch('os.scandir', side_effect = scandir_removing_entry):
+            cache._evict()
+
+    def test_memory_cache_serialized(self):
+        """
+        Test that MemoryCache keeps the values serialized and returns a new copy on every get()
+        """
+        cache = rdp_cache.MemoryCache()
+        cache.set('key1', self.mock_esg_data)
+
+        self.assertIsInstance(cache._entries['key1'][1], bytes)
+        self.assertEqual(cache.get('key1'), self.mock_esg_data)
+        self.assertIsNot(cache.get('key1'), cache.get('key1'))
+
+    def test_make_cache_key(self):
+        """
+        Test that the cache key depends on the URL and the parameters but not their order
+        """
+        self.assertEqual(rdp_cache.make_cache_key(self.esg_endpoint, {'universe': 'A.L', 'start': 0}),
+                         rdp_cache.make_cache_key(self.esg_endpoint, {'start': 0, 'universe': 'A.L'}))
+        self.assertNotEqual(rdp_cache.make_cache_key(self.esg_endpoint, {'universe': 'A.L'}),
+                            rdp_cache.make_cache_key(self.esg_endpoint, {'universe': 'B.L'}))
+        self.assertNotEqual(rdp_cache.make_cache_key(self.esg_endpoint, {'universe': 'A.L'}),
+                            rdp_cache.make_cache_key(self.search_endpoint, {'universe': 'A.L'}))
+
+    @responses.activate
+    def test_controller_cache(self):
+        """
+        Test that RDPHTTPController serves repeated ESG and Search Explore requests from the cache
+        """
+        responses.add(responses.Response(method= 'GET', url = self.esg_endpoint, json = self.mock_esg_data, status= 200, content_type= 'application/json'))
+        responses.add(responses.Response(method= 'POST', url = self.search_endpoint, json = self.mock_search_data, status= 200, content_type= 'application/json'))
+        payload = {'View': 'Entities', 'Filter': 'RIC eq \'TEST.RIC\''}
+
+        for cache in self.create_caches(max_entries = 10):
+            responses.calls.reset()
+            with rdp_http_controller.RDPHTTPController(cache = cache) as controller:
+                for _ in range(3):
+                    self.assertEqual(controller.rdp_request_esg(self.esg_endpoint, 'access_token', 'TEST.RIC'), self.mock_esg_data)
+                    self.assertEqual(controller.rdp_request_search_explore(self.search_endpoint, 'access_token', payload), self.mock_search_data)
+                controller.rdp_request_esg(self.esg_endpoint, 'access_token', 'OTHER.RIC')
+
+            self.assertEqual(len(responses.calls), 3)
+            self.assertEqual(cache.stats(), {'hits': 4, 'misses': 3, 'entries': 3})
+
+    @responses.activate
+    def test_controller_cache_skip_error(self):
+        """
+        Test that ESG error blocks are not cached
+        """
+        responses.add(responses.Response(method= 'GET', url = self.esg_endpoint, json = {'error': {'code': 412, 'description': 'Unable to resolve all requested identifiers.'}},
+                                         status= 200, content_type= 'application/json'))
+        cache = rdp_cache.MemoryCache()
+
+        with rdp_http_controller.RDPHTTPController(cache = cache) as controller:
+            controller.rdp_request_esg(self.esg_endpoint, 'access_token', 'INVALID.RIC')
+            controller.rdp_request_esg(self.esg_endpoint, 'access_token', 'INVALID.RIC')
+
+        self.assertEqual(len(responses.calls), 2)
+        self.assertEqual(len(cache), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import unittest
+import asyncio
+import json
+import sys
+import os
+from dotenv import dotenv_values
+config = dotenv_values("../.env.test")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_async_http_controller
+from rdp_controller import rdp_codec
+from tests.mock_rdp_server import MockRDPServer
+
+class TestRDPCodec(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open('./fixtures/rdp_test_esg_fixture.json', 'rb') as esg_fixture_input:
+            cls.esg_bytes = esg_fixture_input.read()
+
+    def test_loads(self):
+        """
+        Test that loads() parses bytes and str, and falls back to the json module for NaN and big integers
+        """
+        self.assertEqual(rdp_codec.loads(self.esg_bytes), json.loads(self.esg_bytes))
+        self.assertEqual(rdp_codec.loads(self.esg_bytes.decode('utf-8')), json.loads(self.esg_bytes))
+        self.assertEqual(rdp_codec.loads(b'{"value": 18446744073709551616}'), {'value': 2 ** 64})
+        self.assertNotEqual(rdp_codec.loads(b'[NaN]')[0], rdp_codec.loads(b'[NaN]')[0])
+        with self.assertRaises(ValueError):
+            rdp_codec.loads(b'{"value": ')
+
+    def test_compress_round_trip(self):
+        """
+        Test that every available content coding round trips and that unknown codings raise ValueError
+        """
+        self.assertIn('gzip', rdp_codec.COMPRESSORS)
+        for encoding in rdp_codec.COMPRESSORS:
+            compressed = rdp_codec.compress(self.esg_bytes, encoding)
+            self.assertLess(len(compressed), len(self.esg_bytes))
+            self.assertEqual(rdp_codec.decompress(compressed, encoding), self.esg_bytes)
+        self.assertEqual(rdp_codec.decompress(self.esg_bytes, None), self.esg_bytes)
+        with self.assertRaises(ValueError):
+            rdp_codec.compress(self.esg_bytes, 'lzma')
+        with self.assertRaises(ValueError):
+            rdp_http_controller.RDPHTTPController(request_compression = 'lzma')
+
+    def test_compressed_responses(self):
+        """
+        Test that the controller advertises the available codings and decodes compressed ESG and Search Explore responses
+        """
+        for encoding in rdp_codec.COMPRESSORS:
+            with MockRDPServer(compression = (encoding,)) as server, rdp_http_controller.RDPHTTPController() as controller:
+                esg_data = controller.rdp_request_esg(server.esg_url, 'access_token', 'TEST.RIC')
+                esg_rows = list(controller.rdp_stream_esg(server.esg_url, 'access_token', 'TEST.RIC'))
+                search_data = controller.rdp_request_search_explore(server.search_url, 'access_token', {'View': 'Entities'})
+
+                self.assertEqual(esg_data, json.loads(self.esg_bytes))
+                self.assertEqual(esg_rows, esg_data['data'])
+                self.assertIn('Hits', search_data)
+                for method, path, headers, body in server.calls:
+                    self.assertIn(encoding, headers['Accept-Encoding'])
+
+    def test_compressed_async_responses(self):
+        """
+        Test that RDPAsyncHTTPController decodes compressed ESG responses
+        """
+        async def request_esg(esg_url):
+            async with rdp_async_http_controller.RDPAsyncHTTPController() as controller:
+                return await controller.rdp_request_esg(esg_url, 'access_token', 'TEST.RIC')
+
+        with MockRDPServer(compression = ('gzip',)) as server:
+            esg_data = asyncio.run(request_esg(server.esg_url))
+
+        self.assertEqual(esg_data, json.loads(self.esg_bytes))
+
+    def test_compressed_request_body(self):
+        """
+        Test that Search Explore request bodies above request_compression_min_size are sent compressed
+        """
+        small_payload = {'View': 'Entities'}
+        large_payload = {'View': 'Entities', 'Filter': ' or '.join(f"RIC eq 'RIC{index}.L'" for index in range(100))}
+        with MockRDPServer() as server, rdp_http_controller.RDPHTTPController(request_compression = 'gzip', request_compression_min_size = 512) as controller:
+            controller.rdp_request_search_explore(server.search_url, 'access_token', small_payload)
+            controller.rdp_request_search_explore(server.search_url, 'access_token', large_payload)
+
+            small_call, large_call = server.calls
+            self.assertNotIn('Content-Encoding', small_call[2])
+            self.assertEqual(json.loads(small_call[3]), small_payload)
+            self.assertEqual(large_call[2]['Content-Encoding'], 'gzip')
+            self.assertEqual(json.loads(rdp_codec.decompress(large_call[3], 'gzip')), large_payload)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import unittest
+import pandas as pd
+import json
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from rdp_controller import rdp_dataframe
+from rdp_controller import rdp_columnar_store
+
+@unittest.skipIf(rdp_columnar_store.pa is None, 'pyarrow is not installed')
+class TestRDPColumnarStore(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open('./fixtures/rdp_test_esg_fixture.json', 'r') as esg_fixture_input:
+            cls.mock_esg_data = json.loads(esg_fixture_input.read())
+        with open('./fixtures/rdp_test_search_fixture.json', 'r') as search_fixture_input:
+            cls.mock_search_data = json.loads(search_fixture_input.read())
+        cls.esg_df = rdp_dataframe.build_dataframe(cls.mock_esg_data['headers'], cls.mock_esg_data['data'])
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_append_esg_one_file(self):
+        """
+        Test that an ESG batch is written as one file and read back with its columns, column order and dtypes
+        """
+        for file_format in ('parquet', 'feather'):
+            store = rdp_columnar_store.ColumnarStore(os.path.join(self.temp_dir.name, file_format), file_format)
+            store.append_esg(self.esg_df)
+
+            self.assertEqual(len(os.listdir(os.path.join(store.directory, 'esg'))), 1)
+            result = store.read('esg').sort_values('Period End Date', ascending = False, ignore_index = True)
+            self.assertEqual(list(result.columns), list(self.esg_df.columns))
+            self.assertEqual(len(result), len(self.esg_df))
+            self.assertEqual(result['ESG Score'].dtype, 'float64')
+            self.assertTrue(pd.api.types.is_datetime64_dtype(result['Period End Date']))
+            self.assertIsInstance(result['Instrument'].dtype, pd.CategoricalDtype)
+            self.assertEqual(result['ESG Score'].tolist(), self.esg_df['ESG Score'].tolist())
+
+    def test_incremental_append(self):
+        """
+        Test that every append adds new files without rewriting the existing ones, and a filter reads one instrument only
+        """
+        store = rdp_columnar_store.ColumnarStore(self.temp_dir.name, 'feather')
+        store.append_esg(self.esg_df)
+        first_files = sorted(store.dataset('esg').files)
+        other_df = self.esg_df.assign(Instrument = pd.Categorical(['OTHER.RIC'] * len(self.esg_df)))
+        store.append_esg(other_df)
+
+        self.assertTrue(set(first_files) < set(store.dataset('esg').files))
+        self.assertEqual(len(store.read('esg')), 2 * len(self.esg_df))
+        result = store.read('esg', columns = ['Instrument', 'ESG Score'], filter = rdp_columnar_store.ds.field('Instrument') == 'OTHER.RIC')
+        self.assertEqual(list(result.columns), ['Instrument', 'ESG Score'])
+        self.assertEqual(set(result['Instrument']), {'OTHER.RIC'})
+        self.assertEqual(len(result), len(self.esg_df))
+
+    def test_append_search(self):
+        """
+        Test that Search Explore hits are stored and read back
+        """
+        store = rdp_columnar_store.ColumnarStore(self.temp_dir.name)
+        store.append_search(self.mock_search_data['Hits'])
+        store.append_search([])
+
+        result = store.read('search', memory_map = False)
+        self.assertEqual(len(os.listdir(os.path.join(store.directory, 'search'))), 1)
+        self.assertEqual(list(result.columns), list(pd.DataFrame(self.mock_search_data['Hits']).columns))
+        self.assertEqual(len(result), len(self.mock_search_data['Hits']))
+        self.assertEqual(result['IssuerCommonName'].iloc[0], self.mock_search_data['Hits'][0]['IssuerCommonName'])
+
+    def test_append_search_differing_columns(self):
+        """
+        Test that search batches with missing or all-null fields are read back with every column, in append order
+        """
+        for file_format in ('parquet', 'feather'):
+            store = rdp_columnar_store.ColumnarStore(os.path.join(self.temp_dir.name, file_format), file_format)
+            store.append_search([{'RIC': 'A.L', 'IssueISIN': None}])
+            store.append_search([{'RIC': 'B.L', 'IssueISIN': 'GB123', 'ExchangeName': 'LSE'}])
+            store.append_search([{'RIC': 'C.L'}])
+
+            result = store.read('search').sort_values('RIC', ignore_index = True)
+            self.assertEqual(list(result.columns), ['RIC', 'IssueISIN', 'ExchangeName'])
+            self.assertEqual(result['RIC'].tolist(), ['A.L', 'B.L', 'C.L'])
+            self.assertEqual(result['IssueISIN'].tolist()[1], 'GB123')
+            self.assertTrue(pd.isna(result['IssueISIN'].iloc[0]))
+            self.assertEqual(result['ExchangeName'].tolist()[1], 'LSE')
+
+    def test_invalid_format(self):
+        """
+        Test that an unsupported file format raises ValueError
+        """
+        with self.assertRaises(ValueError):
+            rdp_columnar_store.ColumnarStore(self.temp_dir.name, 'csv')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import unittest
+import copy
+import sys
+import os
+from dotenv import dotenv_values
+config = dotenv_values("../.env.test")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_cache
+from tests.mock_rdp_server import MockRDPServer, load_fixture
+
+class TestRDPConditionalRequests(unittest.TestCase):
+
+    # Start one local RDP stand-in server that sends ETag/Last-Modified validators with the ESG data
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockRDPServer(conditional = True).start()
+        cls.mock_esg_data = load_fixture('rdp_test_esg_fixture.json')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.reset()
+        self.server.set_esg_data(self.mock_esg_data)
+
+    def get_esg_requests(self):
+        return [headers for method, path, headers, body in self.server.calls if path.startswith(config['RDP_ESG_URL'])]
+
+    def test_esg_not_modified(self):
+        """
+        Test that a repeated ESG request sends the validators and returns the kept body on HTTP 304
+        """
+        with rdp_http_controller.RDPHTTPController(conditional_requests = True) as controller:
+            first_response = controller.rdp_request_esg(self.server.esg_url, 'access_token', 'TEST.RIC')
+            second_response = controller.rdp_request_esg(self.server.esg_url, 'access_token', 'TEST.RIC')
+
+        self.assertEqual(first_response, self.mock_esg_data)
+        self.assertEqual(second_response, self.mock_esg_data)
+        first_headers, second_headers = self.get_esg_requests()
+        self.assertNotIn('If-None-Match', first_headers)
+        self.assertIn('If-None-Match', second_headers)
+        self.assertIn('If-Modified-Since', second_headers)
+
+    def test_esg_modified(self):
+        """
+        Test that changed ESG data is returned with HTTP 200 and replaces the kept body
+        """
+        changed_esg_data = copy.deepcopy(self.mock_esg_data)
+        changed_esg_data['data'] = changed_esg_data['data'][:1]
+
+        with rdp_http_controller.RDPHTTPController(conditional_requests = True) as controller:
+            controller.rdp_request_esg(self.server.esg_url, 'access_token', 'TEST.RIC')
+            self.server.set_esg_data(changed_esg_data)
+            self.assertEqual(controller.rdp_request_esg(self.server.esg_url, 'access_token', 'TEST.RIC'), changed_esg_data)
+            self.assertEqual(controller.rdp_request_esg(self.server.esg_url, 'access_token', 'TEST.RIC'), changed_esg_data)
+
+    def test_esg_not_modified_refreshes_cache(self):
+        """
+        Test that a HTTP 304 response refreshes the expired response cache entry
+        """
+        now = [0.0]
+        cache = rdp_cache.MemoryCache(ttl = 60, clock = lambda: now[0])
+
+        with rdp_http_controller.RDPHTTPController(cache = cache, conditional_requests = True) as controller:
+            controller.rdp_request_esg(self.server.esg_url, 'access_token', 'TEST.RIC')
+            now[0] += 60
+            self.assertEqual(controller.rdp_request_esg(self.server.esg_url, 'access_token', 'TEST.RIC'), self.mock_esg_data)
+            self.assertEqual(controller.rdp_request_esg(self.server.esg_url, 'access_token', 'TEST.RIC'), self.mock_esg_data)
+
+        self.assertEqual(len(self.get_esg_requests()), 2)
+
+    def test_conditional_requests_disabled(self):
+        """
+        Test that conditional requests are opt-in: no validators are sent by a default controller
+        """
+        with rdp_http_controller.RDPHTTPController() as controller:
+            for _ in range(2):
+                self.assertEqual(controller.rdp_request_esg(self.server.esg_url, 'access_token', 'TEST.RIC'), self.mock_esg_data)
+
+        for headers in self.get_esg_requests():
+            self.assertNotIn('If-None-Match', headers)
+            self.assertNotIn('If-Modified-Since', headers)
+
+if __name__ == '__main__':
+    unittest.main()
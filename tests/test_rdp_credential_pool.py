@@ -0,0 +1,195 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import unittest
+import responses
+import requests
+import json
+import sys
+import os
+from urllib.parse import parse_qs
+from dotenv import dotenv_values
+config = dotenv_values("../.env.test")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_retry
+from rdp_controller import rdp_credential_pool
+
+class TestRDPCredentialPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.base_URL = config['RDP_BASE_URL']
+        cls.auth_endpoint = cls.base_URL + config['RDP_AUTH_URL']
+        cls.esg_endpoint = cls.base_URL + config['RDP_ESG_URL']
+        cls.search_endpoint = cls.base_URL + config['RDP_SEARCH_EXPLORE_URL']
+        with open('./fixtures/rdp_test_auth_fixture.json', 'r') as auth_fixture_input:
+            cls.mock_valid_auth_json = json.loads(auth_fixture_input.read())
+        with open('./fixtures/rdp_test_esg_fixture.json', 'r') as esg_fixture_input:
+            cls.mock_esg_data = json.loads(esg_fixture_input.read())
+        cls.credentials = [(f'user{index}', config['RDP_PASSWORD'], config['RDP_CLIENTID']) for index in range(3)]
+
+    def setUp(self):
+        self.now = 1000.0
+        self.sleeps = []
+        self.failed_logins = set()
+        self.throttled_tokens = set()
+        self.esg_tokens = []
+        self.controller = rdp_http_controller.RDPHTTPController(retry_policy = rdp_retry.RetryPolicy(max_retries = 0), single_flight = False)
+
+    def tearDown(self):
+        self.controller.close()
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def create_pool(self, **options):
+        return rdp_credential_pool.CredentialPool(self.controller, self.auth_endpoint, self.credentials, clock = lambda: self.now, sleep = self.sleep, **options)
+
+    # Every account gets the Access Token 'token_<username>', logins of the failed_logins users are rejected
+    def auth_callback(self, request):
+        username = parse_qs(request.body)['username'][0]
+        if username in self.failed_logins:
+            return (401, {}, json.dumps({'error': 'invalid_client'}))
+        return (200, {}, json.dumps(dict(self.mock_valid_auth_json, access_token = f'token_{username}')))
+
+    # ESG requests with a throttled_tokens Access Token get HTTP 429
+    def esg_callback(self, request):
+        access_token = request.headers['Authorization'].split(' ')[1]
+        self.esg_tokens.append(access_token)
+        if access_token in self.throttled_tokens:
+            return (429, {'Retry-After': '120'}, json.dumps({'error': 'Too Many Requests'}))
+        return (200, {}, json.dumps(self.mock_esg_data))
+
+    def add_callbacks(self):
+        responses.add_callback(responses.POST, self.auth_endpoint, callback = self.auth_callback, content_type = 'application/json')
+        responses.add_callback(responses.GET, self.esg_endpoint, callback = self.esg_callback, content_type = 'application/json')
+
+    @responses.activate
+    def test_least_outstanding_routing(self):
+        """
+        Test that every account logs in and the requests are spread evenly across the accounts
+        """
+        self.add_callbacks()
+
+        with self.create_pool() as pool:
+            for _ in range(9):
+                self.assertIn('data', pool.request_esg(self.esg_endpoint, 'TEST.RIC'))
+            stats = pool.stats()
+
+        self.assertEqual(sorted(self.esg_tokens), sorted(['token_user0', 'token_user1', 'token_user2'] * 3))
+        self.assertEqual([account['requests'] for account in stats.values()], [3, 3, 3])
+        self.assertEqual([account['outstanding'] for account in stats.values()], [0, 0, 0])
+
+    @responses.activate
+    def test_throttled_account_out_of_rotation(self):
+        """
+        Test that HTTP 429 sends the request again on another account and takes the account out of rotation until Retry-After elapses
+        """
+        self.add_callbacks()
+        self.throttled_tokens.add('token_user0')
+
+        with self.create_pool(cooldown = 60) as pool:
+            for _ in range(4):
+                self.assertIn('data', pool.request_esg(self.esg_endpoint, 'TEST.RIC'))
+            self.assertEqual(self.esg_tokens.count('token_user0'), 1)
+            self.assertFalse(pool.stats()['user0']['available'])
+
+            self.throttled_tokens.clear()
+            self.now += 120
+            pool.request_esg(self.esg_endpoint, 'TEST.RIC')
+            self.assertTrue(pool.stats()['user0']['available'])
+            self.assertEqual(self.esg_tokens[-1], 'token_user0')
+
+    @responses.activate
+    def test_throttled_failover_default_controller(self):
+        """
+        Test that with a default controller (retrying HTTP 429) the pool fails over on HTTP 429 without retrying on the same account
+        """
+        self.add_callbacks()
+        self.throttled_tokens.add('token_user0')
+
+        with rdp_http_controller.RDPHTTPController() as controller, \
+             rdp_credential_pool.CredentialPool(controller, self.auth_endpoint, self.credentials, clock = lambda: self.now, sleep = self.sleep) as pool:
+            self.assertIn('data', pool.request_esg(self.esg_endpoint, 'TEST.RIC'))
+
+            self.assertEqual(self.esg_tokens, ['token_user0', 'token_user1'])
+            self.assertFalse(pool.stats()['user0']['available'])
+            self.assertIn(429, controller.retry_policy.retry_statuses)
+            self.assertNotIn(429, pool.controller.retry_policy.retry_statuses)
+
+    @responses.activate
+    def test_login_failure(self):
+        """
+        Test that accounts failing to login start out of rotation and no available account raises NoAccountAvailableError
+        """
+        self.add_callbacks()
+        self.failed_logins.update(['user0', 'user1'])
+
+        with self.create_pool() as pool:
+            for _ in range(2):
+                pool.request_esg(self.esg_endpoint, 'TEST.RIC')
+            self.assertEqual(self.esg_tokens, ['token_user2', 'token_user2'])
+
+            self.throttled_tokens.add('token_user2')
+            with self.assertRaises(rdp_credential_pool.NoAccountAvailableError) as exception_context:
+                pool.request_esg(self.esg_endpoint, 'TEST.RIC')
+            self.assertEqual(exception_context.exception.__cause__.response.status_code, 429)
+
+        self.failed_logins.add('user2')
+        with self.assertRaises(rdp_credential_pool.NoAccountAvailableError):
+            self.create_pool().start()
+
+    @responses.activate
+    def test_remaining_quota_routing(self):
+        """
+        Test that the remaining_quota strategy routes to the account with the most quota left and waits when all quotas are spent
+        """
+        self.add_callbacks()
+
+        with self.create_pool(strategy = 'remaining_quota', quota_rate = 1, quota_capacity = 2) as pool:
+            for _ in range(6):
+                pool.request_esg(self.esg_endpoint, 'TEST.RIC')
+            self.assertEqual(self.sleeps, [])
+            pool.request_esg(self.esg_endpoint, 'TEST.RIC')
+
+        self.assertEqual(sorted(self.esg_tokens[:6]), sorted(['token_user0', 'token_user1', 'token_user2'] * 2))
+        self.assertEqual(self.sleeps, [1.0])
+
+    @responses.activate
+    def test_request_error_not_rerouted(self):
+        """
+        Test that request errors other than auth failures and HTTP 429 are raised without taking the account out of rotation
+        """
+        self.add_callbacks()
+        responses.add(responses.Response(method= 'POST', url = self.search_endpoint, json = {'error': 'Bad Request'}, status= 400))
+
+        with self.create_pool() as pool:
+            with self.assertRaises(requests.exceptions.HTTPError):
+                pool.request_search_explore(self.search_endpoint, {'View': 'Entities'})
+            self.assertTrue(all(account['available'] for account in pool.stats().values()))
+
+    def test_invalid_arguments(self):
+        """
+        Test that missing credentials or an unknown strategy raise errors
+        """
+        with self.assertRaises(TypeError):
+            rdp_credential_pool.CredentialPool(self.controller, self.auth_endpoint, [])
+        with self.assertRaises(ValueError):
+            self.create_pool(strategy = 'round_robin')
+        with self.assertRaises(ValueError):
+            self.create_pool(strategy = 'remaining_quota')
+
+if __name__ == '__main__':
+    unittest.main()
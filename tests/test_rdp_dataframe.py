@@ -0,0 +1,81 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from rdp_controller import rdp_dataframe
+
+class TestRDPDataFrame(unittest.TestCase):
+
+    def setUp(self):
+        self.headers = [
+            {'title': 'Instrument', 'type': 'string'},
+            {'title': 'Period End Date', 'type': 'date'},
+            {'title': 'ESG Score', 'type': 'number'},
+            {'title': 'Last Update Date', 'type': 'datetime'}
+        ]
+
+    def test_build_dataframe_nulls(self):
+        """
+        Test that null values become NaN/NaT and mistyped numbers are coerced
+        """
+        rows = [
+            ['TEST.RIC', '2021-12-31', 10.5, '2022-06-23T00:00:00'],
+            ['TEST.RIC', None, None, None],
+            ['TEST.RIC', '2019-12-31', 'n/a', '2020-06-23T00:00:00']
+        ]
+
+        result = rdp_dataframe.build_dataframe(self.headers, rows)
+
+        self.assertEqual(result['ESG Score'].dtype, np.float64)
+        self.assertEqual(result['ESG Score'].iloc[0], 10.5)
+        self.assertTrue(np.isnan(result['ESG Score'].iloc[1]))
+        self.assertTrue(np.isnan(result['ESG Score'].iloc[2]))
+        self.assertTrue(pd.isna(result['Period End Date'].iloc[1]))
+        self.assertEqual(result['Last Update Date'].iloc[0], pd.Timestamp('2022-06-23'))
+        self.assertEqual(list(result['Instrument'].cat.categories), ['TEST.RIC'])
+
+    def test_build_dataframe_empty(self):
+        """
+        Test that an empty data block produces an empty typed DataFrame
+        """
+        result = rdp_dataframe.build_dataframe(self.headers, [])
+
+        self.assertTrue(result.empty)
+        self.assertEqual(list(result.columns), ['Instrument', 'Period End Date', 'ESG Score', 'Last Update Date'])
+        self.assertEqual(result['ESG Score'].dtype, np.float64)
+
+    def test_build_dataframe_duplicate_titles(self):
+        """
+        Test that columns with the same header title keep their own values
+        """
+        headers = [{'title': 'Instrument', 'type': 'string'}, {'title': 'X', 'type': 'number'}, {'title': 'X', 'type': 'number'}]
+
+        result = rdp_dataframe.build_dataframe(headers, [['A', 1, 2]])
+
+        self.assertEqual(list(result.columns), ['Instrument', 'X', 'X'])
+        self.assertEqual(result.iloc[0].tolist(), ['A', 1.0, 2.0])
+
+    def test_build_dataframe_ragged_rows(self):
+        """
+        Test that rows not matching the headers are rejected
+        """
+        with self.assertRaises(ValueError):
+            rdp_dataframe.build_dataframe(self.headers, [['TEST.RIC', '2021-12-31']])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import unittest
+import pandas as pd
+import numpy as np
+import json
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from rdp_controller import rdp_dataframe
+from rdp_controller import rdp_esg_analytics
+
+class TestRDPESGAnalytics(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open('./fixtures/rdp_test_esg_fixture.json', 'r') as esg_fixture_input:
+            cls.mock_esg_data = json.loads(esg_fixture_input.read())
+        # Two instruments in the API order (latest period first), B.L has three periods and 1 point more ESG Score
+        rows = [['B.L', row[1], row[2] + 1] + row[3:] for row in cls.mock_esg_data['data'][:3]] + cls.mock_esg_data['data']
+        cls.esg_df = rdp_dataframe.build_dataframe(cls.mock_esg_data['headers'], rows)
+
+    # Per-instrument reference of the YoY changes, sorted by instrument then period
+    def changes_loop(self, title):
+        changes = []
+        for instrument, rows in self.esg_df.groupby('Instrument', observed = True):
+            values = rows.sort_values('Period End Date')[title].tolist()
+            changes += [np.nan] + [current - previous for previous, current in zip(values, values[1:])]
+        return changes
+
+    def test_grade_to_numeric(self):
+        """
+        Test that categorical and object grades map to the scale, missing and unknown grades to NaN
+        """
+        np.testing.assert_array_equal(rdp_esg_analytics.grade_to_numeric(self.esg_df['TEST 6 Score Grade'].iloc[3:]), [12, 8, 6, 2, 12])
+        np.testing.assert_array_equal(rdp_esg_analytics.grade_to_numeric(['A+', None, 'Z', 'D-', 'A+']), [12, np.nan, np.nan, 1, 12])
+        np.testing.assert_array_equal(rdp_esg_analytics.grade_to_numeric(['A', 'B'], {'A': 2, 'B': 1}), [2, 1])
+
+    def test_latest_periods(self):
+        """
+        Test that the latest periods of every instrument are selected in instrument then period order, rows without a period are ignored
+        """
+        latest_df = rdp_esg_analytics.latest_periods(self.esg_df)
+        self.assertEqual(latest_df['Instrument'].tolist(), ['B.L', 'TEST.RIC'])
+        self.assertEqual(latest_df['Period End Date'].dt.year.tolist(), [2021, 2021])
+        self.assertEqual(latest_df['ESG Score'].tolist(), [self.mock_esg_data['data'][0][2] + 1, self.mock_esg_data['data'][0][2]])
+
+        latest_df = rdp_esg_analytics.latest_periods(self.esg_df, periods = 2)
+        self.assertEqual(latest_df['Period End Date'].dt.year.tolist(), [2020, 2021, 2020, 2021])
+
+        esg_df = self.esg_df.copy()
+        esg_df.loc[0, 'Period End Date'] = pd.NaT
+        latest_df = rdp_esg_analytics.latest_periods(esg_df)
+        self.assertEqual(latest_df['Period End Date'].dt.year.tolist(), [2020, 2021])
+        self.assertEqual(len(rdp_esg_analytics.latest_periods(self.esg_df.iloc[:0])), 0)
+
+    def test_period_changes(self):
+        """
+        Test that the YoY changes match the per-instrument loop and do not cross instruments
+        """
+        changes_df = rdp_esg_analytics.period_changes(self.esg_df)
+
+        self.assertEqual(changes_df['Instrument'].tolist(), ['B.L'] * 3 + ['TEST.RIC'] * 5)
+        self.assertIn('TEST 9 Scope Change', changes_df.columns)
+        self.assertNotIn('TEST 6 Score Grade Change', changes_df.columns)
+        for title in ('ESG Score', 'ESG Controversies Score'):
+            np.testing.assert_allclose(changes_df[f'{title} Change'], self.changes_loop(title))
+
+        changes_df = rdp_esg_analytics.period_changes(self.esg_df, ['ESG Controversies Score'], periods = 2)
+        self.assertEqual(list(changes_df.columns), ['Instrument', 'Period End Date', 'ESG Controversies Score Change'])
+        self.assertEqual(changes_df['ESG Controversies Score Change'].isna().tolist(), [True, True, False, True, True, False, False, False])
+
+    def test_grade_transitions(self):
+        """
+        Test the grade transitions between consecutive periods and their count matrix
+        """
+        transitions_df = rdp_esg_analytics.grade_transitions(self.esg_df, 'TEST 6 Score Grade')
+
+        self.assertEqual(transitions_df['From'].tolist()[:4], [np.nan, 'C+', 'B', np.nan])
+        self.assertEqual(transitions_df['To'].tolist()[:4], ['C+', 'B', 'A+', 'A+'])
+        np.testing.assert_array_equal(transitions_df['Change'], [np.nan, 2, 4, np.nan, -10, 4, 2, 4])
+
+        matrix = rdp_esg_analytics.grade_transition_matrix(self.esg_df, 'TEST 6 Score Grade')
+        self.assertEqual(matrix.shape, (12, 12))
+        self.assertEqual(matrix.values.sum(), 6)
+        self.assertEqual(matrix.loc['C+', 'B'], 2)
+        self.assertEqual(matrix.loc['A+', 'D'], 1)
+
+    def test_cross_sectional_ranks(self):
+        """
+        Test the universe-wide and per-period percentile ranks
+        """
+        latest_df = rdp_esg_analytics.latest_periods(self.esg_df)
+        ranks = rdp_esg_analytics.cross_sectional_ranks(latest_df, ['ESG Score'])
+        self.assertEqual(ranks['ESG Score Rank'].tolist(), [1.0, 0.5])
+
+        ranks = rdp_esg_analytics.cross_sectional_ranks(self.esg_df, ['ESG Score', 'ESG Controversies Score'], by = 'Period End Date')
+        self.assertEqual(list(ranks.columns), ['ESG Score Rank', 'ESG Controversies Score Rank'])
+        self.assertEqual(ranks['ESG Score Rank'].tolist(), [1.0, 1.0, 1.0, 0.5, 0.5, 0.5, 1.0, 1.0])
+        self.assertEqual(ranks['ESG Controversies Score Rank'].tolist()[:6], [0.75, 0.75, 0.75, 0.75, 0.75, 0.75])
+
+    def test_latest_summary(self):
+        """
+        Test that the summary combines the latest period, the YoY changes, the grade changes and the ranks
+        """
+        summary_df = rdp_esg_analytics.latest_summary(self.esg_df, ['ESG Score', 'ESG Controversies Score'], ['TEST 6 Score Grade'])
+
+        self.assertEqual(summary_df['Instrument'].tolist(), ['B.L', 'TEST.RIC'])
+        self.assertEqual(summary_df['ESG Controversies Score Change'].tolist(), [11.25, 11.25])
+        self.assertEqual(summary_df['TEST 6 Score Grade'].tolist(), ['A+', 'A+'])
+        self.assertEqual(summary_df['TEST 6 Score Grade Change'].tolist(), [4.0, 4.0])
+        self.assertEqual(summary_df['ESG Score Rank'].tolist(), [1.0, 0.5])
+
+if __name__ == '__main__':
+    unittest.main()
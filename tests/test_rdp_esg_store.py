@@ -0,0 +1,116 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import unittest
+import pandas as pd
+import numpy as np
+import json
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from rdp_controller import rdp_dataframe
+from rdp_controller import rdp_esg_store
+
+class TestRDPESGStore(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open('./fixtures/rdp_test_esg_fixture.json', 'r') as esg_fixture_input:
+            cls.mock_esg_data = json.loads(esg_fixture_input.read())
+        # Two instruments with interleaved rows, the second one has a higher ESG Score every period
+        rows = []
+        for row in cls.mock_esg_data['data']:
+            rows.append(['B.L', row[1], row[2] + 1] + row[3:])
+            rows.append(['A.L'] + row[1:])
+        cls.esg_data = {'headers': cls.mock_esg_data['headers'], 'data': rows}
+        cls.store = rdp_esg_store.ESGRecordStore.from_json(cls.esg_data)
+
+    def store_title_index(self, title):
+        return [header['title'] for header in self.mock_esg_data['headers']].index(title)
+
+    def test_column_types(self):
+        """
+        Test that scores are float arrays, dates are datetime64 arrays and strings are interned categorical codes
+        """
+        self.assertEqual(len(self.store), 10)
+        self.assertEqual(self.store.columns['ESG Score'].dtype, np.float64)
+        self.assertEqual(self.store.columns['Period End Date'].dtype, np.dtype('datetime64[ns]'))
+        self.assertTrue(np.issubdtype(self.store.columns['TEST 7 Score Grade'].dtype, np.integer))
+        self.assertEqual(list(self.store.categories['Instrument']), ['A.L', 'B.L'])
+
+    def test_latest(self):
+        """
+        Test that latest returns the values of the latest period of an instrument and None for an unknown instrument
+        """
+        latest_row = self.mock_esg_data['data'][0]
+
+        self.assertEqual(self.store.instruments, ['A.L', 'B.L'])
+        self.assertEqual(self.store.latest('A.L', 'ESG Score'), latest_row[2])
+        self.assertEqual(self.store.latest('B.L', 'ESG Score'), latest_row[2] + 1)
+        self.assertEqual(self.store.latest('A.L', ['Period End Date', 'TEST 7 Score Grade']),
+                         {'Period End Date': pd.Timestamp(latest_row[1]), 'TEST 7 Score Grade': latest_row[self.store_title_index('TEST 7 Score Grade')]})
+        self.assertIsNone(self.store.latest('UNKNOWN.L'))
+        self.assertNotIn('UNKNOWN.L', self.store)
+
+    def test_missing_periods(self):
+        """
+        Test that rows without a period are not indexed: latest skips them and an instrument with no dated period is unknown
+        """
+        rows = [['C.L', None] + self.mock_esg_data['data'][0][2:]] + [list(row) for row in self.esg_data['data']]
+        rows.append(['A.L', None, 0.0] + self.mock_esg_data['data'][0][3:])
+        store = rdp_esg_store.ESGRecordStore.from_json({'headers': self.mock_esg_data['headers'], 'data': rows})
+
+        self.assertEqual(len(store), 12)
+        self.assertEqual(store.instruments, ['A.L', 'B.L'])
+        self.assertIsNone(store.latest('C.L'))
+        self.assertEqual(store.latest('A.L', 'ESG Score'), self.mock_esg_data['data'][0][2])
+        self.assertEqual(len(store.history('A.L')), 5)
+        self.assertEqual(len(store.between()), 10)
+
+    def test_range_scans(self):
+        """
+        Test that history returns the periods of an instrument in a date range and between scans all instruments
+        """
+        history = self.store.history('B.L', '2018-01-01', '2020-12-31', columns = ['Instrument', 'Period End Date', 'ESG Score'])
+
+        self.assertEqual(list(history['Period End Date'].dt.year), [2018, 2019, 2020])
+        self.assertEqual(set(history['Instrument']), {'B.L'})
+        self.assertEqual(len(self.store.history('A.L')), 5)
+        self.assertTrue(self.store.history('UNKNOWN.L').empty)
+
+        between = self.store.between('2021-01-01', '2021-12-31')
+        self.assertEqual(sorted(between['Instrument']), ['A.L', 'B.L'])
+
+    def test_dataframe_round_trip(self):
+        """
+        Test that the store converts to and from a DataFrame with the same typed columns
+        """
+        esg_df = rdp_dataframe.build_dataframe(self.esg_data['headers'], self.esg_data['data'])
+        store = rdp_esg_store.ESGRecordStore.from_dataframe(esg_df)
+        result = store.to_dataframe()
+        expected = esg_df.sort_values(['Instrument', 'Period End Date'], ignore_index = True)
+
+        self.assertEqual(list(result.columns), list(esg_df.columns))
+        self.assertIsInstance(result['TEST 7 Score Grade'].dtype, pd.CategoricalDtype)
+        pd.testing.assert_frame_equal(result, expected, check_categorical = False)
+
+    def test_invalid_input(self):
+        """
+        Test that missing headers or key columns raise errors
+        """
+        with self.assertRaises(TypeError):
+            rdp_esg_store.ESGRecordStore.from_json({'message': 'Invalid'})
+        with self.assertRaises(ValueError):
+            rdp_esg_store.ESGRecordStore({'ESG Score': np.array([1.0])})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import unittest
+import copy
+import json
+import tempfile
+import sys
+import os
+from dotenv import dotenv_values
+config = dotenv_values("../.env.test")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_token_manager
+from rdp_controller import rdp_esg_sync
+from rdp_controller import rdp_dataframe
+from tests.mock_rdp_server import MockRDPServer
+
+class TestRDPESGSync(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open('./fixtures/rdp_test_esg_fixture.json', 'r') as esg_fixture_input:
+            cls.mock_esg_data = json.loads(esg_fixture_input.read())
+
+    def setUp(self):
+        self.server = MockRDPServer().start()
+        self.controller = rdp_http_controller.RDPHTTPController()
+        self.token_manager = rdp_token_manager.RDPTokenManager(self.controller, self.server.auth_url, config['RDP_USERNAME'], config['RDP_PASSWORD'], config['RDP_CLIENTID']).start()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.state_path = os.path.join(self.temp_dir.name, 'esg_sync.json')
+
+    def tearDown(self):
+        self.token_manager.stop()
+        self.controller.close()
+        self.server.stop()
+        self.temp_dir.cleanup()
+
+    def esg_requests(self):
+        return [path for method, path, headers, body in self.server.calls if path.startswith(config['RDP_ESG_URL'])]
+
+    # Fixture with a new latest period (copy of the latest row) and the given row update timestamps
+    def esg_data_with_new_periods(self, new_periods, update_dates = None):
+        esg_data = copy.deepcopy(self.mock_esg_data)
+        for period in new_periods:
+            row = list(esg_data['data'][0])
+            row[1] = period
+            esg_data['data'].insert(0, row)
+        for row in esg_data['data']:
+            if update_dates and row[1] in update_dates:
+                row[-1] = update_dates[row[1]]
+        return esg_data
+
+    def test_delta_sync(self):
+        """
+        Test that a known instrument requests the latest periods only, inserts new periods and replaces updated rows
+        """
+        sync = self.token_manager.esg_sync(self.server.esg_url, self.state_path)
+        stats = sync.sync(['TEST.RIC'])
+        self.assertEqual((stats['full'], stats['delta'], stats['inserted']), (1, 0, 5))
+
+        stats = sync.sync(['TEST.RIC'])
+        self.assertEqual((stats['full'], stats['delta'], stats['received'], stats['unchanged']), (0, 1, 2, 2))
+        self.assertIn('start=-1&end=0', self.esg_requests()[-1])
+
+        self.server.set_esg_data(self.esg_data_with_new_periods(['2022-12-31'], {'2021-12-31': '2023-01-15T00:00:00'}))
+        stats = sync.sync(['TEST.RIC'])
+
+        self.assertEqual((stats['received'], stats['inserted'], stats['updated'], stats['unchanged']), (2, 1, 1, 0))
+        esg_data = sync.to_json()
+        self.assertEqual([row[1] for row in esg_data['data']], ['2022-12-31', '2021-12-31', '2020-12-31', '2019-12-31', '2018-12-31', '2017-12-31'])
+        self.assertEqual(esg_data['data'][1][-1], '2023-01-15T00:00:00')
+
+    def test_missed_periods_full_sync(self):
+        """
+        Test that an instrument whose latest periods do not overlap the stored ones is fetched in full
+        """
+        sync = self.token_manager.esg_sync(self.server.esg_url)
+        sync.sync(['TEST.RIC'])
+        self.server.set_esg_data(self.esg_data_with_new_periods(['2022-12-31', '2023-12-31']))
+        stats = sync.sync(['TEST.RIC'])
+
+        self.assertEqual((stats['full'], stats['delta'], stats['inserted']), (1, 1, 2))
+        self.assertEqual(len(sync.to_json()['data']), 7)
+
+    def test_state_file(self):
+        """
+        Test that the synced rows are saved and a new sync object continues from the state file
+        """
+        self.token_manager.esg_sync(self.server.esg_url, self.state_path).sync(['TEST.RIC'])
+        sync = rdp_esg_sync.ESGSync(lambda universe, start, end: self.token_manager.request_esg(self.server.esg_url, universe, start, end), self.state_path)
+        stats = sync.sync(['TEST.RIC'])
+
+        self.assertEqual((stats['full'], stats['delta']), (0, 1))
+        esg_data = sync.to_json(['TEST.RIC'])
+        esg_df = rdp_dataframe.build_dataframe(esg_data['headers'], esg_data['data'])
+        self.assertEqual(len(esg_df), 5)
+        self.assertEqual(esg_df['ESG Score'].tolist(), [row[2] for row in self.mock_esg_data['data']])
+
+    def test_state_log_compaction(self):
+        """
+        Test that a sync appends only its changed rows to the state file, and the file is rewritten once it holds compact_ratio times the rows
+        """
+        sync = self.token_manager.esg_sync(self.server.esg_url, self.state_path)
+        sync.sync(['TEST.RIC'])
+        sync.sync(['TEST.RIC'])
+        with open(self.state_path, 'r', encoding = 'utf-8') as state_file:
+            self.assertEqual(len(state_file.readlines()), 1) # Nothing changed, nothing appended
+
+        for day in range(1, 7):
+            self.server.set_esg_data(self.esg_data_with_new_periods([], {'2021-12-31': f'2023-01-0{day}T00:00:00'}))
+            sync.sync(['TEST.RIC'])
+            with open(self.state_path, 'r', encoding = 'utf-8') as state_file:
+                lines = state_file.readlines()
+            # 5 stored rows, the 6th update would make 11 rows in the log: above compact_ratio (2) * 5, rewritten
+            self.assertEqual(len(lines), day + 1 if day < 6 else 1)
+            self.assertEqual(json.loads(lines[-1])['data'][0][-1], f'2023-01-0{day}T00:00:00')
+
+        with open(self.state_path, 'a', encoding = 'utf-8') as state_file:
+            state_file.write('{"data": [["TEST.RIC"') # Interrupted append
+        reloaded = rdp_esg_sync.ESGSync(lambda universe, start, end: self.token_manager.request_esg(self.server.esg_url, universe, start, end), self.state_path)
+        self.assertEqual(reloaded.to_json(), sync.to_json())
+
+    def test_failed_universe(self):
+        """
+        Test that RICs of a chunk returning an ESG error block are reported as failed
+        """
+        self.server.add_response('GET', config['RDP_ESG_URL'], 200, {'error': {'code': 412, 'description': 'Unable to resolve all requested identifiers.'}})
+        sync = self.token_manager.esg_sync(self.server.esg_url)
+        stats = sync.sync(['INVALID1.RIC', 'INVALID2.RIC'])
+
+        self.assertEqual(stats['failed'], ['INVALID1.RIC', 'INVALID2.RIC'])
+        self.assertEqual(sync.to_json()['data'], [])
+
+if __name__ == '__main__':
+    unittest.main()
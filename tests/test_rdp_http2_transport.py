@@ -0,0 +1,101 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import unittest
+import requests
+import tempfile
+import sys
+import os
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import dotenv_values
+config = dotenv_values("../.env.test")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_http2_transport
+from rdp_controller import rdp_retry
+
+try:
+    from tests.mock_rdp_h2_server import MockRDPH2Server, create_self_signed_cert
+except ImportError:  # hypercorn is not installed
+    MockRDPH2Server = None
+
+@unittest.skipIf(rdp_http2_transport.httpx is None or MockRDPH2Server is None, 'httpx[http2] or hypercorn is not installed')
+class TestRDPHTTP2Transport(unittest.TestCase):
+
+    def create_controller(self, **options):
+        return rdp_http_controller.RDPHTTPController(http2 = True, retry_policy = rdp_retry.RetryPolicy(max_retries = 0), **options)
+
+    def test_http2_requests(self):
+        """
+        Test that authentication, ESG, ESG stream and Search Explore requests are sent over HTTP/2 with the same results
+        """
+        with MockRDPH2Server() as server, self.create_controller(http2_prior_knowledge = True) as controller:
+            access_token, refresh_token, expires_in = controller.rdp_authentication(server.auth_url, config['RDP_USERNAME'], config['RDP_PASSWORD'], config['RDP_CLIENTID'])
+            esg_data = controller.rdp_request_esg(server.esg_url, access_token, 'TEST.RIC')
+            esg_rows = list(controller.rdp_stream_esg(server.esg_url, access_token, 'TEST.RIC'))
+            search_data = controller.rdp_request_search_explore(server.search_url, access_token, {'View': 'Entities'})
+
+            self.assertEqual(expires_in, 600)
+            self.assertEqual(esg_rows, esg_data['data'])
+            self.assertIn('Hits', search_data)
+            self.assertEqual({http_version for method, path, http_version, body in server.calls}, {'2'})
+
+    def test_multiplexed_connection(self):
+        """
+        Test that concurrent requests are multiplexed over one HTTP/2 connection
+        """
+        with MockRDPH2Server(latency = 0.05) as server, self.create_controller(http2_prior_knowledge = True) as controller:
+            with ThreadPoolExecutor(max_workers = 20) as executor:
+                esg_responses = list(executor.map(lambda index: controller.rdp_request_esg(server.esg_url, 'access_token', f'RIC{index}.L'), range(40)))
+
+            self.assertEqual([esg_data['data'][0][0] for esg_data in esg_responses], [f'RIC{index}.L' for index in range(40)])
+            adapter = controller.session.get_adapter(server.esg_url)
+            self.assertIsInstance(adapter, rdp_http2_transport.HTTP2Adapter)
+            self.assertEqual([len(client._transport._pool.connections) for client in adapter._clients.values()], [1])
+
+    def test_http2_error_semantics(self):
+        """
+        Test that HTTP errors and connection errors raise the same requests exceptions as the HTTP/1.1 transport
+        """
+        with MockRDPH2Server() as server, self.create_controller(http2_prior_knowledge = True) as controller:
+            with self.assertRaises(requests.exceptions.HTTPError) as exception_context:
+                controller.rdp_request_esg(server.base_url + '/unknown', 'access_token', 'TEST.RIC')
+            self.assertEqual(exception_context.exception.response.status_code, 404)
+            base_url = server.base_url
+
+        with self.create_controller(http2_prior_knowledge = True) as controller:
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                controller.rdp_request_esg(base_url + config['RDP_ESG_URL'], 'access_token', 'TEST.RIC')
+
+    def test_https_alpn(self):
+        """
+        Test that HTTP/2 is negotiated with ALPN on https:// while http:// URLs stay on HTTP/1.1 without prior knowledge
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cert = create_self_signed_cert(temp_dir)
+            if cert is None:
+                self.skipTest('openssl is not installed')
+            with mock.patch.dict(os.environ, {'REQUESTS_CA_BUNDLE': cert[0]}), \
+                 MockRDPH2Server(certfile = cert[0], keyfile = cert[1]) as server, self.create_controller() as controller:
+                controller.rdp_request_esg(server.esg_url, 'access_token', 'TEST.RIC')
+
+                self.assertEqual(server.calls[-1][2], '2')
+
+        with MockRDPH2Server() as server, self.create_controller() as controller:
+            controller.rdp_request_esg(server.esg_url, 'access_token', 'TEST.RIC')
+
+            self.assertEqual(server.calls[-1][2], '1.1')
+
+if __name__ == '__main__':
+    unittest.main()
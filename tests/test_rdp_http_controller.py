@@ -423,6 +423,101 @@ class TestRDPHTTPController(unittest.TestCase):
 
         self.assertEqual(str(exception_context.exception),'Received invalid (None or Empty) arguments')
         
+    @responses.activate
+    def test_request_esg_bulk(self):
+        """
+        Test that it can request ESG Data for a large RIC list in concurrent chunks and merge the responses
+        """
+        esg_endpoint = self.base_URL + config['RDP_ESG_URL']
+        with open('./fixtures/rdp_test_esg_fixture.json', 'r') as esg_fixture_input:
+            mock_esg_data = json.loads(esg_fixture_input.read())
+
+        # Reply with one row and one universe entry per requested RIC
+        def esg_callback(request):
+            rics = request.params['universe'].split(',')
+            body = dict(mock_esg_data)
+            body['data'] = [[ric] + mock_esg_data['data'][0][1:] for ric in rics]
+            body['universe'] = [dict(mock_esg_data['universe'][0], Instrument = ric) for ric in rics]
+            body['messages'] = dict(mock_esg_data['messages'], codes = [[-1] * len(mock_esg_data['headers']) for ric in rics])
+            body['links'] = {'count': len(rics)}
+            return (200, {}, json.dumps(body))
+        responses.add_callback(responses.GET, esg_endpoint, callback = esg_callback, content_type= 'application/json')
+
+        universe_list = [f'RIC{index}.L' for index in range(23)] + ['RIC0.L', '']
+        response = self.app.rdp_request_esg_bulk(esg_endpoint, self.mock_valid_auth_json['access_token'], universe_list, chunk_size = 5, max_workers = 3)
+
+        self.assertEqual(len(responses.calls), 5) # 23 unique RICs in chunks of 5
+        self.assertEqual(response['headers'], mock_esg_data['headers'])
+        self.assertEqual([row[0] for row in response['data']], [f'RIC{index}.L' for index in range(23)]) # Check request order is kept
+        self.assertEqual(len(response['universe']), 23)
+        self.assertEqual(len(response['messages']['codes']), 23) # One entry per merged row
+        self.assertEqual(response['messages']['descriptions'], mock_esg_data['messages']['descriptions'])
+        self.assertEqual(response['links'], {'count': 23})
+        self.assertNotIn('errors', response)
+
+    @responses.activate
+    def test_request_esg_bulk_chunk_error(self):
+        """
+        Test that the bulk ESG request keeps error blocks of failed chunks and raises on HTTP errors
+        """
+        esg_endpoint = self.base_URL + config['RDP_ESG_URL']
+        responses.add(responses.Response(method= 'GET', url = esg_endpoint, json = {'error': {'code': 412, 'description': 'Unable to resolve all requested identifiers.'}},
+                                         status= 200, content_type= 'application/json'))
+
+        response = self.app.rdp_request_esg_bulk(esg_endpoint, self.mock_valid_auth_json['access_token'], ['INVALID1.RIC', 'INVALID2.RIC'], chunk_size = 1)
+
+        self.assertEqual(response['data'], [])
+        self.assertEqual([error['universe'] for error in response['errors']], ['INVALID1.RIC', 'INVALID2.RIC'])
+
+        responses.replace(responses.GET, esg_endpoint, json = self.mock_token_expire_json, status = 401)
+        with self.assertRaises(requests.exceptions.HTTPError) as exception_context:
+            self.app.rdp_request_esg_bulk(esg_endpoint, self.mock_valid_auth_json['access_token'], ['TEST.RIC'])
+        self.assertEqual(exception_context.exception.response.status_code, 401)
+
+    def test_request_esg_bulk_none_empty(self):
+        """
+        Test that the bulk ESG function can handle none/empty input
+        """
+        with self.assertRaises(TypeError) as exception_context:
+            self.app.rdp_request_esg_bulk(None, self.mock_valid_auth_json['access_token'], [])
+
+        self.assertEqual(str(exception_context.exception),'Received invalid (None or Empty) arguments')
+
+    def test_session_connection_pool(self):
+        """
+        Test that the controller owns a configurable pooled keep-alive session
+        """
+        controller = rdp_http_controller.RDPHTTPController(pool_connections = 2, pool_maxsize = 20, pool_block = True)
+        adapter = controller.session.get_adapter(self.base_URL)
+
+        self.assertIsInstance(controller.session, requests.Session)
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 20)
+        self.assertTrue(adapter._pool_block)
+        self.assertEqual(controller.session.headers['Connection'], 'keep-alive')
+        controller.close()
+
+        controller = rdp_http_controller.RDPHTTPController(keep_alive = False)
+        self.assertEqual(controller.session.headers['Connection'], 'close')
+        controller.close()
+
+    @responses.activate
+    def test_session_context_manager(self):
+        """
+        Test that the controller can be used as a context manager and closes its session on exit
+        """
+        esg_endpoint = self.base_URL + config['RDP_ESG_URL']
+        with open('./fixtures/rdp_test_esg_fixture.json', 'r') as esg_fixture_input:
+            mock_esg_data = json.loads(esg_fixture_input.read())
+        responses.add(responses.Response(method= 'GET', url = esg_endpoint, json = mock_esg_data, status= 200, content_type= 'application/json'))
+
+        with rdp_http_controller.RDPHTTPController() as controller:
+            response = controller.rdp_request_esg(esg_endpoint, self.mock_valid_auth_json['access_token'], 'TEST.RIC')
+            self.assertIn('data', response)
+            adapter = controller.session.get_adapter(esg_endpoint)
+
+        self.assertEqual(len(adapter.poolmanager.pools), 0) # Check if pooled connections are released
+
 if __name__ == '__main__':
     unittest.main()
 
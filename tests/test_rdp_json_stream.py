@@ -0,0 +1,145 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import unittest
+import responses
+import json
+import tracemalloc
+import sys
+import os
+from dotenv import dotenv_values
+config = dotenv_values("../.env.test")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_json_stream
+
+# Generate a large synthetic ESG response body in chunks, derived from the ESG fixture, without holding it in memory
+def synthetic_esg_chunks(esg_data, row_count, chunk_size = 65536):
+    fixture_rows = esg_data['data']
+    pending = '{"links": {"count": %d}, "universe": %s, "data": [' % (row_count, json.dumps(esg_data['universe']))
+    for index in range(row_count):
+        row = [f'RIC{index // len(fixture_rows)}.L'] + fixture_rows[index % len(fixture_rows)][1:]
+        pending += (',' if index else '') + json.dumps(row)
+        if len(pending) >= chunk_size:
+            yield pending.encode('utf-8')
+            pending = ''
+    yield (pending + '], "messages": {}, "headers": %s}' % json.dumps(esg_data['headers'])).encode('utf-8')
+
+class TestJSONArrayStream(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open('./fixtures/rdp_test_esg_fixture.json', 'r') as esg_fixture_input:
+            cls.mock_esg_data = json.loads(esg_fixture_input.read())
+        with open('./fixtures/rdp_test_search_fixture.json', 'r') as search_fixture_input:
+            cls.mock_search_data = json.loads(search_fixture_input.read())
+
+    def test_stream_matches_json_loads(self):
+        """
+        Test that streamed rows and fields equal the fully parsed fixture for any chunk boundary
+        """
+        body = json.dumps(self.mock_esg_data, indent = 2).encode('utf-8')
+        for chunk_size in (1, 7, 64, len(body)):
+            chunks = [body[index:index + chunk_size] for index in range(0, len(body), chunk_size)]
+            stream = rdp_json_stream.JSONArrayStream(chunks, 'data')
+
+            self.assertEqual(list(stream), self.mock_esg_data['data'])
+            self.assertEqual(stream.fields['headers'], self.mock_esg_data['headers'])
+            self.assertEqual(stream.fields['universe'], self.mock_esg_data['universe'])
+            self.assertNotIn('data', stream.fields)
+
+    def test_stream_numbers_and_unicode_split(self):
+        """
+        Test that numbers and multi-byte characters split across chunks are decoded correctly
+        """
+        body = json.dumps({'Total': 12345, 'Hits': [123456789, -1.5e10, 'ESG é測試', None, True]}, ensure_ascii = False).encode('utf-8')
+        chunks = [body[index:index + 1] for index in range(len(body))]
+        stream = rdp_json_stream.JSONArrayStream(chunks, 'Hits')
+
+        self.assertEqual(list(stream), [123456789, -1.5e10, 'ESG é測試', None, True])
+        self.assertEqual(stream.fields['Total'], 12345)
+
+    def test_stream_missing_and_empty_array(self):
+        """
+        Test that a response without the array (e.g. an error block) or with an empty array yields nothing
+        """
+        error_stream = rdp_json_stream.JSONArrayStream([b'{"error": {"code": 412}}'], 'data')
+        self.assertEqual(list(error_stream), [])
+        self.assertEqual(error_stream.fields['error'], {'code': 412})
+
+        self.assertEqual(list(rdp_json_stream.JSONArrayStream([b'{"Total": 0, "Hits": []}'], 'Hits')), [])
+
+    def test_stream_invalid_json(self):
+        """
+        Test that truncated or malformed JSON raises JSONDecodeError and runs the close callback
+        """
+        closed = []
+        with self.assertRaises(json.JSONDecodeError):
+            list(rdp_json_stream.JSONArrayStream([b'{"data": [[1, 2], [3'], 'data', on_close = lambda: closed.append(True)))
+        self.assertEqual(closed, [True])
+
+        with self.assertRaises(json.JSONDecodeError):
+            list(rdp_json_stream.JSONArrayStream([b'{"data": [[1, 2] [3]]}'], 'data'))
+
+    def test_stream_memory_flat(self):
+        """
+        Test that streaming a large synthetic ESG body keeps the peak memory far below the body size
+        """
+        row_count = 30000
+        body_size = sum(len(chunk) for chunk in synthetic_esg_chunks(self.mock_esg_data, row_count))
+
+        tracemalloc.start()
+        stream = rdp_json_stream.JSONArrayStream(synthetic_esg_chunks(self.mock_esg_data, row_count), 'data')
+        streamed_rows = sum(1 for row in stream)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        self.assertEqual(streamed_rows, row_count)
+        self.assertEqual(stream.fields['headers'], self.mock_esg_data['headers'])
+        self.assertGreater(body_size, 3 * 2**20)
+        self.assertLess(peak, 2**20) # Peak memory is bounded by the chunk size, not the body size
+
+        # Parsing the same body in one piece needs memory proportional to its size
+        tracemalloc.start()
+        full_json = json.loads(b''.join(synthetic_esg_chunks(self.mock_esg_data, row_count)))
+        full_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        self.assertEqual(len(full_json['data']), row_count)
+        self.assertGreater(full_peak, 10 * peak)
+
+    @responses.activate
+    def test_controller_stream_esg(self):
+        """
+        Test that RDPHTTPController streams the ESG data rows and the Search Explore Hits
+        """
+        base_URL = config['RDP_BASE_URL']
+        esg_endpoint = base_URL + config['RDP_ESG_URL']
+        search_endpoint = base_URL + config['RDP_SEARCH_EXPLORE_URL']
+        responses.add(responses.Response(method= 'GET', url = esg_endpoint, json = self.mock_esg_data, status= 200, content_type= 'application/json'))
+        responses.add(responses.Response(method= 'POST', url = search_endpoint, json = self.mock_search_data, status= 200, content_type= 'application/json'))
+
+        with rdp_http_controller.RDPHTTPController() as controller:
+            esg_stream = controller.rdp_stream_esg(esg_endpoint, 'access_token', 'TEST.RIC', chunk_size = 16)
+            self.assertEqual(list(esg_stream), self.mock_esg_data['data'])
+            self.assertEqual(esg_stream.fields['headers'], self.mock_esg_data['headers'])
+
+            search_stream = controller.rdp_stream_search_explore(search_endpoint, 'access_token', {'View': 'Entities'})
+            self.assertEqual(list(search_stream), self.mock_search_data['Hits'])
+            self.assertEqual(search_stream.fields['Total'], self.mock_search_data['Total'])
+
+            with self.assertRaises(TypeError):
+                controller.rdp_stream_esg(esg_endpoint, 'access_token', '')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import unittest
+import responses
+import requests
+import json
+import sys
+import os
+from dotenv import dotenv_values
+config = dotenv_values("../.env.test")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_metrics
+from rdp_controller import rdp_retry
+from rdp_controller import rdp_cache
+from tests.mock_rdp_server import MockRDPServer
+
+class TestRDPMetrics(unittest.TestCase):
+
+    # Start one local RDP stand-in server for all tests in the class, so connections are real sockets
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockRDPServer().start()
+        cls.conditional_server = MockRDPServer(conditional = True).start()
+        cls.search_explore_payload = {'View': 'Entities', 'Filter': 'RIC eq \'TEST.RIC\''}
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+        cls.conditional_server.stop()
+
+    def setUp(self):
+        self.server.reset()
+        self.metrics = []
+
+    def create_controller(self, **kwargs):
+        controller = rdp_http_controller.RDPHTTPController(**kwargs)
+        controller.instrumentation.add_hook(self.metrics.append)
+        return controller
+
+    def test_request_metrics(self):
+        """
+        Test that every call emits its status, sizes and timing breakdown, a kept-alive connection has no connect time
+        """
+        with self.create_controller() as controller:
+            esg_data = controller.rdp_request_esg(self.server.esg_url, 'access_token', 'TEST.RIC')
+            controller.rdp_request_esg(self.server.esg_url, 'access_token', 'OTHER.RIC')
+            controller.rdp_request_search_explore(self.server.search_url, 'access_token', self.search_explore_payload)
+            controller.rdp_authentication(self.server.auth_url, config['RDP_USERNAME'], config['RDP_PASSWORD'], config['RDP_CLIENTID'])
+
+        self.assertEqual([metrics.operation for metrics in self.metrics], ['esg', 'esg', 'search_explore', 'authentication'])
+        first, second, search, auth = self.metrics
+        self.assertEqual((first.method, first.url, first.status_code, first.attempts, first.retries, first.error), ('GET', self.server.esg_url, 200, 1, 0, None))
+        self.assertEqual(first.response_bytes, len(json.dumps(esg_data)))
+        self.assertGreater(first.timings['connect'], 0)
+        self.assertEqual(first.timings['tls'], 0)
+        self.assertGreater(first.timings['ttfb'], 0)
+        self.assertGreater(first.timings['json_parse'], 0)
+        self.assertGreaterEqual(first.timings['total'], first.timings['connect'] + first.timings['ttfb'] + first.timings['json_parse'])
+        self.assertEqual(second.timings['connect'], 0)
+        self.assertEqual(search.request_bytes, len(json.dumps(self.search_explore_payload)))
+        self.assertEqual(auth.status_code, 200)
+
+    def test_compressed_response_bytes(self):
+        """
+        Test that response_bytes is the compressed size received on the wire, not the decoded body size
+        """
+        with MockRDPServer(compression = ('gzip',)) as server, self.create_controller() as controller:
+            esg_data = controller.rdp_request_esg(server.esg_url, 'access_token', 'TEST.RIC')
+
+        self.assertGreater(self.metrics[0].response_bytes, 0)
+        self.assertLess(self.metrics[0].response_bytes, len(json.dumps(esg_data)))
+
+    @responses.activate
+    def test_retry_and_error_metrics(self):
+        """
+        Test that retries are counted and a failed call reports its final status and exception
+        """
+        esg_endpoint = config['RDP_BASE_URL'] + config['RDP_ESG_URL']
+        responses.add(responses.Response(method= 'GET', url = esg_endpoint, json = {'error': 'Service Unavailable'}, status= 503))
+        responses.add(responses.Response(method= 'GET', url = esg_endpoint, json = {'error': {'message': 'token expired'}}, status= 401))
+        retry_policy = rdp_retry.RetryPolicy(max_retries = 3, sleep = lambda seconds: None)
+
+        with self.create_controller(retry_policy = retry_policy) as controller:
+            with self.assertRaises(requests.exceptions.HTTPError):
+                controller.rdp_request_esg(esg_endpoint, 'access_token', 'TEST.RIC')
+
+        metrics = self.metrics[0]
+        self.assertEqual((metrics.attempts, metrics.retries, metrics.status_code, metrics.error), (2, 1, 401, 'HTTPError'))
+
+    def test_cache_metrics(self):
+        """
+        Test the cache outcomes: miss then hit with a response cache, not_modified for HTTP 304
+        """
+        with self.create_controller(cache = rdp_cache.MemoryCache()) as controller:
+            controller.rdp_request_esg(self.server.esg_url, 'access_token', 'TEST.RIC')
+            controller.rdp_request_esg(self.server.esg_url, 'access_token', 'TEST.RIC')
+        with self.create_controller(conditional_requests = True) as controller:
+            controller.rdp_request_esg(self.conditional_server.esg_url, 'access_token', 'TEST.RIC')
+            controller.rdp_request_esg(self.conditional_server.esg_url, 'access_token', 'TEST.RIC')
+
+        self.assertEqual([metrics.cache for metrics in self.metrics], ['miss', 'hit', None, 'not_modified'])
+        self.assertEqual(self.metrics[1].attempts, 0)
+        self.assertEqual(self.metrics[3].status_code, 304)
+
+    def test_stream_metrics(self):
+        """
+        Test that streaming calls report the response headers without reading the body
+        """
+        with self.create_controller() as controller:
+            rows = list(controller.rdp_stream_esg(self.server.esg_url, 'access_token', 'TEST.RIC'))
+
+        self.assertEqual(len(rows), 5)
+        self.assertEqual((self.metrics[0].operation, self.metrics[0].status_code), ('esg_stream', 200))
+        self.assertGreater(self.metrics[0].response_bytes, 0)
+
+    def test_no_hooks(self):
+        """
+        Test that nothing is measured when no hook is registered, and a removed hook stops receiving metrics
+        """
+        instrumentation = rdp_metrics.Instrumentation()
+        with instrumentation.measure('esg', 'GET', self.server.esg_url) as metrics:
+            self.assertIsNone(metrics)
+
+        with self.create_controller() as controller:
+            controller.instrumentation.remove_hook(self.metrics.append)
+            controller.rdp_request_esg(self.server.esg_url, 'access_token', 'TEST.RIC')
+        self.assertEqual(self.metrics, [])
+
+    def test_failing_hook(self):
+        """
+        Test that a failing hook is logged and does not fail the request
+        """
+        def failing_hook(metrics):
+            raise ValueError('hook failure')
+
+        with self.create_controller() as controller:
+            controller.instrumentation.add_hook(failing_hook)
+            with self.assertLogs('rdp_controller.rdp_metrics', level = 'ERROR'):
+                self.assertIn('data', controller.rdp_request_esg(self.server.esg_url, 'access_token', 'TEST.RIC'))
+        self.assertEqual(len(self.metrics), 1)
+
+    def test_logging_exporter(self):
+        """
+        Test that LoggingExporter logs every call as one JSON line
+        """
+        with self.create_controller() as controller:
+            controller.instrumentation.add_hook(rdp_metrics.LoggingExporter())
+            with self.assertLogs('rdp_controller.rdp_metrics', level = 'INFO') as logs:
+                controller.rdp_request_esg(self.server.esg_url, 'access_token', 'TEST.RIC')
+
+        logged = json.loads(logs.records[0].getMessage())
+        self.assertEqual((logged['operation'], logged['status_code'], logged['attempts']), ('esg', 200, 1))
+
+    def test_metrics_collector(self):
+        """
+        Test that MetricsCollector aggregates per operation and keeps the slowest calls
+        """
+        collector = rdp_metrics.MetricsCollector(slowest_count = 2)
+        for index, total in enumerate([0.010, 0.050, 0.020, 0.040]):
+            metrics = rdp_metrics.RequestMetrics('esg', 'GET', self.server.esg_url)
+            metrics.status_code = 200 if index else 503
+            metrics.error = None if index else 'HTTPError'
+            metrics.attempts = 1
+            metrics.timings['total'] = total
+            collector(metrics)
+
+        summary = collector.summary()['esg']
+        self.assertEqual((summary['count'], summary['errors'], summary['status_codes']), (4, 1, {503: 1, 200: 3}))
+        self.assertAlmostEqual(summary['p50_ms'], 20.0)
+        self.assertAlmostEqual(summary['p99_ms'], 50.0)
+        self.assertEqual([metrics.timings['total'] for metrics in collector.slowest()], [0.050, 0.040])
+
+if __name__ == '__main__':
+    unittest.main()
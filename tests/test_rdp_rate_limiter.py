@@ -0,0 +1,150 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import unittest
+import responses
+import json
+import tempfile
+import threading
+import sys
+import os
+from dotenv import dotenv_values
+config = dotenv_values("../.env.test")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_rate_limiter
+
+class FakeClock():
+
+    # Time only moves when the rate limiter sleeps
+    def __init__(self, now = 1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+class TestRDPRateLimiter(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.base_URL = config['RDP_BASE_URL']
+        cls.esg_endpoint = cls.base_URL + config['RDP_ESG_URL']
+        cls.search_endpoint = cls.base_URL + config['RDP_SEARCH_EXPLORE_URL']
+        with open('./fixtures/rdp_test_esg_fixture.json', 'r') as esg_fixture_input:
+            cls.mock_esg_data = json.loads(esg_fixture_input.read())
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_token_bucket_rate(self):
+        """
+        Test that the token bucket allows a burst of capacity requests and then one request per 1/rate seconds
+        """
+        bucket = rdp_rate_limiter.TokenBucket(rate = 2, capacity = 3, clock = self.clock)
+
+        self.assertEqual([bucket.try_acquire() for _ in range(3)], [0, 0, 0])
+        self.assertAlmostEqual(bucket.try_acquire(), 0.5)
+        self.clock.now += 0.5
+        self.assertEqual(bucket.try_acquire(), 0)
+        self.clock.now += 10 # Tokens never exceed capacity
+        self.assertEqual([bucket.try_acquire() == 0 for _ in range(4)], [True, True, True, False])
+
+    def test_rate_limiter_endpoint_prefix(self):
+        """
+        Test that the longest matching URL prefix limit applies and unknown endpoints are not limited
+        """
+        limiter = rdp_rate_limiter.RateLimiter(sleep = self.clock.sleep)
+        limiter.add_limit(self.base_URL, bucket = rdp_rate_limiter.TokenBucket(100, clock = self.clock))
+        limiter.add_limit(self.esg_endpoint, bucket = rdp_rate_limiter.TokenBucket(rate = 5, capacity = 1, clock = self.clock))
+
+        for _ in range(3):
+            with limiter.limit(self.esg_endpoint):
+                pass
+        for _ in range(3):
+            with limiter.limit(self.search_endpoint):
+                pass
+        with limiter.limit('https://example.com/other'):
+            pass
+
+        self.assertEqual(len(self.clock.sleeps), 2)
+        self.assertAlmostEqual(sum(self.clock.sleeps), 0.4)
+
+    def test_rate_limiter_concurrency(self):
+        """
+        Test that max_concurrency caps the number of requests in flight
+        """
+        limiter = rdp_rate_limiter.RateLimiter().add_limit(self.esg_endpoint, max_concurrency = 2)
+        in_flight = []
+        max_in_flight = []
+        lock = threading.Lock()
+        release = threading.Event()
+
+        def request():
+            with limiter.limit(self.esg_endpoint):
+                with lock:
+                    in_flight.append(1)
+                    max_in_flight.append(len(in_flight))
+                release.wait(1)
+                with lock:
+                    in_flight.pop()
+
+        threads = [threading.Thread(target = request) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertLessEqual(max(max_in_flight), 2)
+        self.assertEqual(len(max_in_flight), 5)
+
+    def test_file_token_bucket_shared(self):
+        """
+        Test that FileTokenBucket instances on the same file share one quota
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'rdp_esg.bucket')
+            worker1 = rdp_rate_limiter.FileTokenBucket(path, rate = 1, capacity = 2, clock = self.clock)
+            worker2 = rdp_rate_limiter.FileTokenBucket(path, rate = 1, capacity = 2, clock = self.clock)
+
+            self.assertEqual(worker1.try_acquire(), 0)
+            self.assertEqual(worker2.try_acquire(), 0)
+            self.assertAlmostEqual(worker1.try_acquire(), 1.0)
+            self.clock.now += 1
+            self.assertEqual(worker2.try_acquire(), 0)
+            self.assertAlmostEqual(worker1.try_acquire(), 1.0)
+
+    @responses.activate
+    def test_controller_rate_limited(self):
+        """
+        Test that RDPHTTPController waits for the rate limiter before each ESG request
+        """
+        responses.add(responses.Response(method= 'GET', url = self.esg_endpoint, json = self.mock_esg_data, status= 200, content_type= 'application/json'))
+        limiter = rdp_rate_limiter.RateLimiter(sleep = self.clock.sleep)
+        limiter.add_limit(self.esg_endpoint, bucket = rdp_rate_limiter.TokenBucket(rate = 10, capacity = 2, clock = self.clock), max_concurrency = 4)
+
+        with rdp_http_controller.RDPHTTPController(rate_limiter = limiter) as controller:
+            for _ in range(5):
+                controller.rdp_request_esg(self.esg_endpoint, 'access_token', 'TEST.RIC')
+
+        self.assertEqual(len(responses.calls), 5)
+        self.assertEqual(len(self.clock.sleeps), 3)
+        self.assertAlmostEqual(self.clock.now - 1000.0, 0.3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,214 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import unittest
+import responses
+import requests
+import json
+import sys
+import os
+from dotenv import dotenv_values
+config = dotenv_values("../.env.test")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_retry
+
+class TestRDPRetry(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.base_URL = config['RDP_BASE_URL']
+        cls.auth_endpoint = cls.base_URL + config['RDP_AUTH_URL']
+        cls.esg_endpoint = cls.base_URL + config['RDP_ESG_URL']
+        cls.search_endpoint = cls.base_URL + config['RDP_SEARCH_EXPLORE_URL']
+        with open('./fixtures/rdp_test_auth_fixture.json', 'r') as auth_fixture_input:
+            cls.mock_valid_auth_json = json.loads(auth_fixture_input.read())
+        with open('./fixtures/rdp_test_esg_fixture.json', 'r') as esg_fixture_input:
+            cls.mock_esg_data = json.loads(esg_fixture_input.read())
+
+    def setUp(self):
+        # Record the backoff sleeps instead of waiting, use the maximum jitter to get deterministic delays
+        self.sleeps = []
+        self.now = 0.0
+        self.retry_policy = rdp_retry.RetryPolicy(max_retries = 3, backoff_factor = 0.5, jitter = lambda: 1.0, sleep = self.sleeps.append)
+
+    def create_controller(self, retry_policy = None, circuit_breaker = None):
+        return rdp_http_controller.RDPHTTPController(retry_policy = retry_policy or self.retry_policy, circuit_breaker = circuit_breaker)
+
+    def add_esg_response(self, status, json_data = None, headers = None, body = None):
+        responses.add(responses.Response(method= 'GET', url = self.esg_endpoint, json = json_data, body = body, status= status, headers = headers, content_type= 'application/json'))
+
+    @responses.activate
+    def test_retry_transient_5xx(self):
+        """
+        Test that transient 5xx responses are retried with exponential backoff
+        """
+        self.add_esg_response(503, {'error': 'Service Unavailable'})
+        self.add_esg_response(502, {'error': 'Bad Gateway'})
+        self.add_esg_response(200, self.mock_esg_data)
+
+        with self.create_controller() as controller:
+            response = controller.rdp_request_esg(self.esg_endpoint, self.mock_valid_auth_json['access_token'], 'TEST.RIC')
+
+        self.assertIn('data', response)
+        self.assertEqual(len(responses.calls), 3)
+        self.assertEqual(self.sleeps, [0.5, 1.0])
+
+    @responses.activate
+    def test_retry_after_429(self):
+        """
+        Test that HTTP 429 honours the Retry-After header for every controller method
+        """
+        self.add_esg_response(429, {'error': 'Too Many Requests'}, headers = {'Retry-After': '2'})
+        self.add_esg_response(200, self.mock_esg_data)
+        responses.add(responses.Response(method= 'POST', url = self.auth_endpoint, json = {}, status= 429, headers = {'Retry-After': '3'}))
+        responses.add(responses.Response(method= 'POST', url = self.auth_endpoint, json = self.mock_valid_auth_json, status= 200))
+        responses.add(responses.Response(method= 'POST', url = self.search_endpoint, json = {}, status= 429, headers = {'Retry-After': '1'}))
+        responses.add(responses.Response(method= 'POST', url = self.search_endpoint, json = {'Total': 0, 'Hits': []}, status= 200))
+
+        with self.create_controller() as controller:
+            controller.rdp_request_esg(self.esg_endpoint, self.mock_valid_auth_json['access_token'], 'TEST.RIC')
+            controller.rdp_authentication(self.auth_endpoint, config['RDP_USERNAME'], config['RDP_PASSWORD'], config['RDP_CLIENTID'])
+            controller.rdp_request_search_explore(self.search_endpoint, self.mock_valid_auth_json['access_token'], {'View': 'Entities'})
+
+        self.assertEqual(self.sleeps, [2.0, 3.0, 1.0])
+
+    @responses.activate
+    def test_retry_after_too_long(self):
+        """
+        Test that a Retry-After longer than max_backoff is not waited for and raises HTTPError
+        """
+        self.add_esg_response(429, {'error': 'Too Many Requests'}, headers = {'Retry-After': '3600'})
+
+        with self.create_controller() as controller:
+            with self.assertRaises(requests.exceptions.HTTPError) as exception_context:
+                controller.rdp_request_esg(self.esg_endpoint, self.mock_valid_auth_json['access_token'], 'TEST.RIC')
+
+        self.assertEqual(exception_context.exception.response.status_code, 429)
+        self.assertEqual(self.sleeps, [])
+
+    @responses.activate
+    def test_retry_exhausted(self):
+        """
+        Test that the last retryable response is raised as HTTPError when max_retries is reached
+        """
+        self.add_esg_response(500, {'error': 'Internal Server Error'})
+
+        with self.create_controller() as controller:
+            with self.assertRaises(requests.exceptions.HTTPError) as exception_context:
+                controller.rdp_request_esg(self.esg_endpoint, self.mock_valid_auth_json['access_token'], 'TEST.RIC')
+
+        self.assertEqual(exception_context.exception.response.status_code, 500)
+        self.assertEqual(len(responses.calls), 4)
+        self.assertEqual(self.sleeps, [0.5, 1.0, 2.0])
+
+    @responses.activate
+    def test_no_retry_client_error(self):
+        """
+        Test that 4xx responses other than 429 are not retried
+        """
+        self.add_esg_response(401, {'error': {'message': 'token expired'}})
+
+        with self.create_controller() as controller:
+            with self.assertRaises(requests.exceptions.HTTPError):
+                controller.rdp_request_esg(self.esg_endpoint, self.mock_valid_auth_json['access_token'], 'TEST.RIC')
+
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_connection_error(self):
+        """
+        Test that connection errors are retried and then raised instead of failing on an unbound response
+        """
+        self.add_esg_response(200, body = requests.exceptions.ConnectionError('Connection refused'))
+
+        with self.create_controller() as controller:
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                controller.rdp_request_esg(self.esg_endpoint, self.mock_valid_auth_json['access_token'], 'TEST.RIC')
+
+        self.assertEqual(len(responses.calls), 4)
+
+    @responses.activate
+    def test_retry_budget(self):
+        """
+        Test that the retry budget stops retries once it is spent
+        """
+        self.add_esg_response(503, {'error': 'Service Unavailable'})
+        budget = rdp_retry.RetryBudget(ratio = 0.5, min_tokens = 2, max_tokens = 10)
+        retry_policy = rdp_retry.RetryPolicy(max_retries = 3, jitter = lambda: 0.0, sleep = self.sleeps.append, budget = budget)
+
+        with self.create_controller(retry_policy) as controller:
+            for _ in range(2):
+                with self.assertRaises(requests.exceptions.HTTPError):
+                    controller.rdp_request_esg(self.esg_endpoint, self.mock_valid_auth_json['access_token'], 'TEST.RIC')
+
+        # 2 + 0.5 tokens: 2 retries for the first request, 0.5 + 0.5 = 1 retry for the second request
+        self.assertEqual(len(self.sleeps), 3)
+        self.assertEqual(len(responses.calls), 5)
+
+    @responses.activate
+    def test_circuit_breaker(self):
+        """
+        Test that the circuit breaker opens after consecutive failures and lets a trial request through after reset_timeout
+        """
+        self.add_esg_response(503, {'error': 'Service Unavailable'})
+        circuit_breaker = rdp_retry.CircuitBreaker(failure_threshold = 2, reset_timeout = 30, clock = lambda: self.now)
+        retry_policy = rdp_retry.RetryPolicy(max_retries = 0, sleep = self.sleeps.append)
+
+        with self.create_controller(retry_policy, circuit_breaker) as controller:
+            for _ in range(2):
+                with self.assertRaises(requests.exceptions.HTTPError):
+                    controller.rdp_request_esg(self.esg_endpoint, self.mock_valid_auth_json['access_token'], 'TEST.RIC')
+            self.assertEqual(circuit_breaker.state, rdp_retry.CircuitBreaker.OPEN)
+
+            with self.assertRaises(rdp_retry.CircuitOpenError):
+                controller.rdp_request_esg(self.esg_endpoint, self.mock_valid_auth_json['access_token'], 'TEST.RIC')
+            self.assertEqual(len(responses.calls), 2) # No request is sent while the circuit is open
+
+            self.now += 30
+            responses.replace(responses.GET, self.esg_endpoint, json = self.mock_esg_data, status = 200)
+            response = controller.rdp_request_esg(self.esg_endpoint, self.mock_valid_auth_json['access_token'], 'TEST.RIC')
+
+            self.assertIn('data', response)
+            self.assertEqual(circuit_breaker.state, rdp_retry.CircuitBreaker.CLOSED)
+
+    def test_circuit_breaker_trial_exception(self):
+        """
+        Test that an unexpected exception of the HALF_OPEN trial request releases the trial, the next request is sent as the trial
+        """
+        circuit_breaker = rdp_retry.CircuitBreaker(failure_threshold = 1, reset_timeout = 30, clock = lambda: self.now)
+        circuit_breaker.record_failure()
+        self.now += 30
+
+        def send_function():
+            raise ValueError('Invalid request')
+        with self.assertRaises(ValueError):
+            self.retry_policy.call(send_function, circuit_breaker)
+        self.assertEqual(circuit_breaker.state, rdp_retry.CircuitBreaker.OPEN)
+
+        response = requests.models.Response()
+        response.status_code = 200
+        self.assertIs(self.retry_policy.call(lambda: response, circuit_breaker), response)
+        self.assertEqual(circuit_breaker.state, rdp_retry.CircuitBreaker.CLOSED)
+
+    def test_parse_retry_after_http_date(self):
+        """
+        Test that an HTTP date Retry-After in the past means retry immediately
+        """
+        response = requests.models.Response()
+        response.headers['Retry-After'] = 'Wed, 21 Oct 2015 07:28:00 GMT'
+
+        self.assertEqual(self.retry_policy.parse_retry_after(response), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import unittest
+import threading
+import json
+import sys
+import os
+import pandas as pd
+from dotenv import dotenv_values
+config = dotenv_values("../.env.test")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_search_pager
+from tests.mock_rdp_server import MockRDPServer
+
+class TestRDPSearchPager(unittest.TestCase):
+
+    # Start one local RDP stand-in server for all tests in the class
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockRDPServer().start()
+        cls.search_explore_payload = {
+            'View': 'Entities',
+            'Filter': 'RIC eq \'TEST.RIC\'',
+            'Select': 'RIC,IssuerCommonName,ExchangeCode'
+        }
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.reset()
+        self.hits = [{'RIC': f'TEST{index}.RIC', 'IssuerCommonName': f'Test Data Name {index}', 'ExchangeCode': 'TEST'} for index in range(250)]
+        self.server.set_search_hits(self.hits)
+        self.app = rdp_http_controller.RDPHTTPController()
+
+    def tearDown(self):
+        self.app.close()
+
+    def get_page_requests(self):
+        return [(payload['Skip'], payload['Top']) for payload in (json.loads(call[3]) for call in self.server.calls)]
+
+    def test_paginate_all_hits(self):
+        """
+        Test that the pager requests every page with Top/Skip and yields all hits in order
+        """
+        pager = self.app.rdp_paginate_search_explore(self.server.search_url, 'access_token', self.search_explore_payload, page_size = 100)
+
+        self.assertEqual(list(pager), self.hits)
+        self.assertEqual(pager.total, 250)
+        self.assertEqual(sorted(self.get_page_requests()), [(0, 100), (100, 100), (200, 50)])
+
+    def test_paginate_max_hits(self):
+        """
+        Test that max_hits limits the number of hits and the last page size
+        """
+        for prefetch in (0, 2):
+            self.server.reset()
+            pager = self.app.rdp_paginate_search_explore(self.server.search_url, 'access_token', self.search_explore_payload,
+                                                         page_size = 100, prefetch = prefetch, max_hits = 120)
+
+            self.assertEqual(list(pager), self.hits[:120])
+            self.assertEqual(sorted(self.get_page_requests()), [(0, 100), (100, 20)])
+
+    def test_paginate_empty_result(self):
+        """
+        Test that a query without hits yields nothing after one request
+        """
+        self.server.set_search_hits([])
+
+        self.assertEqual(list(self.app.rdp_paginate_search_explore(self.server.search_url, 'access_token', self.search_explore_payload)), [])
+        self.assertEqual(len(self.server.calls), 1)
+
+    def test_paginate_prefetch(self):
+        """
+        Test that the next page is requested while the caller consumes the current page
+        """
+        next_page_requested = threading.Event()
+
+        def request_page(payload):
+            if payload['Skip'] > 0:
+                next_page_requested.set()
+            return {'Total': 250, 'Hits': self.hits[payload['Skip']:payload['Skip'] + payload['Top']]}
+
+        with rdp_search_pager.SearchExplorePager(request_page, self.search_explore_payload, page_size = 100) as pager:
+            pages = pager.pages()
+            next(pages)
+            self.assertTrue(next_page_requested.wait(5))
+            self.assertEqual(len(next(pages)), 100)
+
+    def test_paginate_stop_early(self):
+        """
+        Test that leaving the iteration early does not request the remaining pages
+        """
+        with self.app.rdp_paginate_search_explore(self.server.search_url, 'access_token', self.search_explore_payload, page_size = 10, prefetch = 2) as pager:
+            for hit in pager:
+                break
+
+        # The first page and at most the two prefetched pages
+        self.assertLessEqual(len(self.server.calls), 3)
+
+    def test_paginate_to_dataframe(self):
+        """
+        Test that to_dataframe builds the Select columns page by page, missing fields become None
+        """
+        del self.hits[5]['ExchangeCode']
+        self.server.set_search_hits(self.hits)
+
+        df = self.app.rdp_paginate_search_explore(self.server.search_url, 'access_token', self.search_explore_payload, page_size = 100).to_dataframe()
+
+        self.assertIsInstance(df, pd.DataFrame)
+        self.assertEqual(list(df.columns), ['RIC', 'IssuerCommonName', 'ExchangeCode'])
+        self.assertEqual(len(df), 250)
+        self.assertEqual(df['RIC'].iloc[249], 'TEST249.RIC')
+        self.assertTrue(pd.isna(df['ExchangeCode'].iloc[5]))
+        self.assertEqual(df['ExchangeCode'].dtype, 'category')
+
+    def test_paginate_invalid_arguments(self):
+        """
+        Test that invalid pager arguments raise TypeError or ValueError
+        """
+        with self.assertRaises(TypeError):
+            self.app.rdp_paginate_search_explore(self.server.search_url, None, self.search_explore_payload)
+        with self.assertRaises(ValueError):
+            self.app.rdp_paginate_search_explore(self.server.search_url, 'access_token', self.search_explore_payload, page_size = 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import unittest
+import threading
+import sys
+import os
+from dotenv import dotenv_values
+config = dotenv_values("../.env.test")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_single_flight
+from tests.mock_rdp_server import MockRDPServer, load_fixture
+
+class TestRDPSingleFlight(unittest.TestCase):
+
+    # Start one slow local RDP stand-in server, so concurrent requests overlap
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockRDPServer(latency = 0.2).start()
+        cls.mock_esg_data = load_fixture('rdp_test_esg_fixture.json')
+        cls.mock_search_data = load_fixture('rdp_test_search_fixture.json')
+        cls.mock_valid_auth_json = load_fixture('rdp_test_auth_fixture.json')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.reset()
+
+    def run_concurrently(self, function, thread_count = 8):
+        results = [None] * thread_count
+        barrier = threading.Barrier(thread_count)
+
+        def run(index):
+            barrier.wait()
+            results[index] = function()
+
+        threads = [threading.Thread(target = run, args = (index,)) for index in range(thread_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def count_calls(self, path):
+        return len([call for call in self.server.calls if call[1].split('?')[0] == path])
+
+    def test_coalesce_esg(self):
+        """
+        Test that concurrent identical ESG requests share one HTTP request and every caller gets its own copy
+        """
+        with rdp_http_controller.RDPHTTPController() as controller:
+            results = self.run_concurrently(lambda: controller.rdp_request_esg(self.server.esg_url, 'access_token', 'TEST.RIC'))
+
+        self.assertEqual(self.count_calls(config['RDP_ESG_URL']), 1)
+        for result in results:
+            self.assertEqual(result, self.mock_esg_data)
+        self.assertEqual(len(set(id(result) for result in results)), len(results))
+        self.assertEqual(len(set(id(result['data']) for result in results)), len(results))
+
+    def test_coalesce_different_universe(self):
+        """
+        Test that concurrent ESG requests for different RICs are not coalesced
+        """
+        with rdp_http_controller.RDPHTTPController() as controller:
+            self.run_concurrently(lambda: controller.rdp_request_esg(self.server.esg_url, 'access_token', f'{threading.get_ident()}.RIC'), thread_count = 4)
+
+        self.assertEqual(self.count_calls(config['RDP_ESG_URL']), 4)
+
+    def test_coalesce_search_explore(self):
+        """
+        Test that concurrent identical Search Explore requests share one HTTP request
+        """
+        payload = {'View': 'Entities', 'Filter': 'RIC eq \'TEST.RIC\''}
+        with rdp_http_controller.RDPHTTPController() as controller:
+            results = self.run_concurrently(lambda: controller.rdp_request_search_explore(self.server.search_url, 'access_token', payload))
+
+        self.assertEqual(self.count_calls(config['RDP_SEARCH_EXPLORE_URL']), 1)
+        self.assertEqual(results, [self.mock_search_data] * len(results))
+
+    def test_coalesce_authentication(self):
+        """
+        Test that a refresh storm with the same refresh token becomes one authentication request
+        """
+        with rdp_http_controller.RDPHTTPController() as controller:
+            results = self.run_concurrently(lambda: controller.rdp_authentication(self.server.auth_url, config['RDP_USERNAME'], config['RDP_PASSWORD'],
+                                                                                  config['RDP_CLIENTID'], 'refresh_token'))
+
+        self.assertEqual(self.count_calls(config['RDP_AUTH_URL']), 1)
+        for access_token, refresh_token, expires_in in results:
+            self.assertEqual(access_token, self.mock_valid_auth_json['access_token'])
+            self.assertEqual(expires_in, int(self.mock_valid_auth_json['expires_in']))
+
+    def test_single_flight_disabled(self):
+        """
+        Test that single_flight = False sends every request
+        """
+        with rdp_http_controller.RDPHTTPController(single_flight = False) as controller:
+            self.run_concurrently(lambda: controller.rdp_request_esg(self.server.esg_url, 'access_token', 'TEST.RIC'), thread_count = 4)
+
+        self.assertEqual(self.count_calls(config['RDP_ESG_URL']), 4)
+
+    def test_single_flight_error(self):
+        """
+        Test that an exception of the shared call is raised to every waiting caller and the next call runs again
+        """
+        single_flight = rdp_single_flight.SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        errors = []
+
+        def failing_request():
+            started.set()
+            release.wait()
+            raise ValueError('request failure')
+
+        def call():
+            try:
+                single_flight.do('key', failing_request)
+            except ValueError as error:
+                errors.append(error)
+
+        leader = threading.Thread(target = call)
+        leader.start()
+        started.wait()
+        follower = threading.Thread(target = call)
+        follower.start()
+        while single_flight.shared_calls == 0:
+            follower.join(0.01)
+        release.set()
+        leader.join()
+        follower.join()
+
+        self.assertEqual(len(errors), 2)
+        self.assertIsNot(errors[0], errors[1])
+        leader_error, follower_error = sorted(errors, key = lambda error: error.__cause__ is not None)
+        self.assertIs(follower_error.__cause__, leader_error)
+        self.assertEqual(str(follower_error), 'request failure')
+        self.assertEqual(single_flight.do('key', lambda: 'value'), 'value')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import unittest
+from unittest import mock
+import responses
+import requests
+import json
+import time
+import sys
+import os
+from dotenv import dotenv_values
+config = dotenv_values("../.env.test")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_token_manager
+
+class TestRDPTokenManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.base_URL = config['RDP_BASE_URL']
+        cls.auth_endpoint = cls.base_URL + config['RDP_AUTH_URL']
+        cls.esg_endpoint = cls.base_URL + config['RDP_ESG_URL']
+        with open('./fixtures/rdp_test_auth_fixture.json', 'r') as auth_fixture_input:
+            cls.mock_valid_auth_json = json.loads(auth_fixture_input.read())
+        with open('./fixtures/rdp_test_token_expire_fixture.json', 'r') as auth_expire_fixture_input:
+            cls.mock_token_expire_json = json.loads(auth_expire_fixture_input.read())
+        with open('./fixtures/rdp_test_esg_fixture.json', 'r') as esg_fixture_input:
+            cls.mock_esg_data = json.loads(esg_fixture_input.read())
+
+    def setUp(self):
+        self.controller = rdp_http_controller.RDPHTTPController()
+        self.now = 1000.0
+
+    def tearDown(self):
+        self.controller.close()
+
+    def create_manager(self, refresh_margin = 60):
+        return rdp_token_manager.RDPTokenManager(self.controller, self.auth_endpoint, config['RDP_USERNAME'], config['RDP_PASSWORD'],
+                                                 config['RDP_CLIENTID'], refresh_margin = refresh_margin, clock = lambda: self.now)
+
+    def add_auth_response(self, access_token, expires_in = '600'):
+        auth_json = dict(self.mock_valid_auth_json, access_token = access_token, expires_in = expires_in)
+        responses.add(responses.Response(method= 'POST', url = self.auth_endpoint, json = auth_json, status= 200, content_type= 'application/json'))
+
+    @responses.activate
+    def test_get_access_token_cached(self):
+        """
+        Test that the manager logs in once and serves the cached token until it expires
+        """
+        self.add_auth_response('access_token_1')
+        self.add_auth_response('access_token_2')
+
+        with self.create_manager() as manager:
+            self.assertEqual(manager.get_access_token(), 'access_token_1')
+            self.assertEqual(manager.get_access_token(), 'access_token_1')
+            self.assertEqual(len(responses.calls), 1)
+            self.assertIn('grant_type=password', responses.calls[0].request.body)
+
+            # Token expired without a background refresh, the next call renews with the Refresh Grant
+            self.now += 600
+            self.assertEqual(manager.get_access_token(), 'access_token_2')
+            self.assertEqual(len(responses.calls), 2)
+            self.assertIn('grant_type=refresh_token', responses.calls[1].request.body)
+
+    @responses.activate
+    def test_background_refresh(self):
+        """
+        Test that the manager renews the token with the Refresh Grant before expires_in elapses
+        """
+        self.add_auth_response('access_token_1', expires_in = '1')
+        self.add_auth_response('access_token_2')
+
+        with self.create_manager(refresh_margin = 0.9) as manager:
+            deadline = time.monotonic() + 5
+            while manager.access_token != 'access_token_2' and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            self.assertEqual(manager.get_access_token(), 'access_token_2')
+            self.assertIn('grant_type=refresh_token', responses.calls[1].request.body)
+            self.assertIn(f'refresh_token={self.mock_valid_auth_json["refresh_token"]}', responses.calls[1].request.body)
+
+    @responses.activate
+    def test_refresh_delay_clamped(self):
+        """
+        Test that a refresh_margin larger than expires_in schedules the background refresh at half the token lifetime, not at once
+        """
+        self.add_auth_response('access_token_1', expires_in = '30')
+        self.add_auth_response('access_token_2', expires_in = '1')
+
+        with mock.patch.object(rdp_token_manager.threading, 'Timer') as timer:
+            with self.create_manager(refresh_margin = 60) as manager:
+                self.assertEqual(timer.call_args[0][0], 15)
+                manager._background_refresh()
+                self.assertEqual(timer.call_args[0][0], 1)
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_refresh_failure_fallback_password(self):
+        """
+        Test that the manager falls back to the Password Grant when the Refresh Grant fails
+        """
+        self.add_auth_response('access_token_1')
+        responses.add(responses.Response(method= 'POST', url = self.auth_endpoint, json = {'error': 'invalid_grant'}, status= 400, content_type= 'application/json'))
+        self.add_auth_response('access_token_3')
+
+        with self.create_manager() as manager:
+            self.now += 600
+            self.assertEqual(manager.get_access_token(), 'access_token_3')
+            self.assertIn('grant_type=refresh_token', responses.calls[1].request.body)
+            self.assertIn('grant_type=password', responses.calls[2].request.body)
+
+    @responses.activate
+    def test_request_esg_token_expire_renew(self):
+        """
+        Test that a token expired (HTTP 401) ESG response renews the token once and retries the request
+        """
+        self.add_auth_response('access_token_1')
+        self.add_auth_response('access_token_2')
+        responses.add(responses.Response(method= 'GET', url = self.esg_endpoint, json = self.mock_token_expire_json, status= 401, content_type= 'application/json'))
+        responses.add(responses.Response(method= 'GET', url = self.esg_endpoint, json = self.mock_esg_data, status= 200, content_type= 'application/json'))
+
+        with self.create_manager() as manager:
+            response = manager.request_esg(self.esg_endpoint, 'TEST.RIC')
+
+            self.assertIn('data', response)
+            esg_calls = [call for call in responses.calls if call.request.method == 'GET']
+            self.assertEqual(esg_calls[0].request.headers['Authorization'], 'Bearer access_token_1')
+            self.assertEqual(esg_calls[1].request.headers['Authorization'], 'Bearer access_token_2')
+            self.assertEqual(manager.get_access_token(), 'access_token_2')
+
+    @responses.activate
+    def test_request_esg_other_error(self):
+        """
+        Test that non-401 errors are raised without renewing the token
+        """
+        self.add_auth_response('access_token_1')
+        responses.add(responses.Response(method= 'GET', url = self.esg_endpoint, json = {'error': 'Bad Request'}, status= 400, content_type= 'application/json'))
+
+        with self.create_manager() as manager:
+            with self.assertRaises(requests.exceptions.HTTPError) as exception_context:
+                manager.request_esg(self.esg_endpoint, 'TEST.RIC')
+
+            self.assertEqual(exception_context.exception.response.status_code, 400)
+            self.assertEqual(len(responses.calls), 2)
+
+    def test_manager_none_empty_params(self):
+        """
+        Test that the manager can handle none/empty input
+        """
+        with self.assertRaises(TypeError) as exception_context:
+            rdp_token_manager.RDPTokenManager(self.controller, None, '', None, 'XXXXX')
+
+        self.assertEqual(str(exception_context.exception),'Received invalid (None or Empty) arguments')
+
+if __name__ == '__main__':
+    unittest.main()
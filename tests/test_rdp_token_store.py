@@ -0,0 +1,179 @@
+#|-----------------------------------------------------------------------------
+#|            This source code is provided under the MIT license             --
+#|  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+#|                See the project's LICENSE.md for details.                  --
+#|           Copyright LSEG 2025.       All rights reserved.                 --
+#|-----------------------------------------------------------------------------
+
+"""
+Example Code Disclaimer:
+ALL EXAMPLE CODE IS PROVIDED ON AN “AS IS” AND “AS AVAILABLE” BASIS FOR ILLUSTRATIVE PURPOSES ONLY. LSEG MAKES NO REPRESENTATIONS OR WARRANTIES OF ANY KIND, EXPRESS OR IMPLIED, AS TO THE OPERATION OF THE EXAMPLE CODE, OR THE INFORMATION, CONTENT, OR MATERIALS USED IN CONNECTION WITH THE EXAMPLE CODE. YOU EXPRESSLY AGREE THAT YOUR USE OF THE EXAMPLE CODE IS AT YOUR SOLE RISK.
+"""
+
+import unittest
+import responses
+import multiprocessing
+import tempfile
+import json
+import sys
+import os
+from dotenv import dotenv_values
+config = dotenv_values("../.env.test")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from rdp_controller import rdp_http_controller
+from rdp_controller import rdp_token_manager
+from rdp_controller import rdp_token_store
+from tests.mock_rdp_server import MockRDPServer
+
+# Start a token manager in a separate process (a short-lived batch worker) and report its Access Token
+def _start_worker(auth_url, token_path, key, token_queue):
+    with rdp_http_controller.RDPHTTPController() as controller:
+        token_store = rdp_token_store.TokenStore(token_path, key)
+        with rdp_token_manager.RDPTokenManager(controller, auth_url, config['RDP_USERNAME'], config['RDP_PASSWORD'], config['RDP_CLIENTID'],
+                                               token_store = token_store) as manager:
+            token_queue.put(manager.get_access_token())
+
+@unittest.skipIf(rdp_token_store.Fernet is None, 'cryptography is not installed')
+class TestRDPTokenStore(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.base_URL = config['RDP_BASE_URL']
+        cls.auth_endpoint = cls.base_URL + config['RDP_AUTH_URL']
+        cls.esg_endpoint = cls.base_URL + config['RDP_ESG_URL']
+        with open('./fixtures/rdp_test_auth_fixture.json', 'r') as auth_fixture_input:
+            cls.mock_valid_auth_json = json.loads(auth_fixture_input.read())
+        with open('./fixtures/rdp_test_token_expire_fixture.json', 'r') as auth_expire_fixture_input:
+            cls.mock_token_expire_json = json.loads(auth_expire_fixture_input.read())
+        with open('./fixtures/rdp_test_esg_fixture.json', 'r') as esg_fixture_input:
+            cls.mock_esg_data = json.loads(esg_fixture_input.read())
+
+    def setUp(self):
+        self.controller = rdp_http_controller.RDPHTTPController()
+        self.now = 1000.0
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.token_path = os.path.join(self.temp_dir.name, 'tokens')
+        self.key = rdp_token_store.TokenStore.generate_key()
+
+    def tearDown(self):
+        self.controller.close()
+        self.temp_dir.cleanup()
+
+    def create_store(self, key = None):
+        return rdp_token_store.TokenStore(self.token_path, key or self.key, clock = lambda: self.now)
+
+    # A new manager with its own token store object stands for a new process
+    def create_manager(self):
+        return rdp_token_manager.RDPTokenManager(self.controller, self.auth_endpoint, config['RDP_USERNAME'], config['RDP_PASSWORD'],
+                                                 config['RDP_CLIENTID'], clock = lambda: self.now, token_store = self.create_store())
+
+    def add_auth_response(self, access_token, expires_in = '600'):
+        auth_json = dict(self.mock_valid_auth_json, access_token = access_token, expires_in = expires_in)
+        responses.add(responses.Response(method= 'POST', url = self.auth_endpoint, json = auth_json, status= 200, content_type= 'application/json'))
+
+    def test_store_encrypted(self):
+        """
+        Test that the tokens are stored encrypted per account and that another key reads an empty store
+        """
+        token_store = self.create_store()
+        token_store.save(self.auth_endpoint, 'user1', 'client1', 'access_token_1', 'refresh_token_1', 1600.0)
+        token_store.save(self.auth_endpoint, 'user2', 'client1', 'access_token_2', 'refresh_token_2', 1600.0)
+
+        self.assertEqual(self.create_store().load(self.auth_endpoint, 'user1', 'client1'),
+                         {'access_token': 'access_token_1', 'refresh_token': 'refresh_token_1', 'expires_at': 1600.0})
+        with open(self.token_path, 'rb') as token_file:
+            content = token_file.read()
+        self.assertNotIn(b'access_token_1', content)
+        self.assertNotIn(b'user1', content)
+        self.assertEqual(oct(os.stat(self.token_path).st_mode & 0o777), oct(0o600))
+
+        with self.assertLogs('rdp_controller.rdp_token_store', level = 'WARNING'):
+            self.assertEqual(self.create_store(rdp_token_store.TokenStore.generate_key()).load(self.auth_endpoint, 'user1', 'client1'), {})
+
+    def test_store_invalidate(self):
+        """
+        Test that invalidate() forgets the Access Token only when it is still the stored one, and keeps the Refresh Token
+        """
+        token_store = self.create_store()
+        token_store.save(self.auth_endpoint, 'user1', 'client1', 'access_token_2', 'refresh_token_2', 1600.0)
+
+        token_store.invalidate(self.auth_endpoint, 'user1', 'client1', 'access_token_1')
+        self.assertEqual(token_store.load(self.auth_endpoint, 'user1', 'client1')['access_token'], 'access_token_2')
+
+        token_store.invalidate(self.auth_endpoint, 'user1', 'client1', 'access_token_2')
+        self.assertEqual(token_store.load(self.auth_endpoint, 'user1', 'client1'), {'refresh_token': 'refresh_token_2'})
+
+        token_store.clear(self.auth_endpoint, 'user1', 'client1')
+        self.assertEqual(token_store.load(self.auth_endpoint, 'user1', 'client1'), {})
+
+    @responses.activate
+    def test_manager_reuse_stored_token(self):
+        """
+        Test that a new manager reuses the stored Access Token without logging in
+        """
+        self.add_auth_response('access_token_1')
+
+        with self.create_manager() as manager:
+            self.assertEqual(manager.get_access_token(), 'access_token_1')
+        self.now += 300
+        with self.create_manager() as manager:
+            self.assertEqual(manager.get_access_token(), 'access_token_1')
+            self.assertEqual(manager.expires_at, self.now + 300)
+
+        self.assertEqual(len(responses.calls), 1)
+        self.assertIn('grant_type=password', responses.calls[0].request.body)
+
+    @responses.activate
+    def test_manager_refresh_stored_token(self):
+        """
+        Test that a new manager renews an expired stored token with the stored Refresh Token and stores the new tokens
+        """
+        self.add_auth_response('access_token_1')
+        self.add_auth_response('access_token_2')
+
+        with self.create_manager() as manager:
+            manager.get_access_token()
+        self.now += 600
+        with self.create_manager() as manager:
+            self.assertEqual(manager.get_access_token(), 'access_token_2')
+
+        self.assertIn('grant_type=refresh_token', responses.calls[1].request.body)
+        self.assertIn(f'refresh_token={self.mock_valid_auth_json["refresh_token"]}', responses.calls[1].request.body)
+        self.assertEqual(self.create_store().load(self.auth_endpoint, config['RDP_USERNAME'], config['RDP_CLIENTID'])['access_token'], 'access_token_2')
+
+    @responses.activate
+    def test_manager_invalidate_on_401(self):
+        """
+        Test that a token rejected with HTTP 401 is replaced in the store, so the next managers do not reuse it
+        """
+        self.add_auth_response('access_token_1')
+        self.add_auth_response('access_token_2')
+        responses.add(responses.Response(method= 'GET', url = self.esg_endpoint, json = self.mock_token_expire_json, status= 401, content_type= 'application/json'))
+        responses.add(responses.Response(method= 'GET', url = self.esg_endpoint, json = self.mock_esg_data, status= 200, content_type= 'application/json'))
+
+        with self.create_manager() as manager:
+            self.assertIn('data', manager.request_esg(self.esg_endpoint, 'TEST.RIC'))
+        with self.create_manager() as manager:
+            self.assertEqual(manager.get_access_token(), 'access_token_2')
+
+        self.assertEqual(len([call for call in responses.calls if call.request.method == 'POST']), 2)
+
+    def test_concurrent_processes_login_once(self):
+        """
+        Test that concurrently starting processes sharing the token store log in only once
+        """
+        token_queue = multiprocessing.Queue()
+        with MockRDPServer(token_lifetime = 600, latency = 0.1) as server:
+            workers = [multiprocessing.Process(target = _start_worker, args = (server.auth_url, self.token_path, self.key, token_queue)) for _ in range(4)]
+            for worker in workers:
+                worker.start()
+            tokens = [token_queue.get(timeout = 30) for _ in workers]
+            for worker in workers:
+                worker.join()
+
+            self.assertEqual(tokens, ['mock_access_token_1'] * 4)
+            self.assertEqual(len([call for call in server.calls if call[0] == 'POST']), 1)
+
+if __name__ == '__main__':
+    unittest.main()